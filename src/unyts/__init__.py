@@ -8,35 +8,48 @@ Created on Sat Oct 24 18:24:20 2020
 
 __version__ = '0.9.15'
 __release__ = 20250615
-__all__ = ['units', 'convert', 'convertible', 'Unit', 'is_Unit', 'valid_unit',
+__all__ = ['units', 'convert', 'convertible', 'converter_for', 'Converter', 'convert_many', 'Unit', 'is_Unit', 'valid_unit',
            'set_unit', 'set_conversion', 'set_density', 'get_density',
-           'save', 'start_gui', 'set_fvf', 'set_algorithm', 'set_parallel', 'set_timeout',
-           'verbose']
+           'save', 'start_gui', 'set_fvf', 'set_algorithm', 'set_backend', 'set_parallel', 'set_timeout',
+           'verbose', 'canonical_roots', 'prefix_parsing', 'set_memory_limits', 'get_memory_stats',
+           'set_dtype_policy', 'get_dtype_policy', 'set_shared_cache', 'get_shared_cache']
 
-from .parameters import unyts_parameters_, print_path, reload, raise_error, cache, set_density, get_density,\
-    recursion_limit, verbose, set_algorithm, get_algorithm, set_parallel, get_parallel, set_timeout, get_timeout,\
-    set_logging_level
-from .database import network_to_frame, save_memory, load_memory, clean_memory, set_fvf, get_fvf
+from .parameters import unyts_parameters_, print_path, reload, raise_error, cache, canonical_roots, prefix_parsing,\
+    set_density, get_density, recursion_limit, verbose, set_algorithm, get_algorithm, set_backend, get_backend,\
+    set_parallel, get_parallel, set_timeout, get_timeout, set_logging_level, set_memory_limits, get_memory_stats,\
+    set_dtype_policy, get_dtype_policy, set_shared_cache, get_shared_cache
+from .database import network_to_frame, save_memory, load_memory, clean_memory, set_fvf, get_fvf, load_units
 from .units.define import units
 from .converter import convert, convertible
+from .compiled import converter_for, Converter, convert_many
 from .Empty import Empty
 from .unit_class import Unit, is_Unit, valid_unit
 from .units.custom import set_unit, set_conversion
 from .helpers.logger import logger
-try:
-    from .gui import start_gui
-except:
-    def start_gui():
-        logger.error("The GUI is not available in this system.")
 
 
+def start_gui():
+    """
+    Starts the graphical interface, importing tkinter and the GUI the first time it is started.
+    """
+    load_units()
+    try:
+        from .gui import start_gui as _start_gui
+    except ImportError:
+        logger.error("The GUI is not available in this system.")
+        return
+    _start_gui()
 
-if unyts_parameters_.show_version_:
-    print(f"loaded unyts version {__version__}")
-    unyts_parameters_.show_version_ = False
-    unyts_parameters_.save_params()
 
-from .unitary import *
+def __getattr__(name: str):
+    # the units constants defined in `unitary`, like `meter` or `second`, are made the first time one of them is used
+    if name.startswith('_') or name == 'unitary':
+        raise AttributeError(f"module 'unyts' has no attribute '{name}'")
+    from importlib import import_module
+    unitary = import_module('.unitary', __name__)
+    if not hasattr(unitary, name):
+        raise AttributeError(f"module 'unyts' has no attribute '{name}'")
+    return getattr(unitary, name)
 
 
 def save(path=None) -> None:
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:21:05 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+__version__ = '0.1.0'
+__release__ = 20261018
+__all__ = ['CompactUDigraph']
+
+from collections import deque
+
+try:
+    import numpy as np
+    _numpy_ = True
+except ModuleNotFoundError:
+    _numpy_ = False
+
+
+class CompactUDigraph(object):
+    """
+    A compact and read-only representation of a UDigraph network, where every unit name is interned to an int32 id
+    and the adjacency is stored in CSR (compressed sparse row) arrays:
+      - `offsets[i]:offsets[i + 1]` is the slice of `targets` and `edge_ids` corresponding to the node with id `i`.
+      - `targets` are the ids of the children nodes.
+      - `edge_ids` are the ids of the edges, to index the `sources` and `conversions` tables.
+      - `parent_offsets` and `parent_sources` are the same CSR arrays for the reversed edges, to get the parents.
+    The `children_of` method returns the list of nodes with direct relation to the key node, as UDigraph does,
+    so the search algorithms can run on any of both representations, while `shortest_path` and `descendants` traverse
+    the arrays by id, only making the nodes of the result.
+    The synonyms collapsed in the network share the id of the node representing them.
+    """
+    __slots__ = ('ids', 'names', 'nodes', 'offsets', 'targets', 'edge_ids', 'sources', 'conversions',
+                 'parent_offsets', 'parent_sources', '_aliases', '_reachability', '_descendants', 'version')
+
+    def __init__(self, network) -> None:
+        if not _numpy_:
+            raise ModuleNotFoundError("Required package `numpy` not found.\nTo install NumPy: `pip install numpy`")
+        self.version = network.version
+        self.names = network.list_nodes()
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.nodes = [network.get_node(name) for name in self.names]
+        self._aliases = network.aliases()
+        offsets, targets, sources, conversions = [0], [], [], []
+        for i, node in enumerate(self.nodes):
+            children, children_conversions = network.edges[node]
+            # the children removed from the nodes of the network, but not from its edges, are left out
+            kept = [(self.ids[self._aliases.get(child.get_name(), child.get_name())], conversion)
+                    for child, conversion in zip(children, children_conversions)
+                    if self._aliases.get(child.get_name(), child.get_name()) in self.ids]
+            targets += [child for child, _ in kept]
+            sources += [i] * len(kept)
+            conversions += [conversion for _, conversion in kept]
+            offsets.append(len(targets))
+        self.offsets = np.array(offsets, dtype=np.int32)
+        self.targets = np.array(targets, dtype=np.int32)
+        self.edge_ids = np.arange(len(targets), dtype=np.int32)
+        self.sources = np.array(sources, dtype=np.int32)
+        self.conversions = conversions
+        # transposed CSR: the sources of the edges sorted by target
+        order = np.argsort(self.targets, kind='stable')
+        self.parent_sources = self.sources[order]
+        self.parent_offsets = np.zeros(len(self.names) + 1, dtype=np.int32)
+        np.cumsum(np.bincount(self.targets, minlength=len(self.names)), out=self.parent_offsets[1:])
+        self.ids.update({alias: self.ids[name] for alias, name in self._aliases.items()})
+        self._reachability = None
+        self._descendants = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _id(self, node) -> int:
+        return self.ids[node if type(node) is str else node.get_name()]
+
+    def children_ids(self, node_id: int):
+        return self.targets[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def children_of(self, node):
+        return [self.nodes[child] for child in self.children_ids(self._id(node)).tolist()]
+
+    def parents_ids(self, node_id: int):
+        return self.parent_sources[self.parent_offsets[node_id]:self.parent_offsets[node_id + 1]]
+
+    def parents_of(self, node):
+        return [self.nodes[parent] for parent in self.parents_ids(self._id(node)).tolist()]
+
+    def has_node(self, node):
+        if type(node) is str:
+            return node in self.ids
+        else:
+            return node.get_name() in self.ids and self.nodes[self.ids[node.get_name()]] is node
+
+    def get_node(self, name):
+        try:
+            return self.nodes[self.ids[name]]
+        except KeyError:
+            raise NameError(name)
+
+    def list_nodes(self):
+        return list(self.names)
+
+    def aliases(self) -> dict:
+        return dict(self._aliases)
+
+    def with_synonyms(self, names: set) -> set:
+        return names.union(alias for alias, name in self._aliases.items() if name in names)
+
+    def _edge_id(self, src, dest) -> int:
+        src, dest = self._id(src), self._id(dest)
+        start = self.offsets[src]
+        position = np.flatnonzero(self.targets[start:self.offsets[src + 1]] == dest)
+        if len(position) == 0:
+            raise ValueError(f"no edge from '{self.names[src]}' to '{self.names[dest]}'")
+        return int(self.edge_ids[start + position[0]])
+
+    def conversion(self, src, dest):
+        return self.conversions[self._edge_id(src, dest)]
+
+    def convert(self, value, src, dest):
+        return self.conversion(src, dest)(value)
+
+    def descendants(self, name: str, generations: int) -> set:
+        """
+        Returns the set of names of the nodes that can be reached from the node `name` in up to `generations` steps,
+        and their synonyms. Each generation only expands the children of the nodes reached in the previous generation.
+        """
+        visited = np.zeros(len(self.names), dtype=bool)
+        frontier = np.array([self.ids[name]], dtype=np.int32)
+        visited[frontier] = True
+        for g in range(generations):
+            starts, ends = self.offsets[frontier], self.offsets[frontier + 1]
+            lengths = ends - starts
+            if lengths.sum() == 0:
+                break
+            # positions in `targets` of all the children of the frontier
+            positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+            frontier = np.unique(self.targets[positions])
+            frontier = frontier[~visited[frontier]]
+            if len(frontier) == 0:
+                break
+            visited[frontier] = True
+        return self.with_synonyms({name}.union(self.names[i] for i in np.flatnonzero(visited).tolist()))
+
+    def shortest_path(self, start, end, is_intime=None, stats: dict = None):
+        """
+        Returns the list of ids of the first shortest path from `start` to `end`, taking the children in the order
+        of the edges as BFS does, or None if there is no path.
+        The traversal only keeps the id of the parent of each node reached, it stops returning False if `is_intime()`
+        turns False. If `stats` is provided, the number of expanded nodes is stored in its 'expanded' key.
+        """
+        start, end = self._id(start), self._id(end)
+        parents = [-1] * len(self.names)
+        parents[start] = start
+        frontier, offsets, targets = deque([start]), self.offsets.tolist(), self.targets
+        expanded = 0
+        while len(frontier) > 0 and parents[end] == -1:
+            if is_intime is not None and not is_intime():
+                return False
+            node = frontier.popleft()
+            expanded += 1
+            for child in targets[offsets[node]:offsets[node + 1]].tolist():
+                if parents[child] == -1:
+                    parents[child] = node
+                    frontier.append(child)
+        if stats is not None:
+            stats['expanded'] = expanded
+        if parents[end] == -1:
+            return None
+        path = [end]
+        while path[-1] != start:
+            path.append(parents[path[-1]])
+        return path[::-1]
+
+    def reachability(self):
+        """
+        Returns the ReachabilityIndex of this network, computed the first time it is requested.
+        """
+        if self._reachability is None:
+            from .reachability import ReachabilityIndex
+            self._reachability = ReachabilityIndex(self)
+        return self._reachability
+
+    def descendants_memory(self) -> dict:
+        """
+        Returns the dictionary where `_get_descendants` memorizes the descendants found in this network.
+        """
+        return self._descendants
+
+    def nbytes(self) -> int:
+        """
+        Returns the number of bytes used by the adjacency arrays.
+        """
+        return self.offsets.nbytes + self.targets.nbytes + self.edge_ids.nbytes + self.sources.nbytes + \
+            self.parent_offsets.nbytes + self.parent_sources.nbytes
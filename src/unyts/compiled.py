@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:40:12 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+__version__ = '0.1.0'
+__release__ = 20261019
+__all__ = ['Converter', 'converter_for', 'convert_many']
+
+from .converter import convert, _probe_factor, _keep_dtype
+from .parameters import unyts_parameters_
+from .Empty import Empty
+from .errors import NoConversionFoundError, SearchTimeoutError
+from .units.def_conversions import equality
+
+try:
+    import numpy as np
+    _numpy_ = True
+except ModuleNotFoundError:
+    _numpy_ = False
+
+
+def _is_importable(function) -> bool:
+    # module level functions are pickled by reference, closures made while solving the conversion are not
+    return hasattr(function, '__module__') and '<locals>' not in getattr(function, '__qualname__', '<locals>')
+
+
+class Converter(object):
+    """
+    A conversion from `from_unit` to `to_unit` solved once, to be applied many times.
+    If the conversion is affine the whole path is folded to the `factor` (scale, offset), and calling the Converter
+    only costs `value * scale + offset`, otherwise it calls the `function` resolved for the path.
+    The Converters are picklable, the folded ones without needing the units network to be unpickled.
+    The `dtype_policy` and `integer_dtype` are the ones set when the Converter is made, see `set_dtype_policy`.
+    """
+    __slots__ = ('from_unit', 'to_unit', 'scale', 'offset', 'function', 'path', 'dtype_policy', 'integer_dtype')
+
+    def __init__(self, from_unit: str, to_unit: str, scale=None, offset=0, function=None, path: str = '',
+                 dtype_policy: str = None, integer_dtype: str = None) -> None:
+        self.from_unit, self.to_unit, self.path = from_unit, to_unit, path
+        self.scale, self.offset, self.function = scale, offset, function
+        self.dtype_policy = unyts_parameters_.dtype_policy_ if dtype_policy is None else dtype_policy
+        self.integer_dtype = integer_dtype if self.dtype_policy == 'preserve' else None
+
+    @property
+    def factor(self):
+        """
+        The folded (scale, offset) of the conversion, or None if it is not affine.
+        """
+        return None if self.scale is None else (self.scale, self.offset)
+
+    def __call__(self, value):
+        if _numpy_ and type(value) in (list, tuple):
+            value = np.array(value)
+        if self.integer_dtype is not None and hasattr(value, 'dtype') and value.dtype.kind in 'iu':
+            value = value.astype(self.integer_dtype)
+        if self.function is not None:
+            return _keep_dtype(self.function(value), value, self.dtype_policy)
+        # the folded factors are Python numbers, the floating arrays keep their dtype
+        return value * self.scale if self.offset == 0 else value * self.scale + self.offset
+
+    def __reduce__(self):
+        if self.function is None or _is_importable(self.function):
+            return Converter, (self.from_unit, self.to_unit, self.scale, self.offset, self.function, self.path,
+                               self.dtype_policy, self.integer_dtype)
+        # a conversion that can not be folded is solved again when unpickled
+        return converter_for, (self.from_unit, self.to_unit, None, self.dtype_policy)
+
+    def __repr__(self) -> str:
+        return f"Converter('{self.from_unit}', '{self.to_unit}')"
+
+    def __str__(self) -> str:
+        return f"converter from '{self.from_unit}' to '{self.to_unit}':\n {self.path}"
+
+
+def converter_for(from_unit: str, to_unit: str, use_cache: bool = None, dtype_policy: str = None):
+    """
+    Solves the conversion from `from_unit` to `to_unit` and returns a Converter callable applying it, for repeated
+    conversions between the same units without cleaning the units and searching the memory or network on every call.
+    The Converter keeps the density and the FVF set when it is made, so the volume to weight and the reservoir to
+    standard volume conversions are not changed by a later `set_density` or `set_fvf`, make a new Converter instead.
+
+    Parameters
+    ----------
+    from_unit : str or Unit
+        the units of the values to be converted.
+    to_unit : str or Unit
+        the units to convert the values.
+    use_cache: bool
+        Set to False to ignore cached searches, and repeat the search.
+    dtype_policy : str, optional
+        'preserve' or 'numpy', see `set_dtype_policy`. The default is the policy set in the parameters.
+
+    Returns
+    -------
+    Converter
+        or None if the conversion was not found, or Empty if the search exceeded the timeout, when not raising errors.
+    """
+    conversion = convert(None, from_unit, to_unit, use_cache=use_cache)
+    if conversion is None or conversion is Empty:
+        return conversion
+    from_unit = from_unit.get_unit() if hasattr(from_unit, 'get_unit') else from_unit
+    to_unit = to_unit.get_unit() if hasattr(to_unit, 'get_unit') else to_unit
+    path, integer_dtype = unyts_parameters_.last_path_str, unyts_parameters_.integer_dtype_
+    if conversion is equality:
+        return Converter(from_unit, to_unit, function=equality, path=path, dtype_policy=dtype_policy,
+                         integer_dtype=integer_dtype)
+    factor = _probe_factor(conversion)
+    if factor is None:
+        return Converter(from_unit, to_unit, function=conversion, path=path, dtype_policy=dtype_policy,
+                         integer_dtype=integer_dtype)
+    return Converter(from_unit, to_unit, *factor, path=path, dtype_policy=dtype_policy, integer_dtype=integer_dtype)
+
+
+def _factorize(units, size: int):
+    """
+    Returns the code of the unit of every row and the list of distinct units, broadcasting a single unit to all the rows.
+    """
+    if isinstance(units, str) or units is None or not hasattr(units, '__iter__'):
+        return np.zeros(size, dtype=np.intp), [units]
+    units = np.asarray(units, dtype=object).reshape(-1)
+    if len(units) != size:
+        raise ValueError(f"the units must be a single unit or one unit for each of the {size} values, "
+                         f"not {len(units)}.")
+    _, first, codes = np.unique(units.astype(str), return_index=True, return_inverse=True)
+    return codes.reshape(-1), units[first].tolist()
+
+
+def convert_many(values, from_units, to_units, return_status: bool = False, use_cache: bool = None,
+                 dtype_policy: str = None):
+    """
+    Converts each of the `values` from the corresponding unit in `from_units` to the one in `to_units`.
+    The distinct pairs of units are solved once, and the conversion of each pair is applied to all its values together.
+
+    Parameters
+    ----------
+    values : number, sequence, NumPy.array or Series
+        the values to be converted. A single number is converted as an array of one value. The units are given along
+        the first axis, so all the values in each row of a 2-D array, or in each item of the first axis of an N-D
+        array, are converted between the units given for that row.
+    from_units : str or sequence of str
+        the units of each of the values, or a single unit for all of them.
+    to_units : str or sequence of str
+        the units to convert each of the values, or a single unit for all of them.
+    return_status : bool, optional
+        Set to True to also return an array of booleans, one for each item of the first axis, True for the values
+        converted and False for the values which pair of units could not be converted, that are returned as NaN
+        instead of raising an error.
+    use_cache: bool
+        Set to False to ignore cached searches, and repeat the search.
+    dtype_policy : str, optional
+        'preserve' or 'numpy', see `set_dtype_policy`. The default is the policy set in the parameters.
+
+    Returns
+    -------
+    converted_values : NumPy.array
+        with the shape of `values`, or (converted_values, status) if `return_status` is True.
+    """
+    if not _numpy_:
+        raise ModuleNotFoundError("Required package `numpy` not found.\nTo install NumPy: `pip install numpy`")
+    values = np.asarray(values)
+    if values.ndim == 0:  # a single value
+        values = values.reshape(-1)
+    # the units are given for the rows, the first axis of the values
+    from_codes, from_units = _factorize(from_units, len(values))
+    to_codes, to_units = _factorize(to_units, len(values))
+    pairs, pair_codes = np.unique(from_codes * len(to_units) + to_codes, return_inverse=True)
+    pair_codes = pair_codes.reshape(-1)
+    # the rows of each pair of units, as slices of the rows sorted by pair
+    rows = np.split(np.argsort(pair_codes, kind='stable'), np.cumsum(np.bincount(pair_codes))[:-1])
+
+    dtype_policy = unyts_parameters_.dtype_policy_ if dtype_policy is None else dtype_policy
+    integer_dtype = unyts_parameters_.integer_dtype_ if dtype_policy == 'preserve' else None
+    converted = np.full(values.shape, np.nan, dtype=values.dtype if values.dtype.kind in 'fcO' else
+                        float if integer_dtype is None else integer_dtype)
+    status = np.zeros(len(values), dtype=bool)
+    for pair, pair_rows in zip(pairs.tolist(), rows):
+        try:
+            converter = converter_for(from_units[pair // len(to_units)], to_units[pair % len(to_units)],
+                                      use_cache=use_cache, dtype_policy=dtype_policy)
+        except (NoConversionFoundError, SearchTimeoutError):
+            if not return_status:
+                raise
+            converter = None
+        if converter is None or converter is Empty:
+            continue
+        converted[pair_rows] = converter(values[pair_rows])
+        status[pair_rows] = True
+    return (converted, status) if return_status else converted
@@ -10,15 +10,16 @@ __version__ = '0.8.8'
 __release__ = 20250504
 __all__ = ['convert', 'convertible']
 
-from .database import units_network
-from .dictionaries import dictionary, temperatureRatioConversions, uncertain_names
+from .database import units_network, load_units, resolve_prefix
+from .dictionaries import temperatureRatioConversions, uncertain_names, _kind_units
 from .Empty import Empty, str_Empty
-from .searches import BFS, lean_BFS, DFS, hybrid_BFS, print_path
+from .searches import BFS, lean_BFS, DFS, hybrid_BFS, bidirectional_BFS, print_path
+from .session import in_session, current_session, conversion_session, new_session
 from .errors import NoConversionFoundError, SearchTimeoutError
 from .parameters import unyts_parameters_, _get_density
 from .helpers.unit_string_tools import split_unit as _split_unit, reduce_parentheses as _reduce_parentheses
 from .units.def_conversions import equality, percentage__to__fraction, fraction__to__percentage, inverse
-from functools import reduce
+from functools import reduce, lru_cache
 from typing import Union
 from sys import getrecursionlimit
 from .helpers.logger import logger
@@ -32,24 +33,24 @@ try:
 except ModuleNotFoundError:
     _numpy_ = False
     logger.warning("Missing NumPy package, operations with `list` of values will fail.")
-try:
-    from pandas import Series, DataFrame
-
-    _pandas_ = True
-except ModuleNotFoundError:
-    _pandas_ = False
+# pandas is imported by whoever makes a Series or DataFrame, not by unyts
+from .helpers.pandas_types import Series, DataFrame, _pandas_
 
 if _numpy_ and _pandas_:
     _numeric = (int, float, complex, ndarray, Series, DataFrame)
+    _containers = (ndarray, Series, DataFrame)
     numeric = Union[int, float, complex, ndarray, Series, DataFrame]
 elif _numpy_:
     _numeric = (int, float, complex, ndarray)
+    _containers = (ndarray,)
     numeric = Union[int, float, complex, ndarray]
 elif _pandas_:
     _numeric = (int, float, complex, Series, DataFrame)
+    _containers = (Series, DataFrame)
     numeric = Union[int, float, complex, Series, DataFrame]
 else:
     _numeric = (int, float, complex)
+    _containers = ()
     numeric = Union[int, float, complex]
 
 
@@ -148,13 +149,99 @@ def _function_conversion(conversion_path):
     conversion_function: function
         to apply the conversion path
     """
-    big_conversion = [units_network.conversion(conversion_path[i], conversion_path[i + 1])
-                  for i in range(len(conversion_path) - 1)]
+    big_conversion = _fold_conversions(conversion_path)
+    if len(big_conversion) == 1:
+        return big_conversion[0]
     def _looped_conversion(x):
         return _conversion_loop(x, big_conversion[:])
     return _looped_conversion
 
 
+def _fold_conversions(conversion_path) -> list:
+    """
+    Helper function to list the conversions along the conversion_path, collapsing every sequence of consecutive affine
+    conversions (`x * scale + offset`) into a single affine function. Conversions that are not known to be affine are
+    kept as they are.
+
+    Parameters
+    ----------
+    conversion_path: list
+        sequence of the nodes to go through
+    Returns
+    -------
+    conversion_list: list
+        the functions to be applied in sequence
+    """
+    conversion_list, affine_sequence = [], []
+    for i in range(len(conversion_path) - 1):
+        conversion = units_network.conversion(conversion_path[i], conversion_path[i + 1])
+        factor = units_network.factor(conversion_path[i], conversion_path[i + 1])
+        if factor is None:
+            if len(affine_sequence) > 0:
+                conversion_list.append(_affine_function(affine_sequence))
+                affine_sequence = []
+            conversion_list.append(conversion)
+        else:
+            affine_sequence.append((conversion, factor))
+    if len(affine_sequence) > 0:
+        conversion_list.append(_affine_function(affine_sequence))
+    return conversion_list
+
+
+def _affine_function(affine_sequence: list):
+    """
+    Helper function to make a single function equivalent to a sequence of affine conversions.
+
+    Parameters
+    ----------
+    affine_sequence: list
+        list of (conversion, (scale, offset)) tuples
+
+    Returns
+    -------
+    function
+        applying `x * scale + offset` with the scale and offset of the whole sequence
+    """
+    conversions = [conversion for conversion, factor in affine_sequence]
+    if all(factor[1] == 0 for conversion, factor in affine_sequence):
+        # evaluating the sequence on 1 keeps the same rounding as applying the conversions one by one
+        scale, offset = _conversion_loop(1, conversions), 0
+    else:
+        scale, offset = reduce(lambda x, y: x * y, [factor[0] for conversion, factor in affine_sequence]), \
+            _conversion_loop(0, conversions)
+
+    return _affine_conversion(scale, offset)
+
+
+def _affine_conversion(scale, offset):
+    """
+    Helper function to make a function applying `x * scale + offset`.
+
+    Parameters
+    ----------
+    scale: int or float
+    offset: int or float
+
+    Returns
+    -------
+    function
+    """
+    if scale == 1 and offset == 0:
+        return equality
+    elif offset == 0:
+        def _scale(x):
+            return x * scale
+        return _scale
+    else:
+        def _scale_and_offset(x):
+            x = x * scale
+            if _numpy_ and type(x) is ndarray and x.dtype.kind in 'fc':
+                x += offset  # `x` is already a new array, add the offset without allocating another one
+                return x
+            return x + offset
+        return _scale_and_offset
+
+
 def _conversion_loop(x, conversion_list):
     """
     Helper function to apply conversion functions in sequence.
@@ -193,8 +280,9 @@ def _get_pair_child(unit: str):
     # get the Unit node if the name received is string
     unit = units_network.get_node(unit) if type(unit) is str else unit
 
-    # get a pair of units children
-    pair_child = list(filter(_operation_filter, [u.get_name() for u in units_network.children_of(unit)]))
+    # get a pair of units children, the synonyms of the unit were its children before being collapsed into it
+    pair_child = list(filter(_operation_filter, sorted(units_network.with_synonyms(
+        {unit.get_name()}.union(u.get_name() for u in units_network.children_of(unit))))))
 
     # if a pair of units child is found, return the one with the shorter name
     if len(pair_child) > 0:
@@ -202,8 +290,8 @@ def _get_pair_child(unit: str):
     # if no children found at this level, look for children in next level
     else:
         for child in units_network.children_of(unit):
-            pair_grandchild = list(
-                filter(_operation_filter, [u.get_name() for u in units_network.children_of(child)]))
+            pair_grandchild = list(filter(_operation_filter, sorted(units_network.with_synonyms(
+                {u.get_name() for u in units_network.children_of(child)}))))
             if len(pair_grandchild) > 0:
                 pair_child = sorted(pair_grandchild, key=len)[0]
                 break
@@ -214,7 +302,7 @@ def _get_pair_child(unit: str):
 
 def _get_recursion_limit(recursion=None):
     if recursion is None:
-        recursion = min(getrecursionlimit() - 15, unyts_parameters_.max_recursion_)
+        recursion = min(getrecursionlimit() - 15, current_session().max_recursion)
     elif recursion > 1:
         recursion = min(getrecursionlimit() - 15, recursion) - 1
     elif recursion <= 0:
@@ -256,11 +344,17 @@ def _get_conversion(value, from_unit, to_unit, recursion=None, use_cache:bool=No
 
     # check if already solved and memorized
     use_cache = unyts_parameters_.cache_ if use_cache is None else use_cache
-    if use_cache and (from_unit, to_unit) in units_network.memory:
-        conversion_function, conversion_path = units_network.memory[(from_unit, to_unit)]
+    memorized = units_network.memory.get((from_unit, to_unit)) if use_cache else None
+    if memorized is not None:
+        conversion_function, conversion_path = memorized
         return (conversion_function, conversion_path) if (conversion_function is None or value is None) \
             else (conversion_function(value), conversion_path)
 
+    # with prefix parsing, the prefixed units are made the first time they are converted
+    if units_network.prefixes:
+        resolve_prefix(from_unit)
+        resolve_prefix(to_unit)
+
     ## specific cases for quick conversions ##
     # no conversion required if 'from' and 'to' units are the same units
     if from_unit == to_unit:
@@ -270,7 +364,7 @@ def _get_conversion(value, from_unit, to_unit, recursion=None, use_cache:bool=No
             return value, [units_network.get_node(from_unit) if units_network.has_node(from_unit) else from_unit]
 
     # no conversion required if 'from' and 'to' units are dates
-    if from_unit in dictionary['Date'] and to_unit in dictionary['Date']:
+    if from_unit in _kind_units('Date') and to_unit in _kind_units('Date'):
         if value is None:
             return equality, [units_network.get_node(from_unit) if units_network.has_node(from_unit) else from_unit,
                                  units_network.get_node(to_unit) if units_network.has_node(to_unit) else to_unit]
@@ -283,18 +377,18 @@ def _get_conversion(value, from_unit, to_unit, recursion=None, use_cache:bool=No
         return (equality, []) if value is None else (value, [])
 
     # from Dimensionless to Percentage or vice-versa
-    if (from_unit.lower() in dictionary['Dimensionless']) and to_unit.lower() in dictionary['Percentage']:
+    if (from_unit.lower() in _kind_units('Dimensionless')) and to_unit.lower() in _kind_units('Percentage'):
         return (fraction__to__percentage, ['*', 100]) if value is None else (value * 100, ['*', 100])
-    if from_unit.lower() in dictionary['Percentage'] and to_unit.lower() in dictionary['Dimensionless']:
+    if from_unit.lower() in _kind_units('Percentage') and to_unit.lower() in _kind_units('Dimensionless'):
         return (percentage__to__fraction, ['/', 100]) if value is None else (value / 100, ['/', 100])
 
     # from Dimensionless to some units (not ratios), to allow assign units to Dimensionless numbers
-    if from_unit.lower() in dictionary['Dimensionless'] and '/' not in to_unit:
+    if from_unit.lower() in _kind_units('Dimensionless') and '/' not in to_unit:
         return (equality, []) if value is None else (value, [])
 
     # special case for Temperature ratios
-    if '/' in from_unit and len(from_unit.split('/')) == 2 and from_unit.split('/')[0] in dictionary['Temperature'] \
-            and '/' in to_unit and len(to_unit.split('/')) == 2 and to_unit.split('/')[0] in dictionary['Temperature']:
+    if '/' in from_unit and len(from_unit.split('/')) == 2 and from_unit.split('/')[0] in _kind_units('Temperature') \
+            and '/' in to_unit and len(to_unit.split('/')) == 2 and to_unit.split('/')[0] in _kind_units('Temperature'):
         t1, d1 = from_unit.split('/')
         t2, d2 = to_unit.split('/')
         num = temperatureRatioConversions[(t1, t2)]
@@ -318,12 +412,12 @@ def _get_conversion(value, from_unit, to_unit, recursion=None, use_cache:bool=No
             return value * num / den, ['*', num, '/'] + den_path
 
     # from Dimensionless to ratio of same units
-    if from_unit.lower() in dictionary['Dimensionless'] and '/' in to_unit and len(to_unit.split('/')) == 2 and \
+    if from_unit.lower() in _kind_units('Dimensionless') and '/' in to_unit and len(to_unit.split('/')) == 2 and \
             to_unit.lower().split('/')[0].strip(' ()') == to_unit.lower().split('/')[1].strip(' ()'):
         return (equality, []) if value is None else (value, [])
 
     # from ratio of same units to Dimensionless
-    if to_unit.lower() in dictionary['Dimensionless'] and '/' in from_unit and len(from_unit.split('/')) == 2 and \
+    if to_unit.lower() in _kind_units('Dimensionless') and '/' in from_unit and len(from_unit.split('/')) == 2 and \
             from_unit.lower().split('/')[0].strip(' ()') == from_unit.lower().split('/')[1].strip(' ()'):
         return (equality, []) if value is None else (value, [])
 
@@ -336,17 +430,28 @@ def _get_conversion(value, from_unit, to_unit, recursion=None, use_cache:bool=No
         else:
             return 1 / value, ['1/']
 
+    # units in the same component are converted through the factors to its root, without searching the network
+    if unyts_parameters_.canonical_roots_ and units_network.roots().connected(from_unit, to_unit):
+        conversion = _affine_conversion(*units_network.roots().factor(from_unit, to_unit))
+        conversion_path = units_network.roots().path(from_unit, to_unit)
+        units_network.memory[(from_unit, to_unit)] = conversion, conversion_path
+        if value is None:
+            return conversion, conversion_path
+        else:
+            return conversion(value), conversion_path
+
     # check if path is already defined in network
     conversion_path = _search_network(from_unit, to_unit)
     # return Conversion if found in network
     if conversion_path is Empty:
         return Empty, None
     elif conversion_path is not None:
-        units_network.memory[(from_unit, to_unit)] = (_function_conversion(conversion_path), conversion_path)
+        conversion = _function_conversion(conversion_path)
+        units_network.memory[(from_unit, to_unit)] = conversion, conversion_path
         if value is None:
-            return units_network.memory[(from_unit, to_unit)]
+            return conversion, conversion_path
         else:
-            return _apply_conversion(value, conversion_path), conversion_path
+            return conversion(value), conversion_path
     else:
         return None, None
     
@@ -381,16 +486,34 @@ def generations_until_common(start, end, verbose=False, max_generations_screenin
     return generations if len(selection) > 0 else (np.inf if _numpy_ else 9999)
 
 
-def _get_descendants(unit:str, generations=None, get_combinations=True):
+_descendants_limit = 4096  # descendants memorized for each graph
+
+
+def _get_descendants(unit:str, generations=None, get_combinations=True, graph=None) -> frozenset:
+    """
+    Returns the names of the units that can be reached from `unit` in up to `generations` steps through the network,
+    including the ratios of the descendants of the numerator and denominator if `get_combinations` is True.
+    The results are memorized in the graph, for its current version, forgetting the oldest beyond `_descendants_limit`.
+    """
     generations = unyts_parameters_.max_generations_ if generations is None else generations
+    graph = units_network if graph is None else graph
+    memory = graph.descendants_memory() if hasattr(graph, 'descendants_memory') else {}
+    key = (unit, generations, get_combinations)
+    if key not in memory:
+        descendants = _find_descendants(unit, generations, get_combinations, graph)
+        if len(memory) >= _descendants_limit:
+            memory.pop(next(iter(memory)), None)
+        memory[key] = descendants
+    return memory[key]
+
+
+def _find_descendants(unit:str, generations:int, get_combinations:bool, graph) -> frozenset:
     if generations == 0:
-        return {unit}
+        return frozenset({unit})
     children, children_split = set(), set()
     unit_num, unit_den = None, None
-    if units_network.has_node(unit):
-        children = {unit}
-        for g in range(generations):
-            children = children.union({each for k, v in units_network.get_edges_str().items() for each in v if k in children})
+    if graph.has_node(unit):
+        children = graph.descendants(unit, generations)
 
     if get_combinations:
         for s in '/*':
@@ -398,8 +521,8 @@ def _get_descendants(unit:str, generations=None, get_combinations=True):
                 unit_num, unit_den = unit.split(s)
                 break
         if unit_num is not None and unit_den is not None:
-            children_num = _get_descendants(unit_num, generations)
-            children_den = _get_descendants(unit_den, generations)
+            children_num = _get_descendants(unit_num, generations, graph=graph)
+            children_den = _get_descendants(unit_den, generations, graph=graph)
             children_split = {f"{num}/{den}"
                               for num in {unit_num}.union(children_num)
                               for den in {unit_den}.union(children_den)
@@ -407,7 +530,44 @@ def _get_descendants(unit:str, generations=None, get_combinations=True):
         descendants = children.union(children_split)
     else:
         descendants = children
-    return {unit}.union(descendants)
+    return frozenset({unit}.union(descendants))
+
+
+def _unit_kinds(graph=None):
+    """
+    Returns the UnitKinds map of the network, computed once for each version of the graph.
+    """
+    graph = units_network if graph is None else graph
+    return _memorized_kinds(graph, graph.version)
+
+
+@lru_cache(maxsize=1)
+def _memorized_kinds(graph, version:int):
+    from .reachability import UnitKinds
+    # the special cases of `_get_conversion` can convert these units to any other
+    wildcards = _kind_units('Dimensionless').union(_kind_units('Percentage'), _kind_units('Date'))
+    return UnitKinds(graph, wildcards)
+
+
+def _impossible_conversion(from_unit: str, to_unit: str) -> bool:
+    """
+    Returns True if there is no possible conversion from `from_unit` to `to_unit`, without searching for it.
+    Units of the network are compared with their reachability index, while ratios and products of units are rejected
+    only if they don't share any kind. Returns False if not sure, so the conversion will be searched.
+    """
+    if type(from_unit) is not str or type(to_unit) is not str or (from_unit, to_unit) in units_network.memory:
+        return False
+    kinds = _unit_kinds()
+    if kinds.is_wildcard(from_unit) or kinds.is_wildcard(to_unit):
+        return False
+    if '/' not in from_unit and '*' not in from_unit and '/' not in to_unit and '*' not in to_unit:
+        if units_network.has_node(from_unit) and units_network.has_node(to_unit):
+            return not units_network.reachability().reachable(from_unit, to_unit)
+        return False
+    from_signature, to_signature = kinds.signature(from_unit), kinds.signature(to_unit)
+    if from_signature is None or to_signature is None:
+        return False
+    return from_signature.isdisjoint(to_signature)
 
 
 def _ratio_conversion_including_children(from_unit, to_unit, recursion=None, max_paths=12, use_cache:bool=None):
@@ -494,8 +654,14 @@ def _converter(value, from_unit, to_unit, recursion=None, use_cache:bool=None):
     def _product(x, y):
         return x * y
 
+    # the pairs already tried are kept by the session of this conversion
+    if not in_session():
+        with conversion_session():
+            return _converter(value, from_unit, to_unit, recursion=recursion, use_cache=use_cache)
+    session = current_session()
+
     # avoid infinite looping, do not repeat searches
-    if (from_unit, to_unit) in units_network.previous:
+    if session.is_visited(from_unit, to_unit):
         return None, None
     
     # get and set recursion limit
@@ -515,7 +681,7 @@ def _converter(value, from_unit, to_unit, recursion=None, use_cache:bool=None):
     elif conv is not None:
         return conv, conv_path
     
-    units_network.previous.append((from_unit, to_unit))
+    session.visit(from_unit, to_unit)
    
     # look for conversions of parts in ratio or product units
     if unyts_parameters_.verbose_:
@@ -559,7 +725,7 @@ def _converter(value, from_unit, to_unit, recursion=None, use_cache:bool=None):
             return x * conversion_factor
         units_network.memory[(from_unit, to_unit)] = conversion, conversion_path
         if value is None:
-            return units_network.memory[(from_unit, to_unit)]
+            return conversion, conversion_path
         else:
             return value * conversion_factor, conversion_path
 
@@ -577,7 +743,7 @@ def _converter(value, from_unit, to_unit, recursion=None, use_cache:bool=None):
                     return pair_conversion(base_conversion(x))
                 units_network.memory[(from_unit, to_unit)] = conversion, conversion_path
                 if value is None:
-                    return units_network.memory[(from_unit, to_unit)]
+                    return conversion, conversion_path
                 else:
                     return conversion(value), conversion_path
 
@@ -595,7 +761,7 @@ def _converter(value, from_unit, to_unit, recursion=None, use_cache:bool=None):
                     return final_conversion(pair_conversion(x))
                 units_network.memory[(from_unit, to_unit)] = conversion, conversion_path
                 if value is None:
-                    return units_network.memory[(from_unit, to_unit)]
+                    return conversion, conversion_path
                 else:
                     return conversion(value), conversion_path
 
@@ -607,7 +773,7 @@ def _converter(value, from_unit, to_unit, recursion=None, use_cache:bool=None):
         if conversion is not None:        
             units_network.memory[(from_unit, to_unit)] = conversion, conversion_path
             if value is None:
-                return units_network.memory[(from_unit, to_unit)]
+                return conversion, conversion_path
             else:
                 return conversion(value), conversion_path
 
@@ -617,6 +783,26 @@ def _converter(value, from_unit, to_unit, recursion=None, use_cache:bool=None):
     return None, None
 
 
+def _probe_factor(function):
+    """
+    Returns the (scale, offset) tuple of a resolved conversion `function` equivalent to `x * scale + offset`, or None if
+    the conversion is not affine or can not be evaluated on numbers.
+    """
+    try:
+        offset = function(0)
+        scale = function(1) if offset == 0 else (function(2 ** 20) - offset) / 2 ** 20
+        if not isinstance(scale, (int, float)) or not isinstance(offset, (int, float)) or scale == 0:
+            return None
+        for x in (-12.5, 3.7, 1E3):
+            expected = x * scale + offset
+            if abs(function(x) - expected) > 1E-12 * max(abs(expected), abs(x * scale), abs(offset)):
+                return None
+    except Exception:
+        return None
+    # as Python numbers, that keep the dtype of the arrays they multiply
+    return tuple(int(each) if isinstance(each, int) else float(each) for each in (scale, offset))
+
+
 def _clean_input(value: numeric, from_unit: str, to_unit: str_Empty) -> (numeric, str, str):
     """
     Helper function to preprocess the input parameters from the user
@@ -638,8 +824,10 @@ def _clean_input(value: numeric, from_unit: str, to_unit: str_Empty) -> (numeric
         if to_unit is Empty or to_unit == 'Empty':
             from_unit, to_unit = value.unit, from_unit
         value = value.get_value()
-    if _numpy_ and hasattr(value, '__iter__') and type(value) is not np.array:
-        value = np.array(value)
+    if isinstance(value, _containers):
+        pass  # arrays, Series and DataFrames are converted as they are, without copying them
+    elif _numpy_ and hasattr(value, '__iter__'):
+        value = np.asarray(value)
     elif not _numpy_ and type(value) in [list, tuple]:
         raise TypeError("Can't operate with list or tuple without NumPy. `value` can not be a list or tuple.")
     if value is not None and not isinstance(value, _numeric):
@@ -680,6 +868,84 @@ def _clean_input(value: numeric, from_unit: str, to_unit: str_Empty) -> (numeric
     return value, from_unit, to_unit
 
 
+def _convert_into(conversion, value, out):
+    """
+    Helper function to write the conversion of `value` into `out`, without allocating new arrays if the conversion is
+    affine, or through a single temporary array otherwise.
+
+    Parameters
+    ----------
+    conversion: function
+        the conversion function provided by _converter() when the value is None.
+    value: NumPy.array, Series or DataFrame
+        the values to be converted.
+    out: NumPy.array, Series or DataFrame
+        the array to write the converted values, it can be `value` itself.
+
+    Returns
+    -------
+        out
+    """
+    if _pandas_ and isinstance(out, (Series, DataFrame)):
+        # the buffers of pandas objects are not writable under Copy-on-Write,
+        # the conversion is made in a single temporary array and written back through `iloc`
+        array = np.array(value.to_numpy() if isinstance(value, (Series, DataFrame)) else value)
+        out.iloc[:] = _convert_into(conversion, array, array)
+        return out
+    if not (_numpy_ and isinstance(out, ndarray)):
+        raise TypeError(f"`out` must be a NumPy array, Series or DataFrame, not {type(out)}.")
+    if not out.flags.writeable:
+        raise ValueError("`out` is a read-only array.")
+    if _pandas_ and isinstance(value, (Series, DataFrame)):
+        value = value.to_numpy()
+    factor = None if conversion is equality else _probe_factor(conversion)
+    if conversion is equality:
+        if value is not out:
+            np.copyto(out, value)
+    elif factor is None:
+        out[...] = conversion(value)
+    else:
+        np.multiply(value, factor[0], out=out)
+        if factor[1] != 0:
+            np.add(out, factor[1], out=out)
+    return out
+
+
+def _promote_integers(value, dtype_policy: str = None):
+    """
+    Helper function to cast the integer values to the `integer_dtype` set in the parameters, before converting them,
+    if the dtype policy is 'preserve'.
+    """
+    dtype_policy = unyts_parameters_.dtype_policy_ if dtype_policy is None else dtype_policy
+    integer_dtype = unyts_parameters_.integer_dtype_
+    if dtype_policy != 'preserve' or integer_dtype is None:
+        return value
+    if _pandas_ and isinstance(value, DataFrame):
+        integer_columns = {column: integer_dtype for column, dtype in value.dtypes.items() if dtype.kind in 'iu'}
+        return value.astype(integer_columns) if len(integer_columns) > 0 else value
+    if hasattr(value, 'dtype') and value.dtype.kind in 'iu':
+        return value.astype(integer_dtype)
+    return value
+
+
+def _keep_dtype(converted, value, dtype_policy: str = None):
+    """
+    Helper function to cast the `converted` values back to the floating dtype of the input `value`, if the dtype
+    policy is 'preserve' and some conversion changed it, i.e.: multiplying a float32 array by a NumPy float64 factor.
+    """
+    dtype_policy = unyts_parameters_.dtype_policy_ if dtype_policy is None else dtype_policy
+    if dtype_policy != 'preserve':
+        return converted
+    if _pandas_ and isinstance(value, DataFrame) and isinstance(converted, DataFrame):
+        changed = {column: dtype for column, dtype in value.dtypes.items()
+                   if dtype.kind in 'fc' and column in converted.columns and converted.dtypes[column] != dtype}
+        return converted.astype(changed) if len(changed) > 0 else converted
+    if hasattr(value, 'dtype') and hasattr(converted, 'dtype') and value.dtype.kind in 'fc' and \
+            converted.dtype != value.dtype and converted.dtype.kind in 'fc':
+        return converted.astype(value.dtype)
+    return converted
+
+
 def _clean_print_conversion_path(print_conversion_path: bool = None) -> bool:
     return unyts_parameters_.print_path_ if print_conversion_path is None else bool(print_conversion_path)
 
@@ -705,7 +971,7 @@ def _density_conversion(value: numeric, from_unit: str, to_unit: str, use_cache:
         a conversion and the conversion path, if found.
     """
     if from_unit not in uncertain_names and to_unit not in uncertain_names and \
-            from_unit in dictionary['Volume'] and to_unit in dictionary['Weight']:
+            from_unit in _kind_units('Volume') and to_unit in _kind_units('Weight'):
         density = _get_density()
         this_units_density, _ = _converter(density, 'g/cm3', f"{to_unit}/{from_unit}", use_cache=use_cache)
         if value is None:
@@ -715,7 +981,7 @@ def _density_conversion(value: numeric, from_unit: str, to_unit: str, use_cache:
             conv = value * this_units_density
         conv_path = ['*', this_units_density]
     elif from_unit not in uncertain_names and to_unit not in uncertain_names and \
-            to_unit in dictionary['Volume'] and from_unit in dictionary['Weight']:
+            to_unit in _kind_units('Volume') and from_unit in _kind_units('Weight'):
         density = _get_density()
         this_units_density = _converter(density, 'g/cm3', f"{from_unit}/{to_unit}", use_cache=use_cache)
         if value is None:
@@ -746,6 +1012,7 @@ def _search_network(from_unit, to_unit, algorithm:str=None):
         - 'lean_BFS': will return the shortest path searching through a slimmed network of preselected nodes.
         - 'DFS': Depth-First Search algorithm, will return the first found path searching through the network one branch at a time.
         - 'hybrid_BFS': launch together BFS and lean_BFS searches, and returns the first valid result.
+        - 'bidirectional_BFS': will return the same shortest path than BFS, searching from both ends until they meet.
     Returns
     -------
         conversion_path: list
@@ -753,26 +1020,35 @@ def _search_network(from_unit, to_unit, algorithm:str=None):
     """
     if algorithm is None:
         algorithm = unyts_parameters_.algorithm_
-    if units_network.has_node(from_unit) and units_network.has_node(to_unit):
-        if algorithm == 'BFS':
-            conversion_path = BFS(units_network,
-                                  units_network.get_node(from_unit),
-                                  units_network.get_node(to_unit),
+    # the searches run on the compiled CSR arrays if the 'compact' backend is set
+    graph = units_network.compact() if unyts_parameters_.backend_ == 'compact' else units_network
+    if graph.has_node(from_unit) and graph.has_node(to_unit):
+        if not graph.reachability().reachable(from_unit, to_unit):
+            # there is no path at all, no need to search for it
+            conversion_path = None
+        elif algorithm == 'BFS':
+            conversion_path = BFS(graph,
+                                  graph.get_node(from_unit),
+                                  graph.get_node(to_unit),
                                   verbose=unyts_parameters_.verbose_ and unyts_parameters_.verbose_details_ > 1)
         elif algorithm == 'lean_BFS':
-            conversion_path = lean_BFS(units_network, units_network.get_node(from_unit),
-                                       units_network.get_node(to_unit),
+            conversion_path = lean_BFS(graph, graph.get_node(from_unit),
+                                       graph.get_node(to_unit),
                                        verbose=unyts_parameters_.verbose_,
                                        max_generations_screening=unyts_parameters_.generations_limit())
         elif algorithm == 'DFS':
-            conversion_path = DFS(units_network, units_network.get_node(from_unit),
-                                  units_network.get_node(to_unit),
+            conversion_path = DFS(graph, graph.get_node(from_unit),
+                                  graph.get_node(to_unit),
                                   verbose=unyts_parameters_.verbose_ and unyts_parameters_.verbose_details_ > 1,
                                   branch_depht=unyts_parameters_.generations_limit())
         elif algorithm == 'hybrid_BFS':
-            conversion_path = hybrid_BFS(units_network, units_network.get_node(from_unit),
-                                         units_network.get_node(to_unit), verbose=unyts_parameters_.verbose_,
+            conversion_path = hybrid_BFS(graph, graph.get_node(from_unit),
+                                         graph.get_node(to_unit), verbose=unyts_parameters_.verbose_,
                                          max_generations_screening=unyts_parameters_.generations_limit())
+        elif algorithm == 'bidirectional_BFS':
+            conversion_path = bidirectional_BFS(graph, graph.get_node(from_unit),
+                                                graph.get_node(to_unit),
+                                                verbose=unyts_parameters_.verbose_ and unyts_parameters_.verbose_details_ > 1)
         else:
             raise NotImplementedError("other search algorithms different from BFS and DFS are not yet implemented.")
     else:
@@ -780,6 +1056,7 @@ def _search_network(from_unit, to_unit, algorithm:str=None):
     return conversion_path
 
 
+@new_session
 def convertible(from_unit: str, to_unit: str, use_cache:bool=None) -> bool:
     """
     Returns True if a conversion path from `from_unit` to `to_unit` is found, otherwise returns True.
@@ -795,14 +1072,16 @@ def convertible(from_unit: str, to_unit: str, use_cache:bool=None) -> bool:
     -------
         bool
     """
-    unyts_parameters_.reset_start_time()
-
     from unyts.unit_class import Unit
+    load_units()
     if isinstance(from_unit, Unit):
         from_unit = from_unit.get_unit()
     if isinstance(to_unit, Unit):
         to_unit = to_unit.get_unit()
 
+    # the reachability index only tells when there is no path, a path found may not be converted, i.e.: without FVF
+    if _impossible_conversion(from_unit, to_unit):
+        return False
     try:
         conv, conv_path = _converter(1, from_unit, to_unit, use_cache=use_cache)
         return False if (conv is None or conv is Empty) else True
@@ -810,8 +1089,10 @@ def convertible(from_unit: str, to_unit: str, use_cache:bool=None) -> bool:
         return False
 
 
+@new_session
 def convert(value: numeric, from_unit: str, to_unit: str_Empty = Empty,
-            print_conversion_path: bool = None, use_cache:bool=None):
+            print_conversion_path: bool = None, use_cache:bool=None, out=None, inplace:bool=False,
+            dtype_policy:str=None):
     """
     Converts the received value (integer, float, array, Series, Frame, ...) from the units 'from_unit' to the units 'to_units'.
 
@@ -827,31 +1108,45 @@ def convert(value: numeric, from_unit: str, to_unit: str_Empty = Empty,
         Set to True to show the path used for Conversion. The default is False.
     use_cache: bool
         Set to False to ignore cached searches, and repeat the search.
+    out : NumPy.array, optional
+        an array of the same shape as `value` to write the converted values, instead of allocating a new one.
+    inplace : bool, optional
+        Set to True to write the converted values into `value` itself, a NumPy.array, Series or DataFrame.
+    dtype_policy : str, optional
+        'preserve' to keep the floating dtype of `value` and promote integers as set by `set_dtype_policy`, or 'numpy'
+        to keep the dtype resulting from the operations. The default is the policy set in the parameters.
 
     Returns
     -------
     conversion_function : function
         if input value is None, or
     converted_value : int, float, array, Series, DataFrame ...
-        the converted value if input value is not None
+        the converted value if input value is not None, that is `out` or `value` if provided or converted in place.
     """
-    unyts_parameters_.reset_start_time()
-
+    load_units()
     if unyts_parameters_.verbose_:
         logger.info("convert: STARTING...")
+    if inplace:
+        if out is not None:
+            raise ValueError("`out` and `inplace` can not be used together.")
+        if not isinstance(value, _containers):
+            raise TypeError(f"only NumPy arrays, Series and DataFrames can be converted in place, not {type(value)}.")
+        out = value
     # cleaning inputs
     value, from_unit, to_unit = _clean_input(value, from_unit, to_unit)
     print_conversion_path = _clean_print_conversion_path(print_conversion_path)
-    # reset previous memory for this variable
-    units_network.previous = []
+    if out is not None and value is None:
+        raise TypeError("`value` must be provided to write its conversion into `out`.")
+    # the conversion function is requested to write its result into `out`
+    value_to_convert = None if out is not None else _promote_integers(value, dtype_policy)
 
     # density factor, in case of conversion from volume to mass or mass to volume
-    conv, conv_path = _density_conversion(value, from_unit, to_unit, use_cache=use_cache)
+    conv, conv_path = _density_conversion(value_to_convert, from_unit, to_unit, use_cache=use_cache)
 
     if conv is None:
         # regular conversion
         #conv, conv_path = _converter(value, from_unit, to_unit, use_cache=use_cache)
-        conv, conv_path = _converter(value, from_unit, to_unit, use_cache=use_cache)
+        conv, conv_path = _converter(value_to_convert, from_unit, to_unit, use_cache=use_cache)
 
     if conv is None:
         if unyts_parameters_.raise_error_:
@@ -871,9 +1166,12 @@ def convert(value: numeric, from_unit: str, to_unit: str_Empty = Empty,
     if print_conversion_path:
         logger.info(f"converting from '{from_unit}' to '{to_unit}':\n {unyts_parameters_.last_path_str}")
 
-    return conv
+    if out is not None:
+        return _convert_into(conv, value, out)
+    return _keep_dtype(conv, value_to_convert, dtype_policy)
 
 
+@new_session
 def convert_for_SimPandas(value: numeric, from_unit: str, to_unit: str,
                           print_conversion_path:bool=False, use_cache:bool=None):
     """
@@ -900,8 +1198,6 @@ def convert_for_SimPandas(value: numeric, from_unit: str, to_unit: str,
     converted_value : Series, DataFrame
         the converted value if input value is not None
     """
-    unyts_parameters_.reset_start_time()
-
     conv = None
     print_conversion_path = bool(print_conversion_path)
     if convertible(from_unit, to_unit):
@@ -8,21 +8,24 @@ Created on Tue Dec 03 23:15:37 2024
 
 __version__ = '0.6.4'
 __release__ = 20250601
-__all__ = ['units_network', 'network_to_frame', 'save_memory', 'load_memory', 'clean_memory', 'delete_cache', 'set_fvf']
+__all__ = ['units_network', 'network_to_frame', 'save_memory', 'load_memory', 'clean_memory', 'delete_cache', 'set_fvf',
+           'attach_shared_cache', 'load_units', 'resolve_prefix']
 
 
 import os
 
-from .dictionaries import SI, SI_butK, SI_order, OGF, OGF_order, DATA, DATA_order, dictionary
+from threading import RLock
+from .dictionaries import SI, SI_butK, SI_order, OGF, OGF_order, DATA, DATA_order, dictionary, \
+    _LoadedDictionary, _load_dictionary, _load_cached_dictionary, _fill_dictionary, _units_cache_files, _add_unit
 from .units.def_conversions import *
 from .network import UDigraph, UNode, Conversion
 from .parameters import unyts_parameters_
 from .helpers.logger import logger
-from os.path import isfile
-from json import dump as json_dump
+from json import dumps as json_dumps
+from .helpers.cache_files import read_cache, write_cache
 
 try:
-    from cloudpickle import dump as cloudpickle_dump, load as cloudpickle_load
+    from cloudpickle import dumps as cloudpickle_dumps, loads as cloudpickle_loads
     _cloudpickle_ = True
 except ModuleNotFoundError:
     if unyts_parameters_.cache_:
@@ -42,12 +45,34 @@ def clean_memory(path=None) -> None:
     units_network.clean_memory()
 
 
+def attach_shared_cache(path=None) -> bool:
+    """
+    Attaches the shared cache at `path` to the search memory, or detaches it if `path` is None.
+    Returns False if the shared cache could not be opened.
+    """
+    if units_network.memory.shared is not None:
+        units_network.memory.shared.close()
+    if path is None:
+        units_network.memory.attach(None)
+        return True
+    try:
+        from .shared_cache import SharedConversionCache
+        units_network.memory.attach(SharedConversionCache(path, units_network))
+    except Exception as error:
+        units_network.memory.attach(None)
+        logger.error(f"Failed to open the shared cache {path}: {error}")
+        return False
+    return True
+
+
 def delete_cache() -> None:
     for each in ('search_memory.cache', 'units_network.cache', 'units_dictionary.cache',
-                 'temperature_ratio_conversions.cache', 'unitless_names.cache'):
+                 'units_network_prefixes.cache', 'units_dictionary_prefixes.cache',
+                 'temperature_ratio_conversions.cache', 'unitless_names.cache', 'shared_memory.sqlite'):
         path = unyts_parameters_.get_user_folder() + each
-        if os.path.exists(path):
-            os.remove(path)
+        for file in (path, path + '-wal', path + '-shm'):
+            if os.path.exists(file):
+                os.remove(file)
 
 
 def set_fvf(fvf=None) -> None:
@@ -86,6 +111,72 @@ def get_fvf() -> str:
         return ""
 
 
+# the tables of prefixes, by the name kept in the `prefixes` of the network
+_prefix_tables = {'SI': SI, 'SI_butK': SI_butK, 'DATA': DATA, 'OGF': OGF}
+_prefix_lengths = sorted({len(prefix) for table in _prefix_tables.values() for prefix in table}, reverse=True)
+
+
+def _prefixes(network, unit_name: str, table: str, position: int, kind=None) -> dict:
+    """
+    Returns the prefixes of `table` to make the prefixed units of `unit_name` with the network. With prefix parsing,
+    returns no prefix and keeps in the network the prefixes the unit takes, to make its prefixed units when first used.
+    """
+    if not unyts_parameters_.prefix_parsing_:
+        return _prefix_tables[table]
+    network.prefixes.setdefault(unit_name, []).append((table, position, kind))
+    return {}
+
+
+def _make_prefixed(network, unit_name: str) -> bool:
+    """
+    Adds the conversions of `unit_name` to and from its unit, for each prefix and unit taking that prefix it is split
+    into, as made with the network without prefix parsing, adding its node if not in the network.
+    Returns True if `unit_name` is a prefixed unit.
+    """
+    prefixed = False
+    for length in _prefix_lengths:
+        prefix, base = unit_name[:length], unit_name[length:]
+        for table, position, kind in network.prefixes.get(base, ()):
+            if prefix not in _prefix_tables[table] or _prefix_tables[table][prefix][position] is None:
+                continue
+            if not network.has_node(unit_name):
+                network.add_node(UNode(unit_name))
+            conversion = _prefix_tables[table][prefix][position]
+            network.add_edge(Conversion(network.get_node(unit_name), network.get_node(base), conversion))
+            network.add_edge(Conversion(network.get_node(base), network.get_node(unit_name), conversion, reverse=True))
+            if kind is not None:
+                # the data kinds are merged into Data once the network is made
+                _add_unit(kind if kind in dictionary else 'Data', unit_name)
+            prefixed = True
+    return prefixed
+
+
+def resolve_prefix(unit_name: str, network=None) -> bool:
+    """
+    Makes the node of a prefixed unit not made with the network, when the network was made with prefix parsing.
+    `unit_name` is split into a prefix and a unit taking that prefix, i.e.: 'kPa' into 'k' and 'Pa', and its node is
+    added with the conversions to and from the unit, and its name to the units of its kind in the dictionary.
+
+    Parameters
+    ----------
+    unit_name : str
+        the name of the unit.
+    network : UDigraph, optional
+        the network where to make the unit. The default is the units network.
+
+    Returns
+    -------
+    bool
+        True if `unit_name` is a node of the network.
+    """
+    network = units_network if network is None else network
+    if type(unit_name) is not str:
+        return False
+    if network.has_node(unit_name):
+        return True
+    return bool(network.prefixes) and _make_prefixed(network, unit_name)
+
+
 def _load_network():
     logger.info('preparing units network...')
     network = UDigraph()
@@ -149,7 +240,7 @@ def _load_network():
             for unit_name in dictionary[unit_kind]:
                 network.add_node(UNode(unit_name))
                 dictionary[unit_kind.split('_')[0]].append(unit_name)
-                for prefix in SI:
+                for prefix in _prefixes(network, unit_name, 'SI', 0, unit_kind.split('_')[0]):
                     network.add_node(UNode(prefix + unit_name))
                     network.add_edge(
                         Conversion(network.get_node(prefix + unit_name), network.get_node(unit_name), SI[prefix][0]))
@@ -161,7 +252,7 @@ def _load_network():
             for unit_name in dictionary[unit_kind]:
                 network.add_node(UNode(unit_name))
                 dictionary[unit_kind.split('_')[0]].append(unit_name)
-                for prefix in SI:
+                for prefix in _prefixes(network, unit_name, 'SI', 1, unit_kind.split('_')[0]):
                     network.add_node(UNode(prefix + unit_name))
                     network.add_edge(
                         Conversion(network.get_node(prefix + unit_name), network.get_node(unit_name), SI[prefix][1]))
@@ -173,7 +264,7 @@ def _load_network():
             for unit_name in dictionary[unit_kind]:
                 network.add_node(UNode(unit_name))
                 dictionary[unit_kind.split('_')[0]].append(unit_name)
-                for prefix in SI:
+                for prefix in _prefixes(network, unit_name, 'SI', 2, unit_kind.split('_')[0]):
                     network.add_node(UNode(prefix + unit_name))
                     network.add_edge(
                         Conversion(network.get_node(prefix + unit_name), network.get_node(unit_name), SI[prefix][2]))
@@ -185,7 +276,7 @@ def _load_network():
             for unit_name in dictionary[unit_kind]:
                 network.add_node(UNode(unit_name))
                 dictionary[unit_kind.split('_')[0]].append(unit_name)
-                for prefix in SI:
+                for prefix in _prefixes(network, unit_name, 'SI', 0, None):
                     network.add_node(UNode(prefix + unit_name))
                     network.add_edge(
                         Conversion(network.get_node(prefix + unit_name), network.get_node(unit_name), SI[prefix][0]))
@@ -196,7 +287,7 @@ def _load_network():
             for unit_name in dictionary[unit_kind]:
                 network.add_node(UNode(unit_name))
                 dictionary[unit_kind.split('_')[0]].append(unit_name)
-                for prefix in SI_butK:
+                for prefix in _prefixes(network, unit_name, 'SI_butK', 0, unit_kind.split('_')[0]):
                     network.add_node(UNode(prefix + unit_name))
                     network.add_edge(
                         Conversion(network.get_node(prefix + unit_name), network.get_node(unit_name),
@@ -210,7 +301,7 @@ def _load_network():
             for unit_name in dictionary[unit_kind]:
                 network.add_node(UNode(unit_name))
                 dictionary[unit_kind.split('_')[0]].append(unit_name)
-                for prefix in SI_butK:
+                for prefix in _prefixes(network, unit_name, 'SI_butK', 1, unit_kind.split('_')[0]):
                     network.add_node(UNode(prefix + unit_name))
                     network.add_edge(
                         Conversion(network.get_node(prefix + unit_name), network.get_node(unit_name),
@@ -224,7 +315,7 @@ def _load_network():
             for unit_name in dictionary[unit_kind]:
                 network.add_node(UNode(unit_name))
                 dictionary[unit_kind.split('_')[0]].append(unit_name)
-                for prefix in SI_butK:
+                for prefix in _prefixes(network, unit_name, 'SI_butK', 2, unit_kind.split('_')[0]):
                     network.add_node(UNode(prefix + unit_name))
                     network.add_edge(
                         Conversion(network.get_node(prefix + unit_name), network.get_node(unit_name),
@@ -239,7 +330,7 @@ def _load_network():
             for unit_name in dictionary[unit_kind]:
                 network.add_node(UNode(unit_name))
                 dictionary[unit_kind.split('_')[0]].append(unit_name)
-                for prefix in DATA:
+                for prefix in _prefixes(network, unit_name, 'DATA', 0, unit_kind.split('_')[0]):
                     network.add_node(UNode(prefix + unit_name))
                     network.add_edge(
                         Conversion(network.get_node(prefix + unit_name), network.get_node(unit_name), DATA[prefix][0]))
@@ -251,7 +342,7 @@ def _load_network():
             for unit_name in dictionary[unit_kind]:
                 network.add_node(UNode(unit_name))
                 dictionary[unit_kind.split('_')[0]].append(unit_name)
-                for prefix in DATA:
+                for prefix in _prefixes(network, unit_name, 'DATA', 1, unit_kind.split('_')[0]):
                     network.add_node(UNode(prefix + unit_name))
                     network.add_edge(
                         Conversion(network.get_node(prefix + unit_name), network.get_node(unit_name), DATA[prefix][1]))
@@ -263,7 +354,7 @@ def _load_network():
             for unit_name in dictionary[unit_kind]:
                 network.add_node(UNode(unit_name))
                 dictionary[unit_kind.split('_')[0]].append(unit_name)
-                for prefix in OGF:
+                for prefix in _prefixes(network, unit_name, 'OGF', 2, unit_kind.split('_')[0]):
                     network.add_node(UNode(prefix + unit_name))
                     network.add_edge(
                         Conversion(network.get_node(prefix + unit_name), network.get_node(unit_name), OGF[prefix][2]))
@@ -631,6 +722,11 @@ def _load_network():
                                                             0].index(
                                                             otherName)], True))
 
+    # the prefixed units defined by other names are converted to their units as without prefix parsing
+    if network.prefixes:
+        for unit_name in network.list_nodes():
+            _make_prefixed(network, unit_name)
+
     to_remove = []
     for unit_kind in dictionary:
         if '_' in unit_kind:
@@ -647,160 +743,15 @@ def _load_network():
     return network
 
 
-def _create_Rates() -> None:
-    # volumes / Time
-    rates = list(dictionary['Rate']) if 'Rate' in dictionary else []
-    rates += [volume + '/' + time for volume in dictionary['Volume'] for time in dictionary['Time']]
-    rates += [weight + '/' + time for weight in dictionary['Weight'] for time in dictionary['Time']]
-    rates += [data + '/' + time for data in dictionary['Data'] for time in dictionary['Time']]
-    dictionary['Rate'] = tuple(set(rates))
-
-
-def _create_VolumeRatio() -> None:
-    # Volume / Volume
-    ratio = list(dictionary['VolumeRatio']) if 'VolumeRatio' in dictionary else []
-    ratio += [numerator + '/' + denominator for numerator in dictionary['Volume'] for denominator in
-              dictionary['Volume']]
-    dictionary['VolumeRatio'] = tuple(set(ratio))
-
-
-def _create_Density() -> None:
-    # mass / Volume
-    density = list(dictionary['Density']) if 'Density' in dictionary else []
-    density += [mass + '/' + volume for mass in dictionary['Mass'] for volume in dictionary['Volume']]
-    dictionary['Density'] = tuple(set(density))
-
-
-def _create_Velocity() -> None:
-    # Length / Time
-    velocity = list(dictionary['Velocity']) if 'Velocity' in dictionary else []
-    velocity += [length + '/' + time for length in dictionary['Length'] for time in dictionary['Time']]
-    dictionary['Velocity'] = tuple(set(velocity))
-
-
-def _create_Power() -> None:
-    # Length / Time
-    power = list(dictionary['Power']) if 'Power' in dictionary else []
-    power += [energy + '/' + time for energy in dictionary['Energy'] for time in dictionary['Time']]
-    power += [voltage + '*' + current for voltage in dictionary['Voltage'] for current in dictionary['Current']]
-    power += [current + '*' + voltage for voltage in dictionary['Voltage'] for current in dictionary['Current']]
-    power += [current + '2*' + resistance for resistance in dictionary['Resistance'] for current in dictionary['Current']]
-    power += [resistance + '*' + current + '2' for resistance in dictionary['Resistance'] for current in dictionary['Current']]
-    dictionary['Power'] = tuple(set(power))
-
-
-def _create_Frequency() -> None:
-    # 1 / Time
-    frequency = list(dictionary['Frequency']) if 'Frequency' in dictionary else []
-    frequency += ['1/' + time for time in dictionary['Time']]
-    dictionary['Frequency'] = tuple(set(frequency))
-
-
-def _create_Conductance() -> None:
-    # 1 / Resistance
-    conductance = list(dictionary['Conductance']) if 'Conductance' in dictionary else []
-    conductance += ['1/' + resistance for resistance in dictionary['Resistance']]
-    dictionary['Conductance'] = tuple(set(conductance))
-
-
-def _create_Capacitance_Charge() -> None:
-    # Capacitance, Charge = Charge / Voltage, Capacitance * Voltage
-    capacitance, charge = \
-        list(dictionary['Capacitance']) if 'Capacitance' in dictionary else [], \
-        list(dictionary['Charge']) if 'Charge' in dictionary else []
-    capacitance, charge, = \
-        capacitance + \
-        [charge + '/' + voltage for voltage in dictionary['Voltage'] for charge in dictionary['Charge']], \
-        charge + \
-        [capacitance + '*' + voltage for voltage in dictionary['Voltage'] for capacitance in dictionary['Capacitance']] + \
-        [voltage + '*' + capacitance for voltage in dictionary['Voltage'] for capacitance in dictionary['Capacitance']]
-    dictionary['Capacitance'] = tuple(set(capacitance))
-    dictionary['Charge'] = tuple(set(charge))
-
-
-def _create_Voltage_Current_Resistance() -> None:
-    # Voltage, Current, Resistance = (Current * Resistance) + (Power / Current), \
-    #                                (Voltage / Resistance) + (Power / Voltage), \
-    #                                (Voltage / Current)
-    voltage, current, resistance = \
-        list(dictionary['Voltage']) if 'Voltage' in dictionary else [], \
-        list(dictionary['Current']) if 'Current' in dictionary else [], \
-        list(dictionary['Resistance']) if 'Resistance' in dictionary else []
-    voltage, current, resistance = \
-        voltage + \
-        [current + '*' + resistance for resistance in dictionary['Resistance'] for current in dictionary['Current']] + \
-        [resistance + '*' + current for resistance in dictionary['Resistance'] for current in dictionary['Current']] + \
-        [power + '/' + current for power in dictionary['Power'] for current in dictionary['Current']], \
-        current + \
-        [voltage + '/' + resistance for resistance in dictionary['Resistance'] for voltage in dictionary['Voltage']] + \
-        [power + '/' + voltage for power in dictionary['Power'] for voltage in dictionary['Voltage']], \
-        resistance + \
-        [voltage + '/' + current for current in dictionary['Current'] for voltage in dictionary['Voltage']]
-    dictionary['Voltage'] = tuple(set(voltage))
-    dictionary['Current'] = tuple(set(current))
-    dictionary['Resistance'] = tuple(set(resistance))
-
-
-def _create_Pressure() -> None:
-    # Weight / Area
-    pressure = list(dictionary['Pressure']) if 'Pressure' in dictionary else []
-    pressure += [weight + '/' + area for weight in dictionary['Weight'] for area in dictionary['Area']]
-    dictionary['Pressure'] = tuple(set(pressure))
-
-
-def _create_ProductivityIndex() -> None:
-    # Volume / Time / Pressure
-    productivityIndex = list(dictionary['ProductivityIndex']) if 'ProductivityIndex' in dictionary else []
-    productivityIndex += [volume + '/' + time + '/' + pressure
-                          for volume in dictionary['Volume']
-                          for time in dictionary['Time']
-                          for pressure in dictionary['Pressure']]
-    dictionary['ProductivityIndex'] = tuple(set(productivityIndex))
-
-
-def _create_PressureGradient() -> None:
-    # Pressure / Length
-    pressureGradient = list(dictionary['PressureGradient']) if 'PressureGradient' in dictionary else []
-    pressureGradient += [pressure + '/' + length for pressure in dictionary['Pressure'] for length in
-                         dictionary['Length']]
-    dictionary['PressureGradient'] = tuple(set(pressureGradient))
-
-
-def _create_TemperatureGradient() -> None:
-    # Pressure / Length
-    temperatureGradient = list(dictionary['TemperatureGradient']) if 'TemperatureGradient' in dictionary else []
-    temperatureGradient += [temperature + '/' + length for temperature in dictionary['Temperature'] for length in
-                            dictionary['Length']]
-    dictionary['TemperatureGradient'] = tuple(set(temperatureGradient))
-
-
-def _create_Acceleration() -> None:
-    # Length / Time / Time
-    acceleration = list(dictionary['Acceleration']) if 'Acceleration' in dictionary else []
-    acceleration += [(length + '/' + time1 + '2') if time1 == time2 else (length + '/' + time1 + '/' + time2)
-                     for length in dictionary['Length']
-                     for time1 in dictionary['Time']
-                     for time2 in dictionary['Time']]
-    dictionary['Acceleration'] = tuple(set(acceleration))
-
-
-def _complete_products() -> None:
-    for key in dictionary:
-        dictionary[key] = tuple(set(list(dictionary[key]) + [(u.split('*')[1] + '*' + u.split('*')[0])
-                                                             for u in dictionary[key]
-                                                             if '/' not in u
-                                                             and len(u.split('*')) == 2]))
-
-
 def _rebuild_units():
     logger.warning('Rebuilding units dictionary...')
-    from .dictionaries import _load_dictionary
-    dictionary, temperatureRatioConversions, unitless_names = _load_dictionary()
-    units_network = _load_network()
-    _clean_network()
+    _fill_dictionary(*_load_dictionary())
+    network = _load_network()
+    _clean_network(network)
+    network.collapse_synonyms()
     unyts_parameters_.reload_ = True
     unyts_parameters_.save_params()
-    return units_network, dictionary, temperatureRatioConversions, unitless_names
+    return network
 
 
 def network_to_frame():
@@ -819,52 +770,109 @@ def network_to_frame():
     return frame.drop_duplicates(['source', 'target'])
 
 
-def _clean_network():
-    units_network.edges = {k: v for k, v in units_network.edges.items() if v != ([],[])}
-
-
-# load the network into an instance of the graph database
-if not unyts_parameters_.reload_ and \
-        isfile(unyts_parameters_.get_user_folder() + 'units_network.cache') and \
-        (not _cloudpickle_ or (_cloudpickle_ and isfile(unyts_parameters_.get_user_folder() + 'units_dictionary.cache'))) and \
-        isfile(unyts_parameters_.get_user_folder() + 'temperature_ratio_conversions.cache') and \
-        isfile(unyts_parameters_.get_user_folder() + 'unitless_names.cache'):
-    try:
-        with open(unyts_parameters_.get_user_folder() + 'units_network.cache', 'rb') as f:
-            units_network = cloudpickle_load(f)
-        logger.info('units network loaded from cache...')
-        unyts_parameters_.reload_ = False
-        unyts_parameters_.save_params()
-    except:
-        logger.error("Failed to load from cache. Creating new dictionaries and saving them to cache...")
-        units_network, dictionary, temperatureRatioConversions, unitless_names = _rebuild_units()
-else:
-    units_network = _load_network()
-    # load the dictionary with ratio units
-    _create_Rates()
-    _create_VolumeRatio()
-    _create_Density()
-    _create_Velocity()
-    _create_Acceleration()
-    _create_ProductivityIndex()
-    _create_PressureGradient()
-    _create_Pressure()
-    _create_TemperatureGradient()
-    _create_Power()
-    _create_Frequency()
-    _create_Conductance()
-    _create_Capacitance_Charge()
-    _create_Voltage_Current_Resistance()
-    _complete_products()
+def _clean_network(network=None):
+    network = units_network if network is None else network
+    # the removed nodes have no children, so they are not parents of any node and `_parents` is still valid
+    network.edges = {k: v for k, v in network.edges.items() if v != ([],[])}
+    network.rebuild_index()
+
+
+def _build_units():
+    """
+    Returns the units network, loaded from cache or made from the definitions of the units, filling the dictionary.
+    """
+    cached_dictionary = _load_cached_dictionary()
+    if cached_dictionary is None:
+        unyts_parameters_.reload_ = True
+        cached_dictionary = _load_dictionary()
+    _fill_dictionary(*cached_dictionary)
+
+    # the dictionary was loaded from cache only if the network cache is valid, otherwise `reload_` is set
+    cached_network = None if unyts_parameters_.reload_ or not _cloudpickle_ else \
+        read_cache(_units_cache_files()[0])
+    if cached_network is not None:
+        try:
+            network = cloudpickle_loads(cached_network)
+            network.rebuild_index(cached=True)
+            logger.info('units network loaded from cache...')
+            return network
+        except:
+            logger.error("Failed to load from cache. Creating new dictionaries and saving them to cache...")
+            return _rebuild_units()
+
+    network = _load_network()
+    # the ratio and product units are not listed in the dictionary, their kinds are parsed with `_composite_kinds`
     # clean empty edges
-    _clean_network()
+    _clean_network(network)
+    # merge the aliases, case, plural and spaces variants of each unit into a single node
+    logger.info(f"{network.collapse_synonyms()} synonyms collapsed into the node of their unit...")
+    # the factors to the canonical roots are computed once, and saved to cache with the network
+    network.roots()
 
     unyts_parameters_.reload_ = False
     unyts_parameters_.save_params()
     if unyts_parameters_.cache_:
         logger.info('saving units network and dictionary to cache...')
         if _cloudpickle_:
-            with open(unyts_parameters_.get_user_folder() + 'units_network.cache', 'wb') as f:
-                cloudpickle_dump(units_network, f)
-        with open(unyts_parameters_.get_user_folder() + 'units_dictionary.cache', 'w') as f:
-            json_dump(dictionary, f)
+            write_cache(_units_cache_files()[0], cloudpickle_dumps(network))
+        write_cache(_units_cache_files()[1], json_dumps(dictionary).encode())
+    return network
+
+
+def load_units() -> None:
+    """
+    Loads the units dictionary and network, from cache or from the definitions of the units, the first time it is
+    called. Importing unyts doesn't load them, they are loaded by the first conversion or Unit that needs them.
+    The other threads wait until the units are loaded.
+    """
+    global _loaded, _loading
+    if _loaded:
+        return
+    with _loader:
+        if _loaded or _loading:  # loaded by another thread, or required by the loading itself
+            return
+        _loading = True
+        try:
+            units_network.update(_build_units())
+            units_network.__class__, dictionary.__class__ = UDigraph, _LoadedDictionary
+            _loaded = True
+        finally:
+            _loading = False
+
+    if unyts_parameters_.show_version_:
+        from . import __version__ as unyts_version
+        print(f"loaded unyts version {unyts_version}")
+        unyts_parameters_.show_version_ = False
+        unyts_parameters_.save_params()
+
+    # precompute the factors to the canonical root of every connected component
+    if unyts_parameters_.canonical_roots_:
+        units_network.roots()
+
+    # share the conversions found with other processes
+    if unyts_parameters_.shared_cache_ is not None:
+        attach_shared_cache(unyts_parameters_.shared_cache_)
+
+
+class _UnloadedUDigraph(UDigraph):
+    """
+    The units network before loading the units, with only its memory and FVF, that loads the units the first time any
+    other attribute is read. Once loaded, `load_units` makes it a UDigraph.
+    """
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        self.memory = self._new_memory()
+        self.fvf = None
+
+    def __getattr__(self, name: str):
+        load_units()
+        if type(self) is _UnloadedUDigraph:  # required while loading the units
+            raise AttributeError(name)
+        return getattr(self, name)
+
+
+# the network is filled in place by `load_units`, so the modules that imported it see the loaded network
+units_network = _UnloadedUDigraph()
+_loaded, _loading = False, False
+_loader = RLock()
@@ -11,10 +11,11 @@ __release__ = 20250601
 __all__ = ['dictionary', 'SI', 'OGF', 'DATA', 'StandardAirDensity', 'StandardEarthGravity', 'StandardWaterDensity',
            'unitless_names', 'uncertain_names']
 
-from json import load as json_load
-from pickle import load as pickle_load, dump as pickle_dump
-from os.path import isfile
+from itertools import chain, product, repeat
+from json import loads as json_loads
+from pickle import loads as pickle_loads, dumps as pickle_dumps
 from .parameters import unyts_parameters_
+from .helpers.cache_files import read_cache, write_cache, valid_cache
 from .units.def_prefixes import *
 from .helpers.logger import logger
 
@@ -612,34 +613,308 @@ def _load_dictionary() -> (dict, dict):
     unitless_names = list(set(unitless_names)) + [None]
 
     if unyts_parameters_.cache_:
-        with open(unyts_parameters_.get_user_folder() + 'temperature_ratio_conversions.cache', 'wb') as f:
-            pickle_dump(temperature_ratio_conversions, f)
-        with open(unyts_parameters_.get_user_folder() + 'unitless_names.cache', 'wb') as f:
-            pickle_dump(unitless_names, f)
+        write_cache(unyts_parameters_.get_user_folder() + 'temperature_ratio_conversions.cache',
+                    pickle_dumps(temperature_ratio_conversions))
+        write_cache(unyts_parameters_.get_user_folder() + 'unitless_names.cache', pickle_dumps(unitless_names))
 
     return dictionary, temperature_ratio_conversions, unitless_names
 
 
-if not unyts_parameters_.reload_ and \
-        isfile(unyts_parameters_.get_user_folder() + 'units_dictionary.cache') and \
-        isfile(unyts_parameters_.get_user_folder() + 'units_network.cache') and \
-        isfile(unyts_parameters_.get_user_folder() + 'temperature_ratio_conversions.cache') and \
-        isfile(unyts_parameters_.get_user_folder() + 'unitless_names.cache'):
-
+class _LoadedDictionary(dict):
+    """
+    The units dictionary once loaded, a dict.
+    """
+    __slots__ = ()
+
+
+class _UnitsDictionary(_LoadedDictionary):
+    """
+    The units dictionary before loading the units, that loads them, from cache or from the definitions, the first time
+    it is read. Once loaded, `load_units` makes it a _LoadedDictionary, without the checks of these methods.
+    """
+    __slots__ = ()
+
+    def _load(self) -> None:
+        from .database import load_units
+        load_units()
+
+    def __missing__(self, key):
+        self._load()
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        self._load()
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        self._load()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self._load()
+        return dict.__len__(self)
+
+    def get(self, key, default=None):
+        self._load()
+        return dict.get(self, key, default)
+
+    def keys(self):
+        self._load()
+        return dict.keys(self)
+
+    def values(self):
+        self._load()
+        return dict.values(self)
+
+    def items(self):
+        self._load()
+        return dict.items(self)
+
+
+class _UnitsKinds(dict):
+    """
+    The registry of the kind of each unit listed in the dictionary, that parses the names not listed with the rules of
+    the composite kinds the first time they are looked for, and keeps the kind found.
+    """
+    __slots__ = ()
+
+    def _parse(self, key):
+        if type(key) is not str or dict.__len__(self) == 0:  # not filled yet
+            return None
+        kind = _parse_kind(key)
+        if kind is not None:
+            self[key] = kind
+        return kind
+
+    def __missing__(self, key):
+        kind = self._parse(key)
+        if kind is None:
+            raise KeyError(key)
+        return kind
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or self._parse(key) is not None
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        kind = self._parse(key)
+        return default if kind is None else kind
+
+
+# the units dictionary is empty until `load_units` in `database` fills it, from cache or from the definitions, the first
+# time it is read, so importing unyts doesn't read or build the dictionary
+dictionary = _UnitsDictionary()
+temperatureRatioConversions = {}
+unitless_names = []
+_units_kinds = _UnitsKinds()  # the kind of each unit in the dictionary, for the Unit class and the `units` factory
+_kinds_units = {}  # the units of each kind of the dictionary as a frozenset, for the membership checks of the converter
+
+
+def _units_cache_files() -> (str, str):
+    """
+    Returns the paths of the cache files of the network and of the dictionary completed with it, each mode of prefix
+    parsing has its own files.
+    """
+    suffix = '_prefixes' if unyts_parameters_.prefix_parsing_ else ''
+    return (unyts_parameters_.get_user_folder() + f"units_network{suffix}.cache",
+            unyts_parameters_.get_user_folder() + f"units_dictionary{suffix}.cache")
+
+
+def _load_cached_dictionary():
+    """
+    Returns the (dictionary, temperature_ratio_conversions, unitless_names) from the cache files, or None if any of them
+    is missing or stale, written by another version or from other definitions.
+    The dictionary is completed while making the network, both must be loaded from cache or both made again.
+    """
+    network_cache, dictionary_cache = _units_cache_files()
+    if unyts_parameters_.reload_ or not valid_cache(network_cache):
+        return None
+    cached = [read_cache(dictionary_cache)] + [read_cache(unyts_parameters_.get_user_folder() + each) for each in
+                                               ('temperature_ratio_conversions.cache', 'unitless_names.cache')]
+    if None in cached:
+        return None
     try:
-        with open(unyts_parameters_.get_user_folder() + 'units_dictionary.cache', 'r') as f:
-            dictionary = json_load(f)
-        with open(unyts_parameters_.get_user_folder() + 'temperature_ratio_conversions.cache', 'rb') as f:
-            temperatureRatioConversions = pickle_load(f)
-        with open(unyts_parameters_.get_user_folder() + 'unitless_names.cache', 'rb') as f:
-            unitless_names = pickle_load(f)
-        logger.info('units dictionary loaded from cache...')
+        loaded = json_loads(cached[0]), pickle_loads(cached[1]), pickle_loads(cached[2])
     except:
-        unyts_parameters_.reload_ = True
-        dictionary, temperatureRatioConversions, unitless_names = _load_dictionary()
-else:
-    dictionary, temperatureRatioConversions, unitless_names = _load_dictionary()
+        return None
+    logger.info('units dictionary loaded from cache...')
+    return loaded
+
+
+def _fill_dictionary(loaded_dictionary: dict, temperature_ratio_conversions: dict, unitless: list) -> None:
+    """
+    Fills the module dictionaries in place, so the modules that imported them see the loaded units.
+    """
+    dictionary.clear()
+    dictionary.update(loaded_dictionary)
+    temperatureRatioConversions.clear()
+    temperatureRatioConversions.update(temperature_ratio_conversions)
+    unitless_names[:] = unitless
+    _units_kinds.clear()
+    _kinds_units.clear()
+
+
+def _all_units() -> dict:
+    """
+    Returns the name of the kind of each unit in the dictionary. The units found in more than one kind are of the first
+    kind of the dictionary that has them.
+    """
+    units_kinds = {}
+    for kind in reversed(list(dictionary)):
+        units_kinds.update(zip(dictionary[kind], repeat(kind)))
+    return units_kinds
+
+
+def _load_units_kinds() -> dict:
+    """
+    Returns the registry of the kind of each unit, filled the first time it is required.
+    """
+    if len(_units_kinds) == 0:
+        from .database import load_units
+        load_units()
+        _units_kinds.update(_all_units())
+    return _units_kinds
+
+
+def _add_unit(kind: str, unit_name: str) -> None:
+    """
+    Adds `unit_name` to the units of `kind` of the loaded dictionary, updating the registry and the set of the kind.
+    """
+    units = dictionary[kind]
+    dictionary[kind] = units + (unit_name,) if type(units) is tuple else list(units) + [unit_name]
+    _kinds_units.pop(kind, None)
+    if len(_units_kinds) > 0:
+        _units_kinds.setdefault(unit_name, kind)
+
+
+def _kind_units(kind: str) -> frozenset:
+    """
+    Returns the units of `kind` as a frozenset, made the first time it is required, to check the membership of the
+    units without scanning the tuples of the dictionary.
+    """
+    try:
+        return _kinds_units[kind]
+    except KeyError:
+        _kinds_units[kind] = frozenset(dictionary[kind])
+        return _kinds_units[kind]
+
+
+# the composite kinds as rules of the kinds of their components and the literals between them, i.e.: a Rate is a Volume,
+# a Weight or a Data over a Time. Their combinations are not listed in the dictionary, a name is of a composite kind if
+# it parses with one of its rules. The kinds of the components are capitalized, the literals are not.
+_composite_kinds = {
+    'Rate': (('Volume', '/', 'Time'), ('Weight', '/', 'Time'), ('Data', '/', 'Time')),
+    'VolumeRatio': (('Volume', '/', 'Volume'),),
+    'Density': (('Mass', '/', 'Volume'),),
+    'Velocity': (('Length', '/', 'Time'),),
+    'Acceleration': (('Length', '/', 'Time', '2'), ('Length', '/', 'Time', '/', 'Time')),
+    'ProductivityIndex': (('Volume', '/', 'Time', '/', 'Pressure'),),
+    'PressureGradient': (('Pressure', '/', 'Length'),),
+    'Pressure': (('Weight', '/', 'Area'),),
+    'TemperatureGradient': (('Temperature', '/', 'Length'),),
+    'Power': (('Energy', '/', 'Time'), ('Voltage', '*', 'Current'), ('Current', '*', 'Voltage'),
+              ('Current', '2*', 'Resistance'), ('Resistance', '*', 'Current', '2')),
+    'Frequency': (('1/', 'Time'),),
+    'Conductance': (('1/', 'Resistance'),),
+    'Capacitance': (('Charge', '/', 'Voltage'),),
+    'Charge': (('Capacitance', '*', 'Voltage'), ('Voltage', '*', 'Capacitance')),
+    'Voltage': (('Current', '*', 'Resistance'), ('Resistance', '*', 'Current'), ('Power', '/', 'Current')),
+    'Current': (('Voltage', '/', 'Resistance'), ('Power', '/', 'Voltage')),
+    'Resistance': (('Voltage', '/', 'Current'),),
+}
 
 
-def _all_units():
-    return set([each for units in dictionary.values() for each in units])
+def _resolve_prefix(name: str) -> bool:
+    """
+    Makes the prefixed unit `name`, adding it to the units of its kind, if the units are loaded with prefix parsing and
+    `name` is a prefixed unit not made yet. Returns True if `name` is a unit of the network.
+    """
+    from . import database
+    return database._loaded and bool(database.units_network.prefixes) and database.resolve_prefix(name)
+
+
+def _is_kind(name: str, kind: str, depth: int = 2) -> bool:
+    """
+    Returns True if `name` is listed in the units of `kind`, or is a prefixed unit of `kind` made when first required,
+    is the product of a listed product in reverse order, or parses with a rule of `kind`, with components of composite
+    kinds up to `depth` levels.
+    """
+    units = _kind_units(kind) if kind in dictionary else frozenset()  # i.e.: VolumeRatio is only made of its rules
+    if name in units:
+        return True
+    if len(units) > 0 and _resolve_prefix(name) and name in _kind_units(kind):  # a prefixed unit made just now
+        return True
+    if name.count('*') == 1 and '/' not in name and '*'.join(reversed(name.split('*'))) in units:
+        return True
+    return depth > 0 and any(_parse_rule(name, rule, depth - 1) for rule in _composite_kinds.get(kind, ()))
+
+
+def _parse_rule(name: str, rule: tuple, depth: int) -> bool:
+    """
+    Returns True if `name` is made of the components of the kinds of `rule` and its literals, in the same order.
+    """
+    if len(rule) == 0:
+        return len(name) == 0
+    token, rule = rule[0], rule[1:]
+    if not token[0].isupper():  # a literal
+        return name.startswith(token) and _parse_rule(name[len(token):], rule, depth)
+    if len(rule) == 0:
+        return _is_kind(name, token, depth)
+    # the component of the kind ends before any of the occurrences of the literal following it
+    end = name.find(rule[0], 1)
+    while end > 0:
+        if _is_kind(name[:end], token, depth) and _parse_rule(name[end:], rule, depth):
+            return True
+        end = name.find(rule[0], end + 1)
+    return False
+
+
+def _parse_kind(name: str):
+    """
+    Returns the kind of the unit `name` not listed in the dictionary, the first composite kind of the dictionary that
+    parses it, or None.
+    """
+    if name.count('*') == 1 and '/' not in name:  # the products are of the same kind in any order
+        kind = dict.get(_units_kinds, '*'.join(reversed(name.split('*'))))
+        if kind is not None:
+            return kind
+    for kind in chain(dictionary, _composite_kinds):
+        if kind in _composite_kinds and _is_kind(name, kind):
+            return kind
+    return None
+
+
+def _enumerate_kind(kind: str, limit: int = 1000) -> list:
+    """
+    Returns up to `limit` units of `kind`, the ones listed in the dictionary followed by the combinations of the units
+    of the kinds of its rules, i.e.: to list them in the GUI.
+    """
+    names, seen = [], set()
+    combinations = (''.join(parts) for rule in _composite_kinds.get(kind, ())
+                    for parts in product(*[dictionary[token] if token[0].isupper() else (token,) for token in rule]))
+    for name in chain(dictionary.get(kind, ()), combinations):
+        if len(names) >= limit:
+            break
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+class _KindUnits(object):
+    """
+    The units of a kind in the dictionary, as the `class_units` of the Unit classes, loading the units the first time
+    they are read.
+    """
+    __slots__ = ('kind',)
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+
+    def __get__(self, instance, owner):
+        from .database import load_units
+        load_units()
+        return dictionary[self.kind]
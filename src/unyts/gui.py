@@ -18,7 +18,7 @@ from tkinter import ttk
 from stringthings import get_number, is_numeric
 from unyts import __version__ as unyts_version
 from .converter import convert
-from .dictionaries import _all_units
+from .dictionaries import _load_units_kinds
 from .errors import NoConversionFoundError, NoFVFError, SearchTimeoutError
 from .database import save_memory, load_memory, clean_memory, delete_cache, units_network  # set_fvf
 from .parameters import unyts_parameters_  # set_density
@@ -29,7 +29,7 @@ from sys import platform
 
 
 class UnytsApp(tk.Frame):
-    _all_units_str = _all_units()
+    _units_kinds = _load_units_kinds()
 
     def __init__(self, master=None):
         super().__init__(master)
@@ -118,13 +118,13 @@ class UnytsApp(tk.Frame):
         # self.input_button.bind('<ButtonRelease>', self._get_input)
 
     def _validate_from_units(self, *args):
-        if self.from_unit_val.get() not in UnytsApp._all_units_str and not is_numeric(self.from_unit_val.get()):
+        if self.from_unit_val.get() not in UnytsApp._units_kinds and not is_numeric(self.from_unit_val.get()):
             return False
         else:
             return True
 
     def _validate_to_units(self, *args):
-        if self.to_unit_val.get() not in UnytsApp._all_units_str and not is_numeric(self.to_unit_val.get()):
+        if self.to_unit_val.get() not in UnytsApp._units_kinds and not is_numeric(self.to_unit_val.get()):
             return False
         else:
             return True
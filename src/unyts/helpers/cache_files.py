@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 09:18:33 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+__version__ = '0.1.0'
+__release__ = 20261020
+__all__ = ['read_cache', 'write_cache', 'update_cache', 'valid_cache', 'cache_header', 'definitions_hash']
+
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from hashlib import sha256
+from json import dumps as json_dumps, loads as json_loads
+from pathlib import Path
+from tempfile import gettempdir
+from uuid import uuid4
+
+try:
+    import fcntl
+    _fcntl_ = True
+except ModuleNotFoundError:
+    _fcntl_ = False
+try:
+    import msvcrt
+    _msvcrt_ = True
+except ModuleNotFoundError:
+    _msvcrt_ = False
+
+_magic = b'UNYTS-CACHE '
+_format = 1
+# the modules defining the units dictionary, the network and the classes cached, a change in any of them makes the
+# caches stale
+_definitions = ('dictionaries.py', 'database.py', 'network.py', 'memory.py', 'units/def_*.py')
+
+
+@lru_cache(maxsize=1)
+def definitions_hash() -> str:
+    """
+    Returns the SHA-256 hash of the source of the modules defining the units dictionary and network.
+    """
+    package = Path(__file__).parent.parent
+    digest = sha256()
+    for pattern in _definitions:
+        for path in sorted(package.glob(pattern)):
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_header() -> dict:
+    """
+    Returns the header expected in the cache files, with the format, unyts version and the hash of the definitions.
+    """
+    from .. import __version__ as unyts_version
+    return {'format': _format, 'unyts': unyts_version, 'definitions': definitions_hash()}
+
+
+def _lock_path(path) -> str:
+    """
+    Returns the path of the `.lock` file of the cache file at `path`, in a folder of the temporary directory, named
+    by the hash of the absolute path so the package folder is not filled with lock files.
+    """
+    folder = os.path.join(gettempdir(), f"unyts-locks-{os.getuid()}" if hasattr(os, 'getuid') else 'unyts-locks')
+    os.makedirs(folder, exist_ok=True)
+    return os.path.join(folder, sha256(os.path.abspath(path).encode()).hexdigest()[:16] + '.lock')
+
+
+@contextmanager
+def _locked(path, exclusive: bool):
+    """
+    Holds an advisory lock on the `.lock` file of `path`, shared to read or exclusive to write.
+    Without `fcntl` or `msvcrt` the files are only protected by the atomic replacement.
+    """
+    with open(_lock_path(path), 'a+b') as lock:
+        if _fcntl_:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        elif _msvcrt_:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if _fcntl_:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+            elif _msvcrt_:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _read(path, header_only: bool = False):
+    # must be called holding the lock
+    if not os.path.isfile(path):
+        return None
+    with open(path, 'rb') as f:
+        first_line = f.readline()
+        if not first_line.startswith(_magic):
+            return None
+        try:
+            header = json_loads(first_line[len(_magic):])
+        except ValueError:
+            return None
+        if header != cache_header():
+            return None
+        return b'' if header_only else f.read()
+
+
+def _write(path, payload: bytes) -> None:
+    # must be called holding the lock
+    temporary = f"{os.path.abspath(path)}.{uuid4().hex}.tmp"
+    # created as `open` does, the umask of the process applies to the 0o666 permissions
+    descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with os.fdopen(descriptor, 'wb') as f:
+            f.write(_magic + json_dumps(cache_header()).encode() + b'\n')
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def read_cache(path):
+    """
+    Returns the payload of the cache file at `path`, as bytes, or None if the file does not exist or is stale, written
+    by another version of unyts or from other definitions of the units. Stale files are removed.
+    """
+    if not os.path.isfile(path):
+        return None
+    with _locked(path, exclusive=False):
+        payload = _read(path)
+    if payload is None and os.path.isfile(path):
+        with _locked(path, exclusive=True):
+            if os.path.isfile(path) and _read(path) is None:
+                os.remove(path)
+    return payload
+
+
+def valid_cache(path) -> bool:
+    """
+    Returns True if the cache file at `path` exists and is not stale, reading only its header.
+    """
+    if not os.path.isfile(path):
+        return False
+    with _locked(path, exclusive=False):
+        return _read(path, header_only=True) is not None
+
+
+def write_cache(path, payload: bytes) -> None:
+    """
+    Writes the `payload` bytes to the cache file at `path`, after the header, into a temporary file that replaces the
+    previous one when complete, so other processes read either the whole previous file or the whole new one.
+    """
+    with _locked(path, exclusive=True):
+        _write(path, payload)
+
+
+def update_cache(path, merge) -> None:
+    """
+    Replaces the cache file at `path` by the bytes returned by `merge(payload)`, where `payload` is the current content
+    of the file or None, holding the lock from reading to writing so no other process saves in between.
+    """
+    with _locked(path, exclusive=True):
+        _write(path, merge(_read(path)))
@@ -24,12 +24,8 @@ try:
     _numpy_ = True
 except ModuleNotFoundError:
     _numpy_ = False
-try:
-    from pandas import Series, DataFrame
-
-    _pandas_ = True
-except ModuleNotFoundError:
-    _pandas_ = False
+# pandas is imported by whoever makes a Series or DataFrame, not by unyts
+from .pandas_types import Series, DataFrame, _pandas_
 
 if _numpy_ and _pandas_:
     number_ = (int, float, complex, int32, int64, float32, float64)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 09:31:05 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+__version__ = '0.1.0'
+__release__ = 20261022
+__all__ = ['Series', 'DataFrame']
+
+import sys
+from importlib.util import find_spec
+
+_pandas_ = find_spec('pandas') is not None
+
+
+class _PandasType(type):
+    """
+    Checks the instances against the pandas class of the same name, without importing pandas: an object can only be a
+    Series or DataFrame if pandas was already imported by whoever made it.
+    """
+    def _pandas_class(cls):
+        pandas = sys.modules.get('pandas')
+        return None if pandas is None else getattr(pandas, cls.__name__, None)
+
+    def __instancecheck__(cls, instance) -> bool:
+        pandas_class = cls._pandas_class()
+        return pandas_class is not None and isinstance(instance, pandas_class)
+
+    def __subclasscheck__(cls, subclass) -> bool:
+        pandas_class = cls._pandas_class()
+        return pandas_class is not None and issubclass(subclass, pandas_class)
+
+
+class Series(metaclass=_PandasType):
+    """
+    Stands for `pandas.Series` in the `isinstance` checks and type hints, without importing pandas.
+    """
+
+
+class DataFrame(metaclass=_PandasType):
+    """
+    Stands for `pandas.DataFrame` in the `isinstance` checks and type hints, without importing pandas.
+    """
@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:12:47 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+__version__ = '0.1.0'
+__release__ = 20261019
+__all__ = ['ConversionMemory', 'ConversionPlan']
+
+from collections import OrderedDict
+from importlib import import_module
+from threading import RLock
+from types import FunctionType
+
+_policies = ('LRU', 'LFU')
+_missing = object()
+
+
+class ConversionPlan(object):
+    """
+    A plain-data description of a memorized conversion, to be saved and loaded without pickling functions.
+    It is called as the conversion itself, and builds the conversion function the first time it is called:
+      - 'factor' plans keep the (scale, offset) of an affine conversion `x * scale + offset`.
+      - 'nodes' plans keep the names of the nodes along a path of the network, applying the conversions of its edges.
+      - 'function' plans keep the 'module:name' of a conversion function defined at module level, i.e.: `equality`.
+    """
+    __slots__ = ('kind', 'data', '_function')
+
+    def __init__(self, kind: str, data) -> None:
+        if kind not in ('factor', 'nodes', 'function'):
+            raise ValueError(f"valid conversion plans are 'factor', 'nodes' and 'function' not {kind}.")
+        self.kind, self.data, self._function = kind, data, None
+
+    @classmethod
+    def from_conversion(cls, conversion, conversion_path, graph=None):
+        """
+        Returns the plan of a `conversion` function found through `conversion_path`, or None if it can not be described
+        as plain data, i.e.: a composition of conversions that is not affine.
+        The path of nodes is preferred whenever it is known. The `conversion` is only evaluated to get its factor if
+        every step of its path is known to be affine, as the conversions depending on the FVF or the density would ask
+        for them, raise an error, or keep their current value in the plan.
+        """
+        from .converter import _probe_factor
+        if isinstance(conversion, ConversionPlan):
+            return conversion
+        if graph is not None and conversion_path is not None and len(conversion_path) > 1 and \
+                all(type(node) is not str and hasattr(node, 'get_name') for node in conversion_path) and \
+                all(graph.has_node(node) for node in conversion_path) and \
+                all(conversion_path[i + 1] in graph.children_of(conversion_path[i])
+                    for i in range(len(conversion_path) - 1)):
+            return cls('nodes', [node.get_name() for node in conversion_path])
+        if type(conversion) is FunctionType and conversion.__module__ is not None and \
+                '<locals>' not in conversion.__qualname__ and '<lambda>' not in conversion.__qualname__:
+            return cls('function', f"{conversion.__module__}:{conversion.__qualname__}")
+        factor = _probe_factor(conversion) if _affine_path(conversion_path, graph) else None
+        if factor is not None:
+            return cls('factor', list(factor))
+        return None
+
+    def _build(self):
+        from .converter import _affine_conversion, _function_conversion
+        if self.kind == 'factor':
+            return _affine_conversion(*self.data)
+        if self.kind == 'nodes':
+            return _function_conversion(self.data)
+        module, name = self.data.split(':')
+        function = import_module(module)
+        for attribute in name.split('.'):
+            function = getattr(function, attribute)
+        return function
+
+    def __call__(self, x):
+        if self._function is None:
+            self._function = self._build()
+        return self._function(x)
+
+    def to_record(self) -> list:
+        return [self.kind, self.data]
+
+    @classmethod
+    def from_record(cls, record: list):
+        return cls(record[0], record[1])
+
+    def __repr__(self) -> str:
+        return f"ConversionPlan('{self.kind}', {self.data!r})"
+
+
+class _LRUStore(object):
+    """
+    Entries kept in order of use, the least recently used is the first one to be evicted.
+    """
+    __slots__ = ('entries',)
+
+    def __init__(self) -> None:
+        self.entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self.entries
+
+    def peek(self, key):
+        return self.entries[key]
+
+    def touch(self, key):
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def set(self, key, value) -> None:
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+
+    def pop(self, key):
+        return self.entries.pop(key)
+
+    def evict(self):
+        return self.entries.popitem(last=False)[0]
+
+    def items(self):
+        """
+        Returns the entries in order of eviction.
+        """
+        return list(self.entries.items())
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+class _LFUStore(object):
+    """
+    Entries grouped by number of uses, the least frequently used is the first one to be evicted, and among them the
+    least recently used.
+    """
+    __slots__ = ('entries', 'counts', 'buckets', 'min_count')
+
+    def __init__(self) -> None:
+        self.entries, self.counts, self.buckets, self.min_count = {}, {}, {}, 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self.entries
+
+    def peek(self, key):
+        return self.entries[key]
+
+    def _unlink(self, key) -> int:
+        count = self.counts.pop(key)
+        del self.buckets[count][key]
+        if len(self.buckets[count]) == 0:
+            del self.buckets[count]
+            if self.min_count == count:
+                # a used key moves to the next count, a removed key leaves the minimum to the remaining ones
+                self.min_count = min(self.buckets) if len(self.buckets) > 0 else count + 1
+        return count
+
+    def _link(self, key, count: int) -> None:
+        self.counts[key] = count
+        self.buckets.setdefault(count, OrderedDict())[key] = None
+        if count < self.min_count or len(self.counts) == 1:
+            self.min_count = count
+
+    def touch(self, key):
+        self._link(key, self._unlink(key) + 1)
+        return self.entries[key]
+
+    def set(self, key, value) -> None:
+        self.entries[key] = value
+        self._link(key, self._unlink(key) + 1 if key in self.counts else 1)
+
+    def pop(self, key):
+        self._unlink(key)
+        return self.entries.pop(key)
+
+    def evict(self):
+        key = next(iter(self.buckets[self.min_count]))
+        self.pop(key)
+        return key
+
+    def items(self):
+        """
+        Returns the entries in order of eviction.
+        """
+        return [(key, self.entries[key]) for count in sorted(self.buckets) for key in self.buckets[count]]
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.counts.clear()
+        self.buckets.clear()
+        self.min_count = 0
+
+
+class ConversionMemory(object):
+    """
+    Bounded memory of the conversions already solved, mapping (from_unit, to_unit) to (conversion, conversion_path).
+    The positive results and the negative results, where the conversion is None, are kept apart and limited separately
+    to `limit` and `negative_limit` entries, evicting the least recently used ('LRU' policy) or the least frequently
+    used ('LFU' policy) when full. A limit of None means unlimited.
+    It behaves as the dictionary used before, and counts the hits, misses and evictions in `stats`, which are merged
+    with the counters saved in the cache file by `merge_stats`.
+    A `shared` cache, see SharedConversionCache, can be attached as a second tier: the conversions not memorized are
+    looked up there before counting a miss, and the conversions memorized are also saved there for other processes.
+    The changes are guarded by a lock, while the reads only look up the dictionaries of entries, and update the order
+    of use if the lock is free or leave it `pending` for the next change, so reading from many threads never waits.
+    """
+    __slots__ = ('policy', 'limit', 'negative_limit', 'positive', 'negative', 'stats', 'shared', '_lock', '_pending',
+                 '_saved_stats')
+
+    def __init__(self, limit: int = None, negative_limit: int = None, policy: str = 'LRU') -> None:
+        if policy not in _policies:
+            raise ValueError(f"valid memory policies are 'LRU' and 'LFU' not {policy}.")
+        self.policy, self.limit, self.negative_limit = policy, limit, negative_limit
+        store = _LRUStore if policy == 'LRU' else _LFUStore
+        self.positive, self.negative = store(), store()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'shared_hits': 0}
+        self._saved_stats = {}
+        self.shared = None
+        self._lock = RLock()
+        self._pending = []
+
+    @staticmethod
+    def _is_negative(value) -> bool:
+        return value is None or value[0] is None
+
+    def _store_of(self, key):
+        if key in self.positive:
+            return self.positive
+        if key in self.negative:
+            return self.negative
+        return None
+
+    def __len__(self) -> int:
+        return len(self.positive) + len(self.negative)
+
+    def __contains__(self, key) -> bool:
+        return key in self.positive or key in self.negative
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def _peek(self, key):
+        value = self.positive.entries.get(key, _missing)
+        return self.negative.entries.get(key, _missing) if value is _missing else value
+
+    def _use(self, key) -> None:
+        # must be called holding the lock
+        self.stats['hits'] += 1
+        store = self._store_of(key)
+        if store is not None:  # unless evicted since it was read
+            store.touch(key)
+
+    def _apply_pending(self) -> None:
+        # must be called holding the lock
+        while len(self._pending) > 0:
+            self._use(self._pending.pop())
+
+    def _hit(self, key) -> None:
+        if self._lock.acquire(blocking=False):
+            try:
+                self._apply_pending()
+                self._use(key)
+            finally:
+                self._lock.release()
+        else:
+            self._pending.append(key)
+
+    def __getitem__(self, key):
+        value = self._peek(key)
+        if value is _missing:
+            raise KeyError(key)
+        self._hit(key)
+        return value
+
+    def get(self, key, default=None):
+        """
+        Returns the memorized conversion of `key`, counting the hit or miss, or `default` if not memorized.
+        """
+        value = self._peek(key)
+        if value is _missing:
+            value = self.shared.get(key, _missing) if self.shared is not None else _missing
+            with self._lock:
+                if value is _missing:
+                    self.stats['misses'] += 1
+                    return default
+                self.stats['shared_hits'] = self.stats.get('shared_hits', 0) + 1
+                self._set(key, value)
+            return value
+        self._hit(key)
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        self._set(key, value)
+        if self.shared is not None:
+            self.shared.put(key, value)
+
+    def _set(self, key, value) -> None:
+        with self._lock:
+            self._apply_pending()
+            store, limit = (self.negative, self.negative_limit) if self._is_negative(value) else \
+                (self.positive, self.limit)
+            previous = self._store_of(key)
+            if previous is not None and previous is not store:
+                previous.pop(key)
+            if key not in store and limit is not None:
+                # make room before adding the key, otherwise a new entry would be the least frequently used
+                self._shrink(store, limit - 1)
+            store.set(key, value)
+            self._shrink(store, limit)
+
+    def __delitem__(self, key) -> None:
+        with self._lock:
+            store = self._store_of(key)
+            if store is None:
+                raise KeyError(key)
+            store.pop(key)
+
+    def _shrink(self, store, limit) -> None:
+        while limit is not None and len(store) > max(limit, 0):
+            store.evict()
+            self.stats['evictions'] += 1
+
+    def keys(self) -> list:
+        return [key for key, _ in self.items()]
+
+    def values(self) -> list:
+        return [value for _, value in self.items()]
+
+    def items(self) -> list:
+        """
+        Returns the (key, value) pairs, negative results first, each in order of eviction.
+        """
+        with self._lock:
+            self._apply_pending()
+            return self.negative.items() + self.positive.items()
+
+    def update(self, other) -> None:
+        """
+        Adds the entries of `other`, a mapping or (key, value) pairs, without saving them to the shared cache.
+        """
+        with self._lock:
+            for key, value in (other.items() if hasattr(other, 'items') else other):
+                self._set(key, value)
+
+    def copy(self) -> dict:
+        return dict(self.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self.positive.clear()
+            self.negative.clear()
+
+    def resize(self, limit: int = None, negative_limit: int = None, policy: str = None) -> None:
+        """
+        Changes the limits and policy of the memory, evicting the entries exceeding the new limits.
+        """
+        policy = self.policy if policy is None else policy
+        if policy not in _policies:
+            raise ValueError(f"valid memory policies are 'LRU' and 'LFU' not {policy}.")
+        with self._lock:
+            if policy != self.policy:
+                entries = self.items()
+                store = _LRUStore if policy == 'LRU' else _LFUStore
+                self.positive, self.negative, self.policy = store(), store(), policy
+                for key, value in entries:
+                    (self.negative if self._is_negative(value) else self.positive).set(key, value)
+            self.limit, self.negative_limit = limit, negative_limit
+            self._shrink(self.positive, self.limit)
+            self._shrink(self.negative, self.negative_limit)
+
+    def attach(self, shared=None) -> None:
+        """
+        Sets the `shared` cache consulted when a conversion is not memorized, or detaches it if None.
+        """
+        with self._lock:
+            self.shared = shared
+
+    def get_stats(self) -> dict:
+        """
+        Returns the counters of hits, misses and evictions, and the number of positive and negative entries.
+        """
+        with self._lock:
+            self._apply_pending()
+            return dict(self.stats, positive=len(self.positive), negative=len(self.negative), policy=self.policy,
+                        limit=self.limit, negative_limit=self.negative_limit)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._apply_pending()
+            self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'shared_hits': 0}
+            self._saved_stats = {}
+
+    def merge_stats(self, saved: dict) -> dict:
+        """
+        Returns the `saved` counters of a cache file plus the ones counted since this memory was last saved or loaded,
+        and keeps them as the counters of this memory, so saving or loading again does not count anything twice.
+        """
+        with self._lock:
+            self._apply_pending()
+            merged = dict(saved)
+            for counter, count in self.stats.items():
+                merged[counter] = merged.get(counter, 0) + count - self._saved_stats.get(counter, 0)
+            self.stats, self._saved_stats = merged, dict(merged)
+            return dict(merged)
+
+    def __getstate__(self) -> dict:
+        return {'policy': self.policy, 'limit': self.limit, 'negative_limit': self.negative_limit,
+                'entries': self.items(), 'stats': self.stats, 'saved_stats': self._saved_stats}
+
+    def to_records(self, graph=None) -> list:
+        """
+        Returns the memory as a list of JSON serializable [from_unit, to_unit, plan, path] records, negative results
+        first, each in order of eviction. The plan and path of negative results are None, and the conversions that can
+        not be described as plain data are left out, they will be searched again.
+        """
+        records = []
+        for (from_unit, to_unit), value in self.items():
+            if self._is_negative(value):
+                records.append([from_unit, to_unit, None, None])
+                continue
+            plan = ConversionPlan.from_conversion(value[0], value[1], graph)
+            path = _encode_path(value[1])
+            if plan is not None and path is not None:
+                records.append([from_unit, to_unit, plan.to_record(), path])
+        return records
+
+    def merge_records(self, saved: list, records: list) -> list:
+        """
+        Returns the `saved` records updated with the `records` of this memory, taken as the most recently used, and
+        limited as this memory, evicting the oldest saved records first.
+        """
+        merged = {}
+        for record in saved + records:
+            merged.pop((record[0], record[1]), None)
+            merged[(record[0], record[1])] = record
+        negative = [record for record in merged.values() if record[2] is None]
+        positive = [record for record in merged.values() if record[2] is not None]
+        if self.negative_limit is not None:
+            negative = negative[max(len(negative) - self.negative_limit, 0):]
+        if self.limit is not None:
+            positive = positive[max(len(positive) - self.limit, 0):]
+        return negative + positive
+
+    def update_records(self, records: list, graph=None) -> None:
+        """
+        Adds the conversions in the `records` made by `to_records`, as plans that build their conversion functions
+        the first time they are used.
+        """
+        with self._lock:
+            for from_unit, to_unit, plan, path in records:
+                if plan is None:
+                    self._set((from_unit, to_unit), (None, None))
+                else:
+                    self._set((from_unit, to_unit), (ConversionPlan.from_record(plan), _decode_path(path, graph)))
+
+    def __setstate__(self, state: dict) -> None:
+        ConversionMemory.__init__(self, state['limit'], state['negative_limit'], state['policy'])
+        for key, value in state['entries']:
+            self._set(key, value)
+        self.stats = dict(state['stats'])
+        self._saved_stats = dict(state.get('saved_stats', {}))
+
+
+def _affine_path(conversion_path, graph=None) -> bool:
+    """
+    Returns True if every step of `conversion_path` is known to be affine, so its conversion can be evaluated safely:
+    the conversions between its nodes have an affine factor in `graph`, and it is not a conversion through the density.
+    """
+    if conversion_path is None:
+        return False
+    if len(conversion_path) == 2 and conversion_path[0] in ('*', '/') and type(conversion_path[1]) is not str:
+        return False  # ['*', density] or ['/', density]
+    for i, step in enumerate(conversion_path):
+        if type(step) is str or not hasattr(step, 'get_name'):
+            continue
+        if graph is None or not graph.has_node(step):
+            return False
+        following = conversion_path[i + 1] if i + 1 < len(conversion_path) else None
+        if following is not None and type(following) is not str and hasattr(following, 'get_name') and \
+                (following not in graph.children_of(step) or graph.factor(step, following) is None):
+            return False
+    return True
+
+
+def _encode_path(conversion_path):
+    """
+    Returns the `conversion_path` as a JSON serializable list, where the nodes are {'node': name} dictionaries, or None
+    if some step of the path can not be serialized.
+    """
+    if conversion_path is None:
+        return None
+    path = []
+    for step in conversion_path:
+        if hasattr(step, 'get_name'):
+            path.append({'node': step.get_name()})
+        elif type(step) in (str, int, float, bool):
+            path.append(step)
+        else:
+            return None
+    return path
+
+
+def _decode_path(path: list, graph=None) -> list:
+    """
+    Returns the conversion path encoded by `_encode_path`, with the nodes of the `graph`, or new nodes if not found.
+    """
+    from .network import UNode
+    if path is None:
+        return None
+    return [(graph.get_node(step['node']) if graph is not None and graph.has_node(step['node'])
+             else UNode(step['node'])) if type(step) is dict else step for step in path]
@@ -6,14 +6,18 @@ Created on Sat Oct 24 12:36:48 2020
 @author: Martín Carlos Araya <martinaraya@gmail.com>
 """
 import logging
-from os.path import isfile
+from json import dumps as json_dumps, loads as json_loads
+from hashlib import sha256
+from types import CodeType, MethodType
 
 from .errors import NoFVFError
+from .memory import ConversionMemory
 from .parameters import unyts_parameters_
+from .helpers.cache_files import read_cache, update_cache
 from .helpers.logger import logger
 
 try:
-    from cloudpickle import dump as cloudpickle_dump, load as cloudpickle_load
+    import cloudpickle
     _cloudpickle_ = True
 except ModuleNotFoundError:
     _cloudpickle_ = False
@@ -21,7 +25,7 @@ except ModuleNotFoundError:
 
 __version__ = '0.4.22'
 __release__ = 20250504
-__all__ = ['UNode', 'UDigraph', 'Conversion']
+__all__ = ['UNode', 'UDigraph', 'Conversion', 'affine_factor']
 
 
 class UNode(object):
@@ -42,59 +46,116 @@ class UDigraph(object):
     A class to store the digraph containing the units network and methods to facilitate its use.
     The `edges` attribute is a dict mapping each node to a list of its children
     The `children_of` method returns the list of nodes with direct relation to the key node. This method will be used by the search algorithms.
+    The `_nodes` attribute is a dict mapping each unit name to its node, to look up nodes by name in constant time.
+    The `_parents` attribute is a dict mapping each node to the list of nodes with an edge to it, the reverse of `edges`.
+    The `_factors` attribute is a dict mapping each (source, destination) edge to its (scale, offset) affine factor,
+    or None if the conversion is not affine.
+    The `prefixes` attribute is a dict mapping each unit name to the prefixes it takes, as (table, position, kind), when
+    its prefixed units are made the first time they are used instead of with the network.
+    The `_aliases` attribute is a dict mapping each synonym removed by `collapse_synonyms` to the node that represents
+    it, the canonical node of its synonyms class.
+    The `_custom` attribute is the list of signatures of the conversions set by the user, see `custom_hash`.
     """
-    __slots__ = ('edges', '_edges_str', 'previous', 'recursion_limit', 'fvf', 'memory', 'print', '_cloudpickle_')
+    __slots__ = ('edges', '_nodes', '_aliases', '_factors', '_parents', '_edges_str', '_version', '_compact', '_roots',
+                 '_reachability', '_descendants', 'recursion_limit', 'fvf', 'memory', 'print', '_cloudpickle_',
+                 'prefixes', '_custom')
 
     def __init__(self) -> None:
         self.edges = {}
+        self._nodes = {}
+        self._aliases = {}
+        self._factors = {}
+        self._parents = {}
         self._edges_str = None
-        self.previous = [(None, None)]
+        self._version = 0
+        self._compact = None
+        self._roots = None
+        self._reachability = None
+        self._descendants = None
+        self.prefixes = {}
+        self._custom = []
         self.recursion_limit = 5
         self.fvf = None
-        self.memory = {}
+        self.memory = self._new_memory()
         self.print = False
         self._cloudpickle_ = _cloudpickle_
         if unyts_parameters_.cache_ and unyts_parameters_.memory_:
             self.load_memory()
 
+    @property
+    def version(self) -> int:
+        """
+        The number of changes applied to the network, to invalidate the data computed from a previous version.
+        """
+        return self._version
+
+    def add_custom(self, src: str, dest: str, conversion) -> None:
+        """
+        Records the `conversion` from `src` to `dest` set by the user, that is not part of the definitions of the units.
+        """
+        self._custom.append(f"{src}>{dest}:{conversion_signature(conversion)}")
+
+    def custom_hash(self) -> str:
+        """
+        Returns the SHA-256 hash of the conversions set by the user, the same in every process that set the same
+        conversions in any order, or '0' if none was set.
+        """
+        if len(self._custom) == 0:
+            return '0'
+        return sha256('\n'.join(sorted(self._custom)).encode()).hexdigest()
+
+    @staticmethod
+    def _new_memory() -> ConversionMemory:
+        return ConversionMemory(unyts_parameters_.memory_limit_, unyts_parameters_.memory_negative_limit_,
+                                unyts_parameters_.memory_policy_)
+
     def get_edges_str(self) -> dict:
         if self._edges_str is None:
             self._edges_str = {str(k): {str(each) for each in v[0]} for k, v in self.edges.items()}
         return self._edges_str
 
     def save_memory(self, path=None) -> None:
+        """
+        Saves the search memory as JSON, with a plain-data plan of each conversion instead of its function.
+        The conversions already saved by other processes are kept, merged with the ones in this memory.
+        """
         if path is None:
             path = unyts_parameters_.get_user_folder() + 'search_memory.cache'
-        if self._cloudpickle_:
-            logger.info('saving search memory to cache...')
-            with open(path, 'wb') as f:
-                cloudpickle_dump(self.memory, f)
-        else:
-            logger.warning("Missing `cloudpickle` package. Not able to cache search memory.")
+        logger.info('saving search memory to cache...')
+
+        def merge(payload):
+            saved = {'entries': []} if payload is None else json_loads(payload)
+            return json_dumps({'stats': self.memory.merge_stats(saved.get('stats', {})),
+                               'entries': self.memory.merge_records(saved['entries'], self.memory.to_records(self))},
+                              separators=(',', ':')).encode()
+
+        update_cache(path, merge)
 
     def load_memory(self, path=None) -> None:
         if path is None:
             path = unyts_parameters_.get_user_folder() + 'search_memory.cache'
-        if not self._cloudpickle_:
-            logger.warning("Missing `cloudpickle` package. Not able to cache search memory.")
-        if not isfile(unyts_parameters_.get_user_folder() + 'search_memory.cache'):
+        try:
+            payload = read_cache(path)
+        except OSError:
+            payload = None
+        if payload is None:
             msg = "starting clean memory..."
             logger.info(msg)
         else:
             logger.info('loading memory from cache...')
             try:
-                with open(path, 'rb') as f:
-                    cached_memory = cloudpickle_load(f)
-                    self.memory.update(cached_memory)
-                    msg = f"{len(self.memory)} conversion path{'' if len(self.memory) == 1 else 's'} in memory."
-                    logger.info(msg)
+                cached_memory = json_loads(payload)
+                self.memory.update_records(cached_memory['entries'], self)
+                self.memory.merge_stats(cached_memory.get('stats', {}))  # the counters are kept with the memory
+                msg = f"{len(self.memory)} conversion path{'' if len(self.memory) == 1 else 's'} in memory."
+                logger.info(msg)
             except:
                 msg = 'Failed to load memory from cache.'
                 logger.error(msg)
         unyts_parameters_.last_path_str = msg
 
     def clean_memory(self):
-        self.memory = {}
+        self.memory.clear()
         msg = f"memory cleaned."
         if unyts_parameters_.verbose_:
             logger.info(msg)
@@ -104,6 +165,10 @@ class UDigraph(object):
             raise ValueError('Duplicate node')
         else:
             self.edges[node] = [], []
+            # the first node added with a name is the one returned by `get_node`
+            self._nodes.setdefault(node.get_name(), node)
+            self._edges_str = None
+            self._version += 1
 
     def add_edge(self, edge, reverse=False) -> None:
         src = edge.get_source()
@@ -114,25 +179,246 @@ class UDigraph(object):
         if dest not in self.edges[src][0]:  # avoid duplication
             self.edges[src][0].append(dest)
             self.edges[src][1].append(conv)
+            if edge.factor is not None:
+                self._factors[(src, dest)] = edge.get_factor()
+            self._parents.setdefault(dest, []).append(src)
+            self._edges_str = None
+            self._version += 1
 
     def children_of(self, node):
         return self.edges[node][0]
 
+    def parents_of(self, node):
+        """
+        Returns the list of nodes with a direct conversion to the key node, the reverse of `children_of`.
+        """
+        return self._parents.get(node, [])
+
     def has_node(self, node):
         if type(node) is str:
-            return node in [n.get_name() for n in self.edges]
+            return node in self._nodes or node in self._aliases
         else:
             return node in self.edges
 
     def get_node(self, name):
-        result = [n for n in self.edges if n.get_name() == name]
-        if len(result) == 0:
+        try:
+            return self._nodes[name]
+        except KeyError:
+            if name in self._aliases:
+                return self._aliases[name]
+            if self.prefixes:  # the prefixed units are made the first time they are required
+                from .database import resolve_prefix
+                if resolve_prefix(name, self):
+                    return self._nodes[name]
             raise NameError(name)
-        else:
-            return result[0]
 
     def list_nodes(self):
-        return list(set([n.get_name() for n in self.edges.keys()]))
+        return list(self._nodes)
+
+    def aliases(self) -> dict:
+        """
+        Returns the dict mapping each synonym collapsed into another node to the name of that node.
+        """
+        return {alias: node.get_name() for alias, node in self._aliases.items()}
+
+    def with_synonyms(self, names: set) -> set:
+        """
+        Returns the set `names` completed with the synonyms collapsed into the nodes of those names.
+        """
+        return names.union(alias for alias, node in self._aliases.items() if node.get_name() in names)
+
+    def canonical(self, name: str) -> str:
+        """
+        Returns the name of the node representing the unit `name`, that is `name` itself unless it is a synonym.
+        """
+        node = self._aliases.get(name)
+        return name if node is None else node.get_name()
+
+    def collapse_synonyms(self) -> int:
+        """
+        Merges every class of synonyms, the units linked by identity conversions in both directions, i.e.: aliases,
+        case, plural and spaces variants, into a single node, the one with more conversions. The edges of the other
+        nodes of the class are moved to that node, and their names are kept in `_aliases`, so `get_node` and `has_node`
+        still work with any synonym, while the searches don't go through the identity conversions.
+        The classes with other conversions between their units, i.e.: gauge and absolute pressures, are not merged.
+        Returns the number of nodes removed.
+        """
+        parent = {}
+
+        def find(node):
+            root = node
+            while parent.setdefault(root, root) is not root:
+                root = parent[root]
+            while parent[node] is not root:
+                parent[node], node = root, parent[node]
+            return root
+
+        # the unit with more conversions to other units represents the class, or the first one added if tied
+        rank = {node: [0, -i] for i, node in enumerate(self.edges)}
+        identities = []
+        for node, (children, conversions) in self.edges.items():
+            for child in children:
+                if child in self.edges and node in self.edges[child][0] and \
+                        self.factor(node, child) == (1, 0) and self.factor(child, node) == (1, 0):
+                    identities.append((node, child))
+                else:
+                    rank[node][0] += 1
+                    rank.setdefault(child, [0, -len(rank)])[0] += 1
+        for node, child in identities:
+            a, b = find(node), find(child)
+            if a is not b:
+                a, b = (a, b) if rank[a] >= rank[b] else (b, a)
+                parent[b] = a
+        canonical = {node: find(node) for node in parent if find(node) is not node}
+        if len(canonical) == 0:
+            return 0
+        # the classes with conversions other than identities between their own units are left as they are
+        mixed = set()
+        for node, (children, conversions) in self.edges.items():
+            for child in children:
+                if canonical.get(node, node) is canonical.get(child, child) and child is not node and \
+                        self.factor(node, child) != (1, 0):
+                    mixed.add(canonical.get(node, node))
+        canonical = {node: root for node, root in canonical.items() if root not in mixed}
+
+        edges, factors, parents = {}, {}, {}
+        for node, (children, conversions) in self.edges.items():
+            source = canonical.get(node, node)
+            source_children, source_conversions = edges.setdefault(source, ([], []))
+            for child, conversion in zip(children, conversions):
+                target = canonical.get(child, child)
+                if target is source or target in source_children:
+                    continue
+                source_children.append(target)
+                source_conversions.append(conversion)
+                if (node, child) in self._factors:
+                    factors[(source, target)] = self._factors[(node, child)]
+                parents.setdefault(target, []).append(source)
+        self.edges, self._factors, self._parents = edges, factors, parents
+        aliases = {node.get_name(): root for node, root in canonical.items() if self._nodes.get(node.get_name()) is node}
+        self.rebuild_index()
+        # a name is only an alias if no node left in the network has that name
+        self._aliases.update({name: root for name, root in aliases.items() if name not in self._nodes})
+        return len(canonical)
+
+    def rebuild_index(self, cached: bool = False) -> None:
+        """
+        Rebuilds the name to node index from the `edges` dictionary.
+        Must be called after `edges` is modified directly, like when cleaning the network or loading it from cache.
+        If `cached` is True, the edges are the ones of the network saved to cache, and its canonical roots, if they
+        were computed for them, are kept.
+        """
+        roots = getattr(self, '_roots', None) if cached else None
+        if roots is not None and roots.version != getattr(self, '_version', 0):
+            roots = None
+        self._nodes = {}
+        for node in self.edges:
+            self._nodes.setdefault(node.get_name(), node)
+        if not hasattr(self, '_factors'):  # network cached by a previous version
+            self._factors = {}
+        if type(self.memory) is dict:  # network cached by a previous version
+            memory, self.memory = self.memory, self._new_memory()
+            self.memory.update(memory)
+        if not hasattr(self, 'prefixes'):  # network cached by a previous version
+            self.prefixes = {}
+        if not hasattr(self, '_aliases'):  # network cached by a previous version
+            self._aliases = {}
+        if not hasattr(self, '_custom'):  # network cached by a previous version
+            self._custom = []
+        if not hasattr(self, '_parents'):  # network cached by a previous version
+            self._parents = {}
+            for parent, (children, conversions) in self.edges.items():
+                for child in children:
+                    self._parents.setdefault(child, []).append(parent)
+        self._edges_str = None
+        self._version = getattr(self, '_version', 0) + 1
+        self._compact = None
+        self._roots = roots
+        if roots is not None:
+            roots.version = self._version
+        self._reachability = None
+        self._descendants = None
+
+    def update(self, other) -> None:
+        """
+        Takes the nodes, edges and conversions of the `other` network, keeping the memory of this network, with its
+        limits and shared cache, where the conversions memorized by `other` are added, and the FVF if it was set.
+        The canonical roots of `other` are kept if they were computed for its current version.
+        Every slot of UDigraph, and of its bases, is taken from `other`, that must have all of them set.
+        """
+        slots = _slots(UDigraph)
+        missing = [attribute for attribute in slots if not hasattr(other, attribute)]
+        if len(missing) > 0:
+            raise AttributeError(f"the network to take is missing the attributes: {', '.join(missing)}")
+        memory, fvf = self.memory, self.fvf
+        roots = other._roots
+        for attribute in slots:
+            setattr(self, attribute, getattr(other, attribute))
+        memory.update(other.memory)
+        self.memory = memory
+        self.fvf = other.fvf if fvf is None else fvf
+        self._roots = roots if roots is not None and roots.version == other.version else None
+        self._version = other.version + 1
+        if self._roots is not None:
+            self._roots.version = self._version
+        self._compact = self._reachability = self._descendants = None
+
+    def compact(self):
+        """
+        Returns the CompactUDigraph representation of this network, compiling it again if the network changed.
+        """
+        if self._compact is None or self._compact.version != self._version:
+            from .compact import CompactUDigraph
+            self._compact = CompactUDigraph(self)
+        return self._compact
+
+    def roots(self):
+        """
+        Returns the CanonicalRoots of this network, computing them again if the network changed.
+        """
+        if self._roots is None or self._roots.version != self._version:
+            from .roots import CanonicalRoots
+            self._roots = CanonicalRoots(self)
+        return self._roots
+
+    def reachability(self):
+        """
+        Returns the ReachabilityIndex of this network, computing it again if the network changed.
+        """
+        if self._reachability is None or self._reachability.version != self._version:
+            from .reachability import ReachabilityIndex
+            self._reachability = ReachabilityIndex(self)
+        return self._reachability
+
+    def descendants_memory(self) -> dict:
+        """
+        Returns the dictionary where `_get_descendants` memorizes the descendants found in this network, a new one if
+        the network changed.
+        """
+        if self._descendants is None or self._descendants[0] != self._version:
+            self._descendants = (self._version, {})
+        return self._descendants[1]
+
+    def descendants(self, name: str, generations: int) -> set:
+        """
+        Returns the set of names of the nodes that can be reached from the node `name` in up to `generations` steps,
+        and their synonyms.
+        """
+        frontier = [self.get_node(name)]
+        reached = {name, frontier[0].get_name()}  # `name` can be a synonym of the node
+        for g in range(generations):
+            # only the nodes reached in the previous generation are expanded
+            next_frontier = []
+            for node in frontier:
+                for child in self.edges[node][0]:
+                    if child.get_name() not in reached:
+                        reached.add(child.get_name())
+                        if child in self.edges:
+                            next_frontier.append(child)
+            if len(next_frontier) == 0:
+                break
+            frontier = next_frontier
+        return self.with_synonyms(reached)
 
     def convert(self, value, src, dest):
         if type(src) != UNode:
@@ -148,6 +434,19 @@ class UDigraph(object):
             dest = self.get_node(dest)
         return self.edges[src][1][self.edges[src][0].index(dest)]
 
+    def factor(self, src, dest):
+        """
+        Returns the (scale, offset) affine factor of the conversion from `src` to `dest`, such that the conversion is
+        equivalent to `x * scale + offset`, or None if the conversion is not known to be affine.
+        """
+        if type(src) != UNode:
+            src = self.get_node(src)
+        if type(dest) != UNode:
+            dest = self.get_node(dest)
+        if (src, dest) not in self._factors:
+            self._factors[(src, dest)] = affine_factor(self.conversion(src, dest))
+        return self._factors[(src, dest)]
+
     def __str__(self) -> str:
         result = ''
         for src in self.edges:
@@ -198,15 +497,19 @@ class UDigraph(object):
 
 
 class Conversion(object):
-    __slots__ = ('src', 'dest', 'conv', 'rev', 'alias')
+    __slots__ = ('src', 'dest', 'conv', 'rev', 'alias', 'factor')
 
-    def __init__(self, src, dest, conv, reverse=False, alias=False):
-        """Assumes src and dest are nodes"""
+    def __init__(self, src, dest, conv, reverse=False, alias=False, factor=None):
+        """
+        Assumes src and dest are nodes.
+        `factor` is the optional (scale, offset) tuple of an affine `conv`, if not provided it will be inferred from `conv`.
+        """
         self.src = src
         self.dest = dest
         self.conv = conv
         self.rev = reverse
         self.alias = alias
+        self.factor = factor
 
     def get_source(self):
         return self.src
@@ -227,5 +530,94 @@ class Conversion(object):
         else:
             return self.conv
 
+    def get_factor(self):
+        if self.factor is None:
+            return affine_factor(self.get_convert())
+        elif self.rev:
+            return 1 / (self.factor[0] + self.factor[1]), 0
+        else:
+            return self.factor
+
     def __str__(self) -> str:
         return self.src.get_name() + '->' + self.dest.get_name()
+
+
+def _slots(cls) -> list:
+    """
+    Returns the names of the slots of the class `cls` and of its bases.
+    """
+    slots = [klass.__dict__.get('__slots__', ()) for klass in reversed(cls.__mro__)]
+    return [slot for each in slots for slot in ((each,) if type(each) is str else each)]
+
+
+def _is_arithmetic(function) -> bool:
+    """
+    Checks if `function` is a plain arithmetic expression of its only argument, with no other names than numeric
+    constants, so it can be evaluated safely to infer its factors.
+    """
+    code = getattr(function, '__code__', None)
+    if code is None or code.co_argcount != 1:
+        return False
+    if function.__closure__ is not None and \
+            not all(type(cell.cell_contents) in (int, float) for cell in function.__closure__):
+        return False
+    return all(type(function.__globals__.get(name)) in (int, float) for name in code.co_names)
+
+
+def _code_signature(code) -> tuple:
+    return (code.co_code.hex(), code.co_names,
+            tuple(_code_signature(const) if type(const) is CodeType else repr(const) for const in code.co_consts))
+
+
+def conversion_signature(function) -> str:
+    """
+    Returns a text describing what the conversion `function` computes, the same in every process for the same function:
+    its affine factor if it is known, or its code, with its constants, the numeric globals it reads, and the contents of
+    its closure. The functions without code are described by their `repr`, so they are only equal in the same process.
+    """
+    factor = affine_factor(function)
+    if factor is not None:
+        return repr(factor)
+    code = getattr(function, '__code__', None)
+    if code is None:
+        return repr(function)
+    numeric_globals = tuple(repr(function.__globals__.get(name)) for name in code.co_names
+                            if type(function.__globals__.get(name)) in (int, float))
+    closure = tuple(conversion_signature(cell.cell_contents) if callable(cell.cell_contents)
+                    else repr(cell.cell_contents) for cell in function.__closure__ or ())
+    return repr((_code_signature(code), numeric_globals, closure))
+
+
+def affine_factor(function):
+    """
+    Infers the (scale, offset) factor of a conversion `function` equivalent to `x * scale + offset`.
+
+    Parameters
+    ----------
+    function: callable
+        the conversion function of an edge.
+
+    Returns
+    -------
+        (scale, offset) tuple or None if the function is not affine or could not be safely evaluated.
+    """
+    if type(function) is MethodType and function.__func__ is Conversion.reverse:
+        # the reverse of a conversion is `x / conv(1)`
+        if affine_factor(function.__self__.conv) is None:
+            return None
+        one = function.__self__.conv(1)
+        return (1 / one, 0) if one != 0 else None
+    if not _is_arithmetic(function):
+        return None
+    try:
+        offset = function(0)
+        scale = function(1) if offset == 0 else (function(2 ** 20) - offset) / 2 ** 20
+        if type(scale) not in (int, float) or type(offset) not in (int, float) or scale == 0:
+            return None
+        for x in (-12.5, 3.7, 1E3):
+            expected = x * scale + offset
+            if abs(function(x) - expected) > 1E-9 * max(abs(expected), abs(x * scale), abs(offset)):
+                return None
+    except Exception:
+        return None
+    return scale, offset
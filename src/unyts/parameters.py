@@ -9,14 +9,15 @@ Created on Sat Oct 24 18:24:20 2020
 __version__ = '0.6.9'
 __release__ = 20250615
 __all__ = ['unyts_parameters_', 'print_path', 'reload', 'raise_error', 'cache', 'set_density', 'get_density',
-           'recursion_limit', 'verbose', 'set_algorithm', 'set_parallel']
+           'recursion_limit', 'verbose', 'set_algorithm', 'set_parallel', 'set_backend',
+           'canonical_roots', 'prefix_parsing', 'set_memory_limits', 'get_memory_stats', 'set_dtype_policy',
+           'get_dtype_policy', 'set_shared_cache', 'get_shared_cache']
 
 import os.path
 from json import load as json_load, dump as json_dump
 from os.path import isfile, isdir
 from pathlib import Path
 from sys import getrecursionlimit
-from time import time
 from .helpers.logger import logger
 
 ini_path = Path(__file__).with_name('parameters.ini').absolute()
@@ -29,6 +30,10 @@ __timeout__ = 30
 __default_density__ = 0.997
 __default_fvf__ = 1.0
 __default_logger_level__ = "INFO"
+__memory_limit__ = 10000
+__memory_negative_limit__ = 1000
+__dtype_policies__ = ('preserve', 'numpy')
+__integer_dtypes__ = (None, 'float32', 'float64')
 
 class UnytsParameters(object):
     """
@@ -48,6 +53,15 @@ class UnytsParameters(object):
         self.fvf_ = __default_fvf__  # res_vol/std_vol
         self.max_recursion_ = __max_recursion_default__
         self.algorithm_ = 'lean_BFS'
+        self.backend_ = 'UDigraph'
+        self.canonical_roots_ = False
+        self.prefix_parsing_ = False
+        self.memory_policy_ = 'LRU'
+        self.memory_limit_ = __memory_limit__
+        self.memory_negative_limit_ = __memory_negative_limit__
+        self.dtype_policy_ = 'preserve'
+        self.integer_dtype_ = None
+        self.shared_cache_ = None
         self.max_generations_ = __max_generations_default__
         self.timeout_ = __timeout__
         self.load_params()
@@ -60,7 +74,6 @@ class UnytsParameters(object):
         self.parallel_ = (self.threading_ or self.multiprocessing_) and self.parallel_
         self._deactivate_parallel = True  # to hide the Parallel menu in the GUI
         self._warnings = []
-        self._start_time = 0
 
     def threading_available(self):
         try:
@@ -95,12 +108,19 @@ class UnytsParameters(object):
                       'fvf': __default_fvf__,
                       'max_recursion': __max_recursion_default__,
                       'algorithm': 'lean_BFS',
+                      'backend': 'UDigraph',
+                      'canonical_roots': False,
+                      'prefix_parsing': False,
+                      'memory_policy': 'LRU',
+                      'memory_limit': __memory_limit__,
+                      'memory_negative_limit': __memory_negative_limit__,
+                      'dtype_policy': 'preserve',
+                      'integer_dtype': None,
+                      'shared_cache': None,
                       'max_generations': __max_generations_default__,
                       'timeout': __timeout__,
                       'parallel': False,
                       'config_files_folder': None}
-            with open(ini_path, 'w') as f:
-                json_dump(params, f)
         self.print_path_ = params['print_path'] if 'print_path' in params else False
         self.cache_ = params['cache'] if 'cache' in params else True
         self.reload_ = params['reload'] if 'reload' in params else False
@@ -113,6 +133,16 @@ class UnytsParameters(object):
         self.fvf_ = params['fvf'] if 'fvf' in params else __default_fvf__
         self.max_recursion_ = params['max_recursion'] if 'max_recursion' in params else __max_recursion_default__
         self.algorithm_ = params['algorithm'] if 'algorithm' in params else 'BFS'
+        self.backend_ = params['backend'] if 'backend' in params else 'UDigraph'
+        self.canonical_roots_ = params['canonical_roots'] if 'canonical_roots' in params else False
+        self.prefix_parsing_ = params['prefix_parsing'] if 'prefix_parsing' in params else False
+        self.memory_policy_ = params['memory_policy'] if 'memory_policy' in params else 'LRU'
+        self.memory_limit_ = params['memory_limit'] if 'memory_limit' in params else __memory_limit__
+        self.memory_negative_limit_ = params['memory_negative_limit'] if 'memory_negative_limit' in params \
+            else __memory_negative_limit__
+        self.dtype_policy_ = params['dtype_policy'] if 'dtype_policy' in params else 'preserve'
+        self.integer_dtype_ = params['integer_dtype'] if 'integer_dtype' in params else None
+        self.shared_cache_ = params['shared_cache'] if 'shared_cache' in params else None
         self.max_generations_ = params['max_generations'] if 'max_generations' in params else __max_generations_default__
         self.timeout_ = params['timeout'] if 'timeout' in params else __timeout__
         self.parallel_ = params['parallel'] if 'parallel' in params else False
@@ -134,6 +164,16 @@ class UnytsParameters(object):
             self.fvf_ = params['fvf'] if 'fvf' in params else __default_fvf__
             self.max_recursion_ = params['max_recursion'] if 'max_recursion' in params else __max_recursion_default__
             self.algorithm_ = params['algorithm'] if 'algorithm' in params else 'BFS'
+            self.backend_ = params['backend'] if 'backend' in params else 'UDigraph'
+            self.canonical_roots_ = params['canonical_roots'] if 'canonical_roots' in params else False
+            self.prefix_parsing_ = params['prefix_parsing'] if 'prefix_parsing' in params else False
+            self.memory_policy_ = params['memory_policy'] if 'memory_policy' in params else 'LRU'
+            self.memory_limit_ = params['memory_limit'] if 'memory_limit' in params else __memory_limit__
+            self.memory_negative_limit_ = params['memory_negative_limit'] if 'memory_negative_limit' in params \
+                else __memory_negative_limit__
+            self.dtype_policy_ = params['dtype_policy'] if 'dtype_policy' in params else 'preserve'
+            self.integer_dtype_ = params['integer_dtype'] if 'integer_dtype' in params else None
+            self.shared_cache_ = params['shared_cache'] if 'shared_cache' in params else None
             self.max_generations_ = params['max_generations'] if 'max_generations' in params else __max_generations_default__
             self.timeout_ = params['timeout'] if 'timeout' in params else __timeout__
             self.parallel_ = params['parallel'] if 'parallel' in params else True
@@ -154,6 +194,15 @@ class UnytsParameters(object):
                   'fvf': self.fvf_,
                   'max_recursion': self.max_recursion_,
                   'algorithm': self.algorithm_,
+                  'backend': self.backend_,
+                  'canonical_roots': self.canonical_roots_,
+                  'prefix_parsing': self.prefix_parsing_,
+                  'memory_policy': self.memory_policy_,
+                  'memory_limit': self.memory_limit_,
+                  'memory_negative_limit': self.memory_negative_limit_,
+                  'dtype_policy': self.dtype_policy_,
+                  'integer_dtype': self.integer_dtype_,
+                  'shared_cache': self.shared_cache_,
                   'max_generations': self.max_generations_,
                   'timeout': self.timeout_,
                   'parallel': self.parallel_,
@@ -192,6 +241,36 @@ class UnytsParameters(object):
         logger.info(f"cache {'ON' if self.cache_ else 'OFF'}")
         self.save_params()
 
+    def canonical_roots(self, switch=None) -> None:
+        if switch is None:
+            self.canonical_roots_ = not self.canonical_roots_
+        elif type(switch) is str:
+            if switch.lower().strip() in off_switches:
+                self.canonical_roots_ = False
+            else:
+                self.canonical_roots_ = True
+        else:
+            self.canonical_roots_ = bool(switch)
+        logger.info(f"canonical roots {'ON' if self.canonical_roots_ else 'OFF'}")
+        self.save_params()
+
+    def prefix_parsing(self, switch=None) -> None:
+        _prev = self.prefix_parsing_
+        if switch is None:
+            self.prefix_parsing_ = not self.prefix_parsing_
+        elif type(switch) is str:
+            if switch.lower().strip() in off_switches:
+                self.prefix_parsing_ = False
+            else:
+                self.prefix_parsing_ = True
+        else:
+            self.prefix_parsing_ = bool(switch)
+        logger.info(f"prefix parsing {'ON' if self.prefix_parsing_ else 'OFF'}")
+        from . import database
+        if database._loaded and _prev != self.prefix_parsing_:
+            logger.warning("the units are already loaded, prefix parsing will apply in a new Python session.")
+        self.save_params()
+
     def raise_error(self, switch=None) -> None:
         if switch is None:
             self.raise_error_ = not self.raise_error_
@@ -279,8 +358,8 @@ class UnytsParameters(object):
         return self.algorithm_
 
     def set_algorithm(self, algorithm:str):
-        if algorithm not in ['BFS', 'lean_BFS', 'DFS', 'hybrid_BFS']:
-            logger.error(f"Valid algorithms are 'BFS', 'lean_BFS', 'hybrid_BFS', and 'DFS' not '{algorithm}'.")
+        if algorithm not in ['BFS', 'lean_BFS', 'DFS', 'hybrid_BFS', 'bidirectional_BFS']:
+            logger.error(f"Valid algorithms are 'BFS', 'lean_BFS', 'hybrid_BFS', 'bidirectional_BFS', and 'DFS' not '{algorithm}'.")
         elif algorithm == 'hybrid_BFS' and not self.threading_:
             logger.critical("threading module not available in this Python installation.")
             if self.get_algorithm() == 'hybrid_BFS':
@@ -300,6 +379,71 @@ class UnytsParameters(object):
     def get_algorithm(self):
         return self.algorithm_
 
+    def set_backend(self, backend:str):
+        if backend not in ['UDigraph', 'compact']:
+            logger.error(f"Valid backends are 'UDigraph' and 'compact' not '{backend}'.")
+        else:
+            self.backend_ = backend
+            if self.verbose_:
+                logger.info(f"{backend} set as network backend for searches.")
+            self.save_params()
+
+    def get_backend(self):
+        return self.backend_
+
+    def set_memory_limits(self, limit:int=None, negative_limit:int=None, policy:str=None):
+        for each in (limit, negative_limit):
+            if each is not None and (type(each) is not int or each < 0):
+                raise ValueError("the memory limits must be non-negative integers, 0 to not memorize any conversion, "
+                                 "or None for unlimited memory.")
+        policy = self.memory_policy_ if policy is None else policy.upper()
+        if policy not in ['LRU', 'LFU']:
+            logger.error(f"Valid memory policies are 'LRU' and 'LFU' not '{policy}'.")
+            return
+        self.memory_limit_, self.memory_negative_limit_, self.memory_policy_ = limit, negative_limit, policy
+        from .database import units_network
+        units_network.memory.resize(limit, negative_limit, policy)
+        if self.verbose_:
+            logger.info(f"search memory limited to {limit} conversions and {negative_limit} not found, "
+                        f"evicting by {policy}.")
+        self.save_params()
+
+    def get_memory_stats(self) -> dict:
+        from .database import units_network
+        return units_network.memory.get_stats()
+
+    def set_dtype_policy(self, policy:str='preserve', integer_dtype:str=None):
+        if policy not in __dtype_policies__:
+            logger.error(f"Valid dtype policies are 'preserve' and 'numpy' not '{policy}'.")
+            return
+        if integer_dtype not in __integer_dtypes__:
+            logger.error(f"Valid integer dtypes are 'float32', 'float64' or None not '{integer_dtype}'.")
+            return
+        self.dtype_policy_, self.integer_dtype_ = policy, integer_dtype
+        if self.verbose_:
+            logger.info(f"dtype policy set to '{policy}'" +
+                        (f", promoting integers to {integer_dtype}." if integer_dtype is not None else "."))
+        self.save_params()
+
+    def get_dtype_policy(self) -> tuple:
+        return self.dtype_policy_, self.integer_dtype_
+
+    def set_shared_cache(self, path=True):
+        if path is True:
+            path = self.get_user_folder() + 'shared_memory.sqlite'
+        elif path is False or (type(path) is str and path.lower().strip() in off_switches):
+            path = None
+        from .database import attach_shared_cache
+        if not attach_shared_cache(path):
+            return
+        self.shared_cache_ = path
+        if self.verbose_:
+            logger.info(f"shared cache {'OFF' if path is None else 'at ' + path}")
+        self.save_params()
+
+    def get_shared_cache(self):
+        return self.shared_cache_
+
     def set_parallel(self, method:str):
         if method is None:
             self.parallel_ = True
@@ -344,16 +488,13 @@ class UnytsParameters(object):
         return self.timeout_
 
     def is_intime(self):
-        if self._start_time == 0:
-            self._start_time = time()
-            return True
-        elif time() - self._start_time <= self.timeout_:
-            return True
-        else:
-            return False
+        # the time is counted by the session of the running conversion
+        from .session import current_session
+        return current_session().is_intime()
 
     def reset_start_time(self):
-        self._start_time = 0
+        from .session import current_session
+        current_session().restart()
 
     def set_user_folder(self, path=None):
         if path is None:
@@ -385,6 +526,28 @@ def verbose(switch=None) -> None:
 def cache(switch=None) -> None:
     unyts_parameters_.cache(switch)
 
+
+def canonical_roots(switch=None) -> None:
+    """
+    Switch ON to convert between units of the same connected component of the network, i.e.: Length or Pressure,
+    through the precomputed factors to the root unit of the component, without searching the network.
+    OFF by default, where the definitions of the units disagree, i.e.: approximate volumes, the factor through the root
+    can differ from the conversion found searching the network, that depends on the path found.
+    """
+    unyts_parameters_.canonical_roots(switch)
+
+
+def prefix_parsing(switch=None) -> None:
+    """
+    Switch ON to make the network with only the units without prefixes, and the prefixed units, i.e.: 'kPa' or 'MW',
+    from their prefix and unit the first time they are used.
+    OFF by default, every prefixed unit is made with the network. With prefix parsing, the prefixed units not used yet
+    are not listed in the dictionary nor are nodes of the network, i.e.: `has_node('kPa')` is False until 'kPa' is
+    used, while conversions, `units` and `valid_unit` make them when required.
+    It takes effect the next time the units are loaded, each mode has its own cache files.
+    """
+    unyts_parameters_.prefix_parsing(switch)
+
 def recursion_limit(limit=None) -> int:
     return unyts_parameters_.recursion_limit(limit)
 
@@ -450,8 +613,8 @@ def reload() -> None:
 
 
 def set_algorithm(algorithm:str):
-    if algorithm not in ['BFS', 'lean_BFS', 'DFS', 'hybrid_BFS']:
-        raise ValueError(f"valid algorithms are 'BFS', 'lean_BFS', 'hybrid_BFS', and 'DFS' not {algorithm}.")
+    if algorithm not in ['BFS', 'lean_BFS', 'DFS', 'hybrid_BFS', 'bidirectional_BFS']:
+        raise ValueError(f"valid algorithms are 'BFS', 'lean_BFS', 'hybrid_BFS', 'bidirectional_BFS', and 'DFS' not {algorithm}.")
     unyts_parameters_.set_algorithm(algorithm)
 
 
@@ -459,6 +622,38 @@ def get_algorithm():
     return unyts_parameters_.algorithm_
 
 
+def set_backend(backend:str):
+    """
+    Sets the representation of the units network used by the search algorithms:
+      - 'UDigraph': the dictionary of nodes and lists of children.
+      - 'compact': the network compiled to integer ids and CSR arrays, requires NumPy.
+    """
+    if backend not in ['UDigraph', 'compact']:
+        raise ValueError(f"valid backends are 'UDigraph' and 'compact' not {backend}.")
+    unyts_parameters_.set_backend(backend)
+
+
+def get_backend():
+    return unyts_parameters_.get_backend()
+
+
+def set_memory_limits(limit:int=__memory_limit__, negative_limit:int=__memory_negative_limit__, policy:str='LRU'):
+    """
+    Limits the number of conversions kept in the search memory:
+      - `limit`: the maximum number of conversions found, None for unlimited, 0 to not memorize them.
+      - `negative_limit`: the maximum number of conversions not found, None for unlimited, 0 to not memorize them.
+      - `policy`: 'LRU' to evict the least recently used conversions, 'LFU' to evict the least frequently used.
+    """
+    unyts_parameters_.set_memory_limits(limit, negative_limit, policy)
+
+
+def get_memory_stats() -> dict:
+    """
+    Returns the number of hits, misses and evictions of the search memory, and the number of conversions in it.
+    """
+    return unyts_parameters_.get_memory_stats()
+
+
 def set_parallel(method:str):
     unyts_parameters_.set_parallel(method)
 
@@ -486,3 +681,28 @@ def get_timeout():
 def set_logging_level(level:str="WARNING"):
     unyts_parameters_.set_logger_level(level)
 
+
+def set_dtype_policy(policy: str = 'preserve', integer_dtype: str = None) -> None:
+    """
+    Set the `policy` to 'preserve' to keep the floating dtype of the converted arrays, i.e.: float32 stays float32, and
+    to promote the integer arrays to `integer_dtype` ('float32' or 'float64') before converting them, or to None to let
+    NumPy choose. Set the `policy` to 'numpy' to keep the dtypes resulting from the NumPy operations.
+    """
+    unyts_parameters_.set_dtype_policy(policy, integer_dtype)
+
+
+def get_dtype_policy() -> tuple:
+    return unyts_parameters_.get_dtype_policy()
+
+
+def set_shared_cache(path=True) -> None:
+    """
+    Shares the conversions found with other processes, through a SQLite database at `path`, or in the user folder if
+    `path` is True. The conversions not in the memory of this process are looked up there before searching them.
+    Set `path` to False or None to stop sharing the conversions.
+    """
+    unyts_parameters_.set_shared_cache(path)
+
+
+def get_shared_cache():
+    return unyts_parameters_.get_shared_cache()
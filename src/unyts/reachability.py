@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:14:52 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+__version__ = '0.1.0'
+__release__ = 20261018
+__all__ = ['ReachabilityIndex', 'UnitKinds']
+
+from .helpers.unit_string_tools import split_unit
+
+
+class ReachabilityIndex(object):
+    """
+    The transitive closure of a UDigraph or CompactUDigraph network, as Python int bitmasks over the integer ids of the
+    nodes. The nodes of each strongly connected component share the same mask, where the bit `i` is set if the node with
+    id `i` can be reached, so asking if a unit can be converted into another is a single bit test.
+      - `ids` maps each unit name to its integer id.
+      - `components` maps each id to the id of its strongly connected component.
+      - `masks` is the list of bitmasks of the components.
+      - `aliases` maps the synonyms collapsed in the network to the name of their node, they share its id.
+    """
+    __slots__ = ('ids', 'names', 'aliases', 'components', 'masks', 'version')
+
+    def __init__(self, graph) -> None:
+        self.version = graph.version
+        self.names = graph.list_nodes()
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        children, i = [], 0
+        while i < len(self.names):
+            node_children = []
+            if graph.has_node(self.names[i]):
+                for child in graph.children_of(graph.get_node(self.names[i])):
+                    if child.get_name() not in self.ids:  # a child not indexed by name in the network
+                        self.ids[child.get_name()] = len(self.names)
+                        self.names.append(child.get_name())
+                    node_children.append(self.ids[child.get_name()])
+            children.append(node_children)
+            i += 1
+        self.components, order = self._strongly_connected(children)
+        self.aliases = {alias: name for alias, name in graph.aliases().items() if name in self.ids}
+        self.ids.update({alias: self.ids[name] for alias, name in self.aliases.items()})
+
+        # the components are found in reverse topological order, so their successors are already solved
+        self.masks = [0] * len(order)
+        for component, members in enumerate(order):
+            mask = 0
+            for i in members:
+                mask |= 1 << i
+                for child in children[i]:
+                    if self.components[child] != component:
+                        mask |= self.masks[self.components[child]]
+            self.masks[component] = mask
+
+    @staticmethod
+    def _strongly_connected(children: list):
+        """
+        Iterative Tarjan's algorithm.
+        Returns the list with the component of every node, and the list of the members of every component, in reverse
+        topological order (every component comes after the components it can reach).
+        """
+        index, low, on_stack = [None] * len(children), [0] * len(children), [False] * len(children)
+        components, order = [None] * len(children), []
+        stack, counter = [], 0
+        for root in range(len(children)):
+            if index[root] is not None:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, position = work.pop()
+                if position == 0:
+                    index[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                for p in range(position, len(children[node])):
+                    child = children[node][p]
+                    if index[child] is None:
+                        work.append((node, p + 1))
+                        work.append((child, 0))
+                        break
+                    elif on_stack[child]:
+                        low[node] = min(low[node], index[child])
+                else:
+                    if low[node] == index[node]:
+                        members = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            components[member] = len(order)
+                            members.append(member)
+                            if member == node:
+                                break
+                        order.append(members)
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+        return components, order
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def has_node(self, name: str) -> bool:
+        return name in self.ids
+
+    def mask(self, name: str) -> int:
+        """
+        Returns the bitmask of the nodes that can be reached from `name`, including itself.
+        """
+        return self.masks[self.components[self.ids[name]]]
+
+    def reachable(self, src: str, dest: str) -> bool:
+        """
+        Returns True if there is a path from `src` to `dest` in the network.
+        """
+        if src not in self.ids or dest not in self.ids:
+            return False
+        return bool(self.mask(src) >> self.ids[dest] & 1)
+
+    def reachable_names(self, name: str) -> set:
+        """
+        Returns the names of the nodes that can be reached from `name`, including itself, and their synonyms.
+        """
+        mask, names = self.mask(name), set()
+        while mask:
+            bit = mask & -mask
+            names.add(self.names[bit.bit_length() - 1])
+            mask ^= bit
+        return names.union(alias for alias, node in self.aliases.items() if node in names)
+
+
+class UnitKinds(object):
+    """
+    A map from every unit of a UDigraph or CompactUDigraph network to its kind, the integer id of its connected
+    component ignoring the direction of the edges, i.e.: Length, Pressure or Time.
+    The `expansion` of a kind is the set of itself and the kinds of the parts of every ratio or product unit of that
+    kind, i.e.: Pressure expands to Force and Area because of 'lbf/in2'.
+    A conversion between two units is only possible if their signatures share some kind, where the `signature` of a
+    unit of the network is the expansion of its kind, and the signature of a ratio or product of units is the set of
+    kinds of its parts.
+    The kinds including some `wildcards` (names that can be converted to any other, like Dimensionless ones), as unit
+    or as part of a unit, are `open`, and their conversions are never rejected.
+    """
+    __slots__ = ('kind', 'expansion', 'open', 'wildcards', 'version')
+
+    def __init__(self, graph, wildcards=()) -> None:
+        self.version = graph.version
+        self.wildcards = frozenset(wildcards)
+        parent = {}
+
+        def find(name):
+            root = name
+            while parent.setdefault(root, root) != root:
+                root = parent[root]
+            while parent[name] != root:
+                parent[name], name = root, parent[name]
+            return root
+
+        names = graph.list_nodes()
+        for name in names:
+            find(name)
+            for child in graph.children_of(graph.get_node(name)):
+                a, b = find(name), find(child.get_name())
+                if a != b:
+                    parent[b] = a
+        kind_ids = {}
+        self.kind = {name: kind_ids.setdefault(find(name), len(kind_ids)) for name in parent}
+        aliases = {alias: name for alias, name in graph.aliases().items() if name in self.kind}
+        self.kind.update({alias: self.kind[name] for alias, name in aliases.items()})
+        names = names + list(aliases)
+
+        expansion, opened = {kind: {kind} for kind in kind_ids.values()}, set()
+        for name in names:
+            parts = self._parts(name)
+            if len(parts) > 1:
+                for part in parts:
+                    if part in self.kind:
+                        expansion[self.kind[name]].add(self.kind[part])
+                    elif self.is_wildcard(part):
+                        opened.add(self.kind[name])
+                    # other parts out of the network are only converted to the same name, not known by any kind
+            if self.is_wildcard(name):
+                opened.add(self.kind[name])
+        self.expansion = {kind: frozenset(kinds) for kind, kinds in expansion.items()}
+        self.open = frozenset(opened)
+
+    def is_wildcard(self, unit: str) -> bool:
+        return unit in self.wildcards or unit.lower() in self.wildcards
+
+    @staticmethod
+    def _parts(unit: str) -> list:
+        return [part for part in split_unit(unit) if part not in ('*', '/', '')]
+
+    def __len__(self) -> int:
+        return len(self.expansion)
+
+    def signature(self, unit: str):
+        """
+        Returns the frozenset of kinds that `unit` could be converted to, or None if not known or open.
+        """
+        if unit in self.kind:
+            signature = self.expansion[self.kind[unit]]
+        else:
+            parts = self._parts(unit)
+            if len(parts) == 0 or any(part not in self.kind for part in parts):
+                return None
+            signature = frozenset(self.kind[part] for part in parts)
+        return None if len(signature.intersection(self.open)) > 0 else signature
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:52:36 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+__version__ = '0.1.0'
+__release__ = 20261018
+__all__ = ['CanonicalRoots']
+
+from collections import deque
+
+
+class CanonicalRoots(object):
+    """
+    Precomputed affine factors from every unit to the root unit of its connected component, and back.
+    Only the edges with a known affine factor are considered, so a conversion between two units of the same component
+    is `x * scale + offset`, composing the factor from the source to the root and the factor from the root to the
+    destination, without searching the network.
+      - `nodes` maps each unit name to its node in the network.
+      - `root` maps each node to the root node of its component.
+      - `to_root` maps each node to the (scale, offset) factor to convert from that node to its root.
+      - `from_root` maps each node to the (scale, offset) factor to convert from its root to that node.
+      - `to_parent` and `from_parent` keep the next node towards the root and the previous node from the root, to
+        rebuild the conversion path.
+      - `inconsistent` lists the units left out because their conversions depend on the path, i.e.: 'psi gauge', equal
+        to 'psi' that is also equal to the absolute pressure.
+    The components where different paths give different conversions are split by leaving out, one at a time, the unit
+    in more of the conflicting edges, until the rest of the component is consistent. The units left out are converted
+    by searching the network.
+    """
+    __slots__ = ('nodes', 'root', 'to_root', 'from_root', 'to_parent', 'from_parent', 'inconsistent', 'version')
+
+    def __init__(self, network) -> None:
+        self.version = network._version
+        self.nodes = {name: network.get_node(name) for name in network.list_nodes() + list(network.aliases())}
+        self.root, self.to_root, self.from_root, self.to_parent, self.from_parent = {}, {}, {}, {}, {}
+        self.inconsistent = []
+        children, parents = {}, {}
+        for node, (nodes, conversions) in network.edges.items():
+            for child in nodes:
+                factor = network.factor(node, child)
+                if factor is not None and self._reversible(network, node, child, factor):
+                    children.setdefault(node, []).append((child, factor))
+                    parents.setdefault(child, []).append((node, factor))
+
+        components = self._components(children, parents)
+        while len(components) > 0:
+            component = components.pop()
+            # the node with more direct conversions is the root, i.e.: 'm' for Length
+            degree = {node: len(children.get(node, [])) + len(parents.get(node, [])) for node in component}
+            root = max(component, key=lambda n: (degree[n], n.get_name()))
+            self._expand(root, parents, self.to_root, self.to_parent, to_root=True)
+            self._expand(root, children, self.from_root, self.from_parent, to_root=False)
+            conflicts = self._conflicts(component, children)
+            if len(conflicts) == 0:
+                for node in component:
+                    self.root[node] = root
+                continue
+            for node in component:
+                for each in (self.to_root, self.from_root, self.to_parent, self.from_parent):
+                    each.pop(node, None)
+            # the unit in more conflicting edges, or the less connected, is left out and the rest is split again
+            count = {}
+            for edge in conflicts:
+                for node in edge:
+                    count[node] = count.get(node, 0) + 1
+            ambiguous = max(count, key=lambda n: (count[n], n.get_name()))
+            self.inconsistent.append(ambiguous.get_name())
+            self._remove(ambiguous, children, parents)
+            components += self._components(children, parents, [node for node in component if node is not ambiguous])
+
+    @staticmethod
+    def _reversible(network, node, child, factor) -> bool:
+        """
+        Checks that the edge from `node` to `child` has a reverse edge with the inverse affine factor, so the components
+        are the same in both directions and the factors to the root do not depend on the path.
+        """
+        if node not in network.children_of(child):
+            return False
+        reverse = network.factor(child, node)
+        if reverse is None:
+            return False
+        scale, offset = factor
+        reverse_scale, reverse_offset = reverse
+        return abs(scale * reverse_scale - 1) <= 1E-9 and \
+            abs(offset * reverse_scale + reverse_offset) <= 1E-9 * max(1, abs(reverse_offset))
+
+    def _conflicts(self, component: list, children: dict) -> list:
+        """
+        Returns the list of (node, child) edges of the component that disagree with the factors to the root of their
+        nodes.
+        """
+        conflicts = []
+        for node in component:
+            scale, offset = self.to_root[node]
+            for child, (edge_scale, edge_offset) in children.get(node, []):
+                child_scale, child_offset = self.to_root[child]
+                if abs(edge_scale * child_scale - scale) > 1E-9 * abs(scale) or \
+                        abs(edge_offset * child_scale + child_offset - offset) > 1E-9 * max(abs(scale), abs(offset)):
+                    conflicts.append((node, child))
+        return conflicts
+
+    @staticmethod
+    def _remove(node, children: dict, parents: dict) -> None:
+        """
+        Removes the `node` and its edges from the `children` and `parents` adjacency.
+        """
+        for adjacency in (children, parents):
+            adjacency.pop(node, None)
+            for each in list(adjacency):
+                adjacency[each] = [(neighbour, factor) for neighbour, factor in adjacency[each] if neighbour is not node]
+                if len(adjacency[each]) == 0:
+                    del adjacency[each]
+
+    @staticmethod
+    def _components(children: dict, parents: dict, nodes: list = None) -> list:
+        """
+        Returns the list of connected components, ignoring the direction of the edges, of all the nodes or of the
+        `nodes` provided.
+        """
+        components, assigned = [], set()
+        for node in list(children) + list(parents) if nodes is None else nodes:
+            if node in assigned or (node not in children and node not in parents):
+                continue
+            component, queue = [node], deque([node])
+            assigned.add(node)
+            while queue:
+                current = queue.popleft()
+                for neighbour, _ in children.get(current, []) + parents.get(current, []):
+                    if neighbour not in assigned:
+                        assigned.add(neighbour)
+                        component.append(neighbour)
+                        queue.append(neighbour)
+            components.append(component)
+        return components
+
+    @staticmethod
+    def _expand(root, adjacency: dict, factors: dict, parent: dict, to_root: bool) -> None:
+        """
+        Runs a breadth-first expansion from `root`, composing the factor of every reached node.
+        If `to_root` is True, `adjacency` must map each node to its parents, and the factors are from the node to root.
+        Otherwise, `adjacency` must map each node to its children, and the factors are from the root to the node.
+        """
+        factors[root], parent[root] = (1, 0), None
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            scale, offset = factors[node]
+            for neighbour, (edge_scale, edge_offset) in adjacency.get(node, []):
+                if neighbour in factors:
+                    continue
+                if to_root:  # neighbour -> node -> ... -> root
+                    factors[neighbour] = edge_scale * scale, edge_offset * scale + offset
+                else:  # root -> ... -> node -> neighbour
+                    factors[neighbour] = scale * edge_scale, offset * edge_scale + edge_offset
+                parent[neighbour] = node
+                queue.append(neighbour)
+
+    def __len__(self) -> int:
+        return len(self.root)
+
+    def connected(self, src: str, dest: str) -> bool:
+        if src not in self.nodes or dest not in self.nodes:
+            return False
+        src, dest = self.nodes[src], self.nodes[dest]
+        return src in self.to_root and dest in self.from_root and self.root[src] is self.root[dest]
+
+    def get_root(self, name: str):
+        """
+        Returns the name of the root unit of the component of `name`, or None if it is not in any component.
+        """
+        if name not in self.nodes or self.nodes[name] not in self.root:
+            return None
+        return self.root[self.nodes[name]].get_name()
+
+    def factor(self, src: str, dest: str):
+        """
+        Returns the (scale, offset) factor to convert from `src` to `dest`, or None if they are not connected.
+        """
+        if not self.connected(src, dest):
+            return None
+        scale_src, offset_src = self.to_root[self.nodes[src]]
+        scale_dest, offset_dest = self.from_root[self.nodes[dest]]
+        return scale_src * scale_dest, offset_src * scale_dest + offset_dest
+
+    def path(self, src: str, dest: str) -> list:
+        """
+        Returns the list of nodes from `src` to `dest` through the root of their component, or None if they are not
+        connected. The loops of the path, if going to the root and back through the same nodes, are removed.
+        """
+        if not self.connected(src, dest):
+            return None
+        up, node = [], self.nodes[src]
+        while node is not None:
+            up.append(node)
+            node = self.to_parent[node]
+        down, node = [], self.nodes[dest]
+        while node is not None:
+            down.append(node)
+            node = self.from_parent[node]
+        path = []
+        for node in up + down[::-1][1:]:
+            if node in path:
+                path = path[:path.index(node)]
+            path.append(node)
+        return path
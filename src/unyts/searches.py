@@ -8,19 +8,22 @@ Created on Sat Oct 24 17:52:34 2020
 
 __version__ = '0.6.6'
 __release__ = 20250504
-__all__ = ['BFS', 'lean_BFS', 'DFS', 'hybrid_BFS', 'print_path']
+__all__ = ['BFS', 'lean_BFS', 'DFS', 'hybrid_BFS', 'bidirectional_BFS', 'print_path']
 
 
 from unyts import unyts_parameters_
 from .Empty import Empty
 from .helpers.logger import logger
+from .session import current_session
 
 import os
+from collections import deque
+from contextvars import copy_context
 from multiprocessing import Process
 from threading import Thread
 
 
-def BFS(graph, start, end, verbose=False) -> list:
+def BFS(graph, start, end, verbose=False, stats:dict=None) -> list:
     """
     Implementation of Breadth-First Search algorithm.
     Assumes graph is a digraph; `start` and `end` are nodes in the graph network.
@@ -28,20 +31,33 @@ def BFS(graph, start, end, verbose=False) -> list:
 
     Parameters
     ----------
-    graph: Digraph
+    graph: UDigraph or CompactUDigraph
     start: node
     end: node
     verbose: bool
         to print or not print messages.
+    stats: dict, optional
+        if provided, the number of expanded paths, or nodes in a CompactUDigraph, is stored in its 'expanded' key.
     Returns
     -------
     shortest_path: list
     """
+    session = current_session()
+    if hasattr(graph, 'shortest_path'):  # the CompactUDigraph is traversed by the ids of its nodes
+        path = graph.shortest_path(start, end, session.is_intime, stats)
+        if path is False:
+            return Empty
+        if path is not None:
+            path = [graph.nodes[i] for i in path]
+            if verbose:
+                logger.info(f"""<BFS> Found end node {end.get_name()} in the path:\n{print_path(path)}""")
+        return path
     init_path = [start]
     path_queue = [init_path]
     visited = list()
+    expanded = 0
     while len(path_queue) != 0:
-        if not unyts_parameters_.is_intime():
+        if not session.is_intime():
             return Empty
         # get and remove oldest element in path_queue
         conv_path = path_queue.pop(0)
@@ -55,11 +71,93 @@ def BFS(graph, start, end, verbose=False) -> list:
             if last_node is end:
                 if verbose:
                     logger.info(f"""<BFS> Found end node {end.get_name()} in the path:\n{print_path(conv_path)}""")
+                if stats is not None:
+                    stats['expanded'] = expanded
                 return conv_path
             path_queue += [conv_path + [next_node]
                            for next_node in graph.children_of(last_node) 
                            if next_node not in conv_path]
             visited.append(conv_path)
+            expanded += 1
+    if stats is not None:
+        stats['expanded'] = expanded
+
+
+def bidirectional_BFS(graph, start, end, verbose=False, stats:dict=None) -> list:
+    """
+    Implementation of a bidirectional Breadth-First Search algorithm.
+    Assumes graph is a digraph with a `parents_of` method; `start` and `end` are nodes in the graph network.
+    Expands, a whole generation at a time, the smaller of the frontiers from `start`, through the children, and from
+    `end`, through the parents, until they meet. The nodes are visited once, keeping their distance to `start` or `end`.
+    Returns the same shortest path from `start` to `end` than BFS, rebuilt from the nodes at the right distances, taking
+    the children in the same order that BFS does.
+
+    Parameters
+    ----------
+    graph: UDigraph or CompactUDigraph
+    start: node
+    end: node
+    verbose: bool
+        to print or not print messages.
+    stats: dict, optional
+        if provided, the number of expanded nodes is stored in its 'expanded' key.
+    Returns
+    -------
+    shortest_path: list
+    """
+    if start is end:
+        return [start]
+    session = current_session()
+    # distances from start (forward) and to end (backward), and the generations of the forward search
+    forward, backward = {start: 0}, {end: 0}
+    forward_generations = [[start]]
+    forward_frontier, backward_frontier = deque([start]), deque([end])
+    expanded, distance = 0, None
+    while distance is None and len(forward_frontier) > 0 and len(backward_frontier) > 0:
+        if not session.is_intime():
+            return Empty
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier, visited, other, neighbours_of = forward_frontier, forward, backward, graph.children_of
+        else:
+            frontier, visited, other, neighbours_of = backward_frontier, backward, forward, graph.parents_of
+        generation = []
+        for _ in range(len(frontier)):
+            node = frontier.popleft()
+            expanded += 1
+            for neighbour in neighbours_of(node):
+                if neighbour not in visited:
+                    visited[neighbour] = visited[node] + 1
+                    frontier.append(neighbour)
+                    generation.append(neighbour)
+                    if neighbour in other and (distance is None or visited[neighbour] + other[neighbour] < distance):
+                        distance = visited[neighbour] + other[neighbour]
+        if visited is forward:
+            forward_generations.append(generation)
+        if verbose:
+            logger.info(f"<bidirectional BFS> {len(forward)} nodes reached from {start}, {len(backward)} nodes reached from {end}.")
+    if stats is not None:
+        stats['expanded'] = expanded
+    if distance is None:
+        return None
+
+    # from the position `known` of the path, the distance to end of the nodes is known by the backward search,
+    # before that position, the nodes in a shortest path are selected backwards from the forward generations
+    known = distance - max(backward.values())
+    in_path = [None] * known
+    for i in range(known - 1, -1, -1):
+        in_path[i] = {node for node in forward_generations[i]
+                      if any((child in in_path[i + 1]) if i + 1 < known else (backward.get(child) == distance - i - 1)
+                             for child in graph.children_of(node))}
+
+    conv_path = [start]
+    for i in range(1, distance + 1):
+        for child in graph.children_of(conv_path[-1]):
+            if (i < known and child in in_path[i]) or (i >= known and backward.get(child) == distance - i):
+                conv_path.append(child)
+                break
+    if verbose:
+        logger.info(f"""<bidirectional BFS> Found end node {end.get_name()} in the path:\n{print_path(conv_path)}""")
+    return conv_path
 
 
 def DFS(graph, start, end, verbose=False, branch_depht=25) -> list:
@@ -70,7 +168,7 @@ def DFS(graph, start, end, verbose=False, branch_depht=25) -> list:
 
     Parameters
     ----------
-    graph: Digraph
+    graph: UDigraph or CompactUDigraph
     start: node
     end: node
     verbose: bool
@@ -81,16 +179,21 @@ def DFS(graph, start, end, verbose=False, branch_depht=25) -> list:
     """
     from unyts.converter import _get_descendants
     branch_depht = unyts_parameters_.generations_limit() if branch_depht is None else branch_depht
+    # the branches not leading to `end` are pruned with a bit test on the reachability index of the network
+    reachability = graph.reachability() if hasattr(graph, 'reachability') else None
+    session = current_session()
     def dfs_(graph, node, visited, path_queue):
         visited.add(node)
         for child in graph.children_of(node):
-            if not unyts_parameters_.is_intime():
+            if not session.is_intime():
                 path_queue.append(Empty)
                 break
             this_path = []
             if child in visited:
                 continue
-            if end.get_name() not in _get_descendants(child.get_name(), branch_depht):
+            if reachability is not None and not reachability.reachable(child.get_name(), end.get_name()):
+                continue  # no path at all, without getting the descendants of the child
+            elif end.get_name() not in _get_descendants(child.get_name(), branch_depht, graph=graph):
                 continue
             else:
                 this_path.append(child)
@@ -113,15 +216,16 @@ def DFS(graph, start, end, verbose=False, branch_depht=25) -> list:
 
 class SlimUDigraph(object):
     """
-    A simplified class, from the UDgraph class, to store a slimmed digraph dictionary containing only units related to the start and end of the search.
-    The `edges` attribute is a dict mapping each node to a list of its children.
+    A simplified view, of the UDgraph or CompactUDigraph classes, to search through a slimmed digraph containing only units related to the start and end of the search.
+    The `graph` attribute is the complete network and the `selection` attribute is the set of names of the units kept in the slimmed digraph.
     The `children_of` method returns the list of nodes with direct relation to the key node. This method will be used by the search algorithms.
     """
-    def __init__(self, edges:dict={}):
-        self.edges = edges
+    def __init__(self, graph, selection:set):
+        self.graph = graph
+        self.selection = selection
 
     def children_of(self, node):
-        return self.edges[node][0] if node in self.edges else []
+        return self.graph.children_of(node) if node.get_name() in self.selection else []
 
 
 def lean_BFS(graph, start, end, verbose=False, max_generations_screening=25) -> list:
@@ -132,7 +236,7 @@ def lean_BFS(graph, start, end, verbose=False, max_generations_screening=25) ->
 
     Parameters
     ----------
-    graph: Digraph
+    graph: UDigraph or CompactUDigraph
     start: node
     end: node
     verbose: bool
@@ -145,21 +249,23 @@ def lean_BFS(graph, start, end, verbose=False, max_generations_screening=25) ->
     """
     from unyts.converter import _get_descendants
     max_generations_screening = unyts_parameters_.generations_limit() if max_generations_screening is None else max_generations_screening
+    if hasattr(graph, 'reachability') and not graph.reachability().reachable(start.get_name(), end.get_name()):
+        return None
     generations_list = [g for g in [0, 1, 2, 3, 4, 5, 7, 10, 13, 16, 20, 25, 30, 40, 50] if g < max_generations_screening] + [max_generations_screening]
     selection = set()
     for generations in generations_list:
         generations += 1
-        start_descendants = _get_descendants(start.get_name(), generations)
-        end_descendants = _get_descendants(end.get_name(), generations)
+        start_descendants = _get_descendants(start.get_name(), generations, graph=graph)
+        end_descendants = _get_descendants(end.get_name(), generations, graph=graph)
         selection = start_descendants.intersection(end_descendants)
         if len(selection) > 0:
             break
-    selection = selection.union({node for each in selection for node in _get_descendants(each, generations, get_combinations=False)})
-    selected_edges = {k: v for k, v in graph.edges.items() if k.get_name() in selection}
-    if len(selected_edges) > 0:
+    selection = selection.union({node for each in selection for node in _get_descendants(each, generations, get_combinations=False, graph=graph)})
+    selection = {name for name in selection if graph.has_node(name)}
+    if len(selection) > 0:
         if verbose:
-            logger.info(f"<lean BFS> search graph slimmed from {len(graph.edges)} to {len(selected_edges)} nodes, in {generations} generations.")
-        slim_graph = SlimUDigraph(selected_edges)
+            logger.info(f"<lean BFS> search graph slimmed from {len(graph.list_nodes())} to {len(selection)} nodes, in {generations} generations.")
+        slim_graph = SlimUDigraph(graph, selection)
         return BFS(slim_graph, start, end, verbose=verbose and unyts_parameters_.verbose_details_ > 0)
 
 class SerialRun(object):
@@ -192,7 +298,7 @@ def hybrid_BFS(graph, start, end, verbose=False, max_generations_screening=25) -
 
     Parameters
     ----------
-    graph: Digraph
+    graph: UDigraph or CompactUDigraph
     start: node
     end: node
     verbose: bool
@@ -215,16 +321,20 @@ def hybrid_BFS(graph, start, end, verbose=False, max_generations_screening=25) -
     else:
         raise NotImplementedError("No option defined for parallel processing.")
 
-    from .database import units_network
-
     verbose_ = verbose and unyts_parameters_.verbose_details_ > 0
     results_ = {'bfs': '', 'lean_bfs': ''}
     pythonwarnings = os.environ["PYTHONWARNINGS"] if "PYTHONWARNINGS" in os.environ else "default"
     os.environ["PYTHONWARNINGS"] = "ignore"
 
-    runner_lean_bfs = runner(target=_lean_bfs,
-                             args=(results_, units_network, start, end, verbose_, max_generations_screening))
-    runner_bfs = runner(target=_bfs, args=(results_, units_network, start, end, verbose_))
+    if runner is Thread:
+        # the threads run in a copy of the current context, to keep the session of the conversion
+        runner_lean_bfs = runner(target=copy_context().run,
+                                 args=(_lean_bfs, results_, graph, start, end, verbose_, max_generations_screening))
+        runner_bfs = runner(target=copy_context().run, args=(_bfs, results_, graph, start, end, verbose_))
+    else:
+        runner_lean_bfs = runner(target=_lean_bfs,
+                                 args=(results_, graph, start, end, verbose_, max_generations_screening))
+        runner_bfs = runner(target=_bfs, args=(results_, graph, start, end, verbose_))
     if verbose:
         logger.info(f"<hybrid BFS> starting BFS and lean_BFS threads, from {start} to {end}")
 
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 12:31:06 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+__version__ = '0.1.0'
+__release__ = 20261019
+__all__ = ['ConversionSession', 'in_session', 'current_session', 'conversion_session', 'new_session']
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import time
+
+from .parameters import unyts_parameters_
+
+
+class ConversionSession(object):
+    """
+    The state of a single call to `convert` or `convertible`, kept in a context variable so that concurrent calls from
+    different threads, or nested calls, do not share it:
+      - `visited` is the set of (from_unit, to_unit) pairs already tried, to avoid infinite looping.
+      - `max_recursion` is the recursion budget of the conversion.
+      - `timeout` is the number of seconds the searches can run, counted from the first check of `is_intime`, or
+        unlimited if not positive.
+    """
+    __slots__ = ('visited', 'max_recursion', 'timeout', 'start_time')
+
+    def __init__(self, timeout: int = None, max_recursion: int = None) -> None:
+        self.visited = set()
+        self.max_recursion = unyts_parameters_.max_recursion_ if max_recursion is None else max_recursion
+        self.timeout = unyts_parameters_.timeout_ if timeout is None else timeout
+        self.start_time = 0
+
+    @property
+    def deadline(self):
+        """
+        The time when the searches must stop, or None if not started yet or not limited in time.
+        """
+        return None if self.start_time == 0 or self.timeout <= 0 else self.start_time + self.timeout
+
+    def restart(self) -> None:
+        """
+        Starts counting the time of the session again, from the next check of `is_intime`.
+        """
+        self.start_time = 0
+
+    def is_intime(self) -> bool:
+        if self.start_time == 0:
+            self.start_time = time()
+            return True
+        return self.timeout <= 0 or time() - self.start_time <= self.timeout
+
+    def visit(self, from_unit: str, to_unit: str) -> None:
+        self.visited.add((from_unit, to_unit))
+
+    def is_visited(self, from_unit: str, to_unit: str) -> bool:
+        return (from_unit, to_unit) in self.visited
+
+
+_session = ContextVar('unyts_session', default=None)
+
+
+def in_session() -> bool:
+    """
+    Returns True if a ConversionSession is running in this context.
+    """
+    return _session.get() is not None
+
+
+def current_session() -> ConversionSession:
+    """
+    Returns the session of the running conversion, or a new session not attached to the context if there is none,
+    i.e.: when the search algorithms are called directly.
+    """
+    session = _session.get()
+    return ConversionSession() if session is None else session
+
+
+@contextmanager
+def conversion_session(timeout: int = None, max_recursion: int = None):
+    """
+    Runs the enclosed code in a new ConversionSession, restoring the previous session at exit.
+    """
+    session = ConversionSession(timeout, max_recursion)
+    token = _session.set(session)
+    try:
+        yield session
+    finally:
+        _session.reset(token)
+
+
+def new_session(function):
+    """
+    Decorator to run each call to `function` in its own ConversionSession.
+    """
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with conversion_session():
+            return function(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 10:05:26 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+__version__ = '0.1.0'
+__release__ = 20261021
+__all__ = ['SharedConversionCache']
+
+import os
+from json import dumps as json_dumps, loads as json_loads
+from threading import local
+
+from .memory import ConversionPlan, _encode_path, _decode_path
+from .helpers.cache_files import definitions_hash
+from .helpers.logger import logger
+
+try:
+    import sqlite3
+    _sqlite3_ = True
+except ModuleNotFoundError:
+    _sqlite3_ = False
+
+_schema = """CREATE TABLE IF NOT EXISTS conversions (
+    from_unit TEXT NOT NULL,
+    to_unit TEXT NOT NULL,
+    network TEXT NOT NULL,
+    plan TEXT,
+    path TEXT,
+    PRIMARY KEY (from_unit, to_unit, network)
+) WITHOUT ROWID"""
+
+
+class SharedConversionCache(object):
+    """
+    The conversions solved by any process, kept in a SQLite database in WAL mode, so the readers don't wait for the
+    writers and one process's search is a hit in the memory of the others.
+    It is the second tier of the ConversionMemory, consulted when a conversion is not in the memory of the process.
+    The conversions are saved as the plain-data records of ConversionPlan, keyed by the (from_unit, to_unit) pair and
+    the version of the network: the hash of its definitions and the hash of the conversions set by the user, so the
+    conversions are only shared by the processes that set the same conversions, in any order.
+    Each thread, and each forked process, opens its own connection. The errors of the database are logged and taken as
+    a miss, the conversion is then searched as without the shared cache.
+    """
+    __slots__ = ('path', 'graph', 'timeout', '_local')
+
+    def __init__(self, path: str, graph=None, timeout: float = 5.0) -> None:
+        if not _sqlite3_:
+            raise ModuleNotFoundError("Required module `sqlite3` not found in this Python installation.")
+        self.path, self.graph, self.timeout = path, graph, timeout
+        self._local = local()
+        self._connection()  # creates the database, to fail here if the path is not valid
+
+    @property
+    def network_version(self) -> str:
+        """
+        The version of the network the conversions are valid for.
+        """
+        custom = self.graph.custom_hash() if self.graph is not None else '0'
+        return f"{definitions_hash()}.{custom}"
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                                         check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(_schema)
+            self._local.connection, self._local.pid = connection, os.getpid()
+        return connection
+
+    def get_record(self, key):
+        """
+        Returns the [from_unit, to_unit, plan, path] record saved for the `key` pair of units, or None if not saved.
+        """
+        try:
+            row = self._connection().execute(
+                'SELECT plan, path FROM conversions WHERE from_unit = ? AND to_unit = ? AND network = ?',
+                (key[0], key[1], self.network_version)).fetchone()
+        except sqlite3.Error as error:
+            logger.warning(f"failed to read the shared cache {self.path}: {error}")
+            return None
+        if row is None:
+            return None
+        return [key[0], key[1], None if row[0] is None else json_loads(row[0]),
+                None if row[1] is None else json_loads(row[1])]
+
+    def get(self, key, default=None):
+        """
+        Returns the (conversion, conversion_path) saved for the `key` pair of units, or `default` if not saved.
+        """
+        record = self.get_record(key)
+        if record is None:
+            return default
+        if record[2] is None:
+            return None, None
+        return ConversionPlan.from_record(record[2]), _decode_path(record[3], self.graph)
+
+    def put(self, key, value) -> bool:
+        """
+        Saves the (conversion, conversion_path) `value` of the `key` pair of units.
+        Returns False if the conversion can not be described as plain data, or could not be written.
+        """
+        if type(key[0]) is not str or type(key[1]) is not str:
+            return False
+        if value is None or value[0] is None:
+            plan = path = None
+        else:
+            plan = ConversionPlan.from_conversion(value[0], value[1], self.graph)
+            path = _encode_path(value[1])
+            if plan is None or path is None:
+                return False
+            plan, path = json_dumps(plan.to_record()), json_dumps(path)
+        try:
+            self._connection().execute('INSERT OR REPLACE INTO conversions VALUES (?, ?, ?, ?, ?)',
+                                       (key[0], key[1], self.network_version, plan, path))
+        except sqlite3.Error as error:
+            logger.warning(f"failed to write the shared cache {self.path}: {error}")
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return self._connection().execute('SELECT COUNT(*) FROM conversions WHERE network = ?',
+                                          (self.network_version,)).fetchone()[0]
+
+    def clear(self) -> None:
+        """
+        Removes the conversions saved for every version of the network.
+        """
+        self._connection().execute('DELETE FROM conversions')
+
+    def close(self) -> None:
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None and self._local.pid == os.getpid():
+            connection.close()
+        self._local.connection = None
+
+    def __repr__(self) -> str:
+        return f"SharedConversionCache('{self.path}')"
@@ -15,7 +15,8 @@ from .operations import unit_product as _unit_product, unit_division as _unit_di
     unit_base_power as _unit_base_power
 from .helpers.unit_string_tools import reduce_units as _reduce_units
 from .converter import convert as _convert, convertible as _convertible
-from .dictionaries import _all_units
+from .database import resolve_prefix as _resolve_prefix
+from .dictionaries import _units_kinds, _load_units_kinds
 from .parameters import unyts_parameters_
 from .helpers.logger import logger
 from numbers import Number
@@ -28,11 +29,8 @@ try:
     _numpy_ = True
 except ModuleNotFoundError:
     _numpy_ = False
-try:
-    from pandas import Series, DataFrame
-    _pandas_ = True
-except ModuleNotFoundError:
-    _pandas_ = False
+# pandas is imported by whoever makes a Series or DataFrame, not by unyts
+from .helpers.pandas_types import Series, DataFrame, _pandas_
 
 if _numpy_ and _pandas_:
     _number = (int, float, complex, int32, int64, float32, float64)
@@ -75,7 +73,7 @@ class Unit(object, metaclass=UnytType):
     operations and conversions.
     """
     class_units = []
-    _all_units_str = _all_units()
+    _units_kinds = _units_kinds  # filled the first time a Unit is made
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units=None, name=None):
@@ -86,7 +84,7 @@ class Unit(object, metaclass=UnytType):
                 value = value.value
         if units is None:
             units = 'dimensionless'
-        elif type(units) is str and units.strip() in Unit._all_units_str:
+        elif type(units) is str and _is_unit_name(units.strip()):
             units = units.strip()
         elif unyts_parameters_.raise_error:
             raise WrongUnitsError(f"'{units}' is not a valid units name. Valid are: {self.kind.class_units}")
@@ -158,7 +156,7 @@ class Unit(object, metaclass=UnytType):
         else:
             raise NotImplementedError("dtype not implemented without NumPy.")
 
-    def convert(self, new_unit: str):
+    def convert(self, new_unit: str, dtype_policy: str = None):
         if type(new_unit) is not str and hasattr(new_unit, 'units') and type(new_unit.units) is str:
             new_unit = new_unit.units
         elif type(new_unit) is not str:
@@ -172,12 +170,12 @@ class Unit(object, metaclass=UnytType):
                 raise WrongUnitsError("'" + str(new_unit) + "' is not valid units for " + str(type(self)) + ".")
         if type(self) is Unit:
             from .units.define import units
-            return units(_convert(self.__value, self.unit, new_unit), new_unit)
+            return units(_convert(self.__value, self.unit, new_unit, dtype_policy=dtype_policy), new_unit)
         else:
-            return self.kind(_convert(self.__value, self.unit, new_unit), new_unit)
+            return self.kind(_convert(self.__value, self.unit, new_unit, dtype_policy=dtype_policy), new_unit)
 
-    def to(self, new_unit):
-        return self.convert(new_unit)
+    def to(self, new_unit, dtype_policy: str = None):
+        return self.convert(new_unit, dtype_policy)
 
     def __neg__(self):
         return self.kind(self.value.__neg__(), self.unit)
@@ -663,7 +661,8 @@ class Unit(object, metaclass=UnytType):
             units = units.units
         else:
             raise WrongUnitsError(f"'{units}' for '{type(self)}'.")
-        if units in self.kind.class_units:
+        if (Unit._units_kinds or _load_units_kinds()).get(units) == self.kind.__name__ or \
+                units in self.kind.class_units:
             return units
         else:
             raise WrongUnitsError(f"'{units}' for '{type(self)}'.")
@@ -674,8 +673,17 @@ def is_Unit(obj) -> bool:
     return isinstance(obj, Unit)
 
 
+def _is_unit_name(unit_name: str) -> bool:
+    """
+    Returns True if `unit_name` is a unit of the dictionary, making it first if it is a prefixed unit to be parsed.
+    """
+    units_kinds = Unit._units_kinds or _load_units_kinds()
+    return unit_name in units_kinds or (_resolve_prefix(unit_name) and unit_name in units_kinds)
+
+
 def valid_unit(unit_name:str) -> bool:
-    if unit_name is None or (type(unit_name) is str and unit_name.strip() in Unit._all_units_str):
+    if unit_name is None or \
+            (type(unit_name) is str and _is_unit_name(unit_name.strip())):
         return True
     else:
         return False
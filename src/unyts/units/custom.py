@@ -11,7 +11,7 @@ __release__ = 20250323
 __all__ = ['CustomUnits', 'UserUnits', 'OtherUnits', 'set_unit', 'set_conversion']
 
 from ..unit_class import Unit
-from ..dictionaries import dictionary
+from ..dictionaries import dictionary, _KindUnits
 from ..helpers.common_classes import unit_or_str, numeric
 
 
@@ -24,7 +24,7 @@ def OtherUnits(value: numeric, units: unit_or_str, name=None) -> Unit:
 
 
 class UserUnits(Unit):
-    class_units = dictionary['UserUnits']
+    class_units = _KindUnits('UserUnits')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -44,7 +44,8 @@ class UserUnits(Unit):
 def set_unit(unit_name: str) -> bool:
     from ..database import units_network
     from ..network import UNode
-    units_network.add_node(UNode(unit_name))
+    if not units_network.has_node(unit_name):
+        units_network.add_node(UNode(unit_name))
 
 
 def set_conversion(from_units: str, to_units: str, conversion, reverse_conversion=None) -> bool:
@@ -69,11 +70,16 @@ def set_conversion(from_units: str, to_units: str, conversion, reverse_conversio
     if not hasattr(reverse_conversion, '__call__') and hasattr(reverse_conversion, '__getitem__'):
         raise TypeError("`reverse_conversion` must be callable.")
 
-    units_network.add_node(UNode(from_units))
-    units_network.add_node(UNode(to_units))
+    if not units_network.has_node(from_units):
+        units_network.add_node(UNode(from_units))
+    if not units_network.has_node(to_units):
+        units_network.add_node(UNode(to_units))
     units_network.add_edge(Conversion(units_network.get_node(from_units),
                                       units_network.get_node(to_units),
                                       conversion))
     units_network.add_edge(Conversion(units_network.get_node(to_units),
                                       units_network.get_node(from_units),
                                       reverse_conversion))
+    # the conversions set by the user are part of the version of the network in the shared cache
+    units_network.add_custom(from_units, to_units, conversion)
+    units_network.add_custom(to_units, from_units, reverse_conversion)
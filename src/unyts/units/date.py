@@ -10,7 +10,7 @@ __version__ = '0.5.31'
 __release__ = 20250323
 __all__ = ['Date']
 
-from ..dictionaries import dictionary as _dictionary
+from ..dictionaries import _KindUnits
 from ..errors import WrongDateFormatError
 from ..unit_class import Unit
 from .time import Time
@@ -19,7 +19,7 @@ from numpy import datetime64, timedelta64
 
 
 class Date(Unit):
-    class_units = _dictionary['Date']
+    class_units = _KindUnits('Date')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value, units='date', name=None):
@@ -10,8 +10,8 @@ __version__ = '0.5.30'
 __release__ = 20230724
 __all__ = ['units']
 
-from ..dictionaries import dictionary as _dictionary, uncertain_names
-from .custom import UserUnits
+from ..dictionaries import uncertain_names, _load_units_kinds
+from .custom import UserUnits, OtherUnits
 from .data import *
 from .date import *
 from .energy import *
@@ -24,8 +24,20 @@ from .temperature import *
 from .time import *
 from .unitless import Dimensionless, Percentage
 from ..unit_class import Unit
+from ..database import resolve_prefix as _resolve_prefix
 from ..helpers.common_classes import unit_or_str as unit_or_str, numeric as numeric, numeric_ as _numeric
 
+# the Unit class of each kind of the dictionary, by the name of the kind
+_classes = {'Acceleration': Acceleration, 'Area': Area, 'Capacitance': Capacitance, 'Charge': Charge,
+            'Compressibility': Compressibility, 'Conductance': Conductance, 'Current': Current, 'Data': Data,
+            'Date': Date, 'Density': Density, 'Dimensionless': Dimensionless, 'Energy': Energy, 'Force': Force,
+            'Frequency': Frequency, 'Impedance': Impedance, 'Inductance': Inductance, 'Length': Length, 'Mass': Mass,
+            'Percentage': Percentage, 'Permeability': Permeability, 'Power': Power, 'Pressure': Pressure,
+            'PressureGradient': PressureGradient, 'ProductivityIndex': ProductivityIndex, 'Rate': Rate,
+            'Resistance': Resistance, 'Temperature': Temperature, 'TemperatureGradient': TemperatureGradient,
+            'Time': Time, 'UserUnits': UserUnits, 'Velocity': Velocity, 'Viscosity': Viscosity, 'Voltage': Voltage,
+            'Volume': Volume, 'VolumeRatio': VolumeRatio, 'Weight': Weight, 'otherUnits': OtherUnits}
+
 
 def units(value: numeric, unit: unit_or_str=None, name=None) -> Unit:
     """
@@ -67,16 +79,11 @@ def units(value: numeric, unit: unit_or_str=None, name=None) -> Unit:
     if (type(unit) is str and unit == 'date') or type(unit) is Date:
         return Date(value, 'date', name)
 
-    for kind in _dictionary:
-        if unit in _dictionary[kind]:
-            if "'" in unit:
-                u = eval(kind + '''(0, "''' + unit + '''")''', name)
-            else:
-                u = eval(kind + """(0, '""" + unit + """')""", name)
-            if type(u) is Percentage:
-                u.value = value / 100
-            else:
-                u.value = value
-            return u
+    units_kinds = Unit._units_kinds or _load_units_kinds()
+    if unit not in units_kinds:
+        _resolve_prefix(unit)  # with prefix parsing, the prefixed units are made the first time they are used
+    kind = _classes.get(units_kinds.get(unit))
+    if kind is not None:
+        return kind(value, unit, name)
 
     return UserUnits(value, unit, name)
@@ -10,14 +10,14 @@ __version__ = '0.5.31'
 __release__ = 20250323
 __all__ = ['Energy', 'Power', 'Current', 'Voltage', 'Resistance', 'Conductance', 'Capacitance', 'Charge', 'Inductance', 'Impedance']
 
-from ..dictionaries import dictionary as _dictionary
+from ..dictionaries import _KindUnits
 from ..unit_class import Unit
 from ..helpers.common_classes import unit_or_str, numeric
 from .time import Time
 
 
 class Energy(Unit):
-    class_units = _dictionary['Energy']
+    class_units = _KindUnits('Energy')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -36,7 +36,7 @@ class Energy(Unit):
 
 
 class Power(Unit):
-    class_units = _dictionary['Power']
+    class_units = _KindUnits('Power')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -61,7 +61,7 @@ class Power(Unit):
 
 
 class Current(Unit):
-    class_units = _dictionary['Current']
+    class_units = _KindUnits('Current')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -78,7 +78,7 @@ class Current(Unit):
 
 
 class Voltage(Unit):
-    class_units = _dictionary['Voltage']
+    class_units = _KindUnits('Voltage')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -105,7 +105,7 @@ class Voltage(Unit):
 
 
 class Resistance(Unit):
-    class_units = _dictionary['Resistance']
+    class_units = _KindUnits('Resistance')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -123,7 +123,7 @@ class Resistance(Unit):
 
 
 class Conductance(Unit):
-    class_units = _dictionary['Conductance']
+    class_units = _KindUnits('Conductance')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -134,7 +134,7 @@ class Conductance(Unit):
 
 
 class Capacitance(Unit):
-    class_units = _dictionary['Capacitance']
+    class_units = _KindUnits('Capacitance')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -151,7 +151,7 @@ class Capacitance(Unit):
 
 
 class Charge(Unit):
-    class_units = _dictionary['Charge']
+    class_units = _KindUnits('Charge')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -168,7 +168,7 @@ class Charge(Unit):
 
 
 class Inductance(Unit):
-    class_units = _dictionary['Inductance']
+    class_units = _KindUnits('Inductance')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -179,7 +179,7 @@ class Inductance(Unit):
 
 
 class Impedance(Unit):
-    class_units = _dictionary['Impedance']
+    class_units = _KindUnits('Impedance')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -10,13 +10,13 @@ __version__ = '0.5.31'
 __release__ = 20250320
 __all__ = ['Force', 'Pressure', 'Weight', 'Compressibility', 'Viscosity']
 
-from ..dictionaries import dictionary as _dictionary
+from ..dictionaries import _KindUnits
 from ..unit_class import Unit
 from ..helpers.common_classes import unit_or_str, numeric
 
 
 class Force(Unit):
-    class_units = _dictionary['Force']
+    class_units = _KindUnits('Force')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -27,7 +27,7 @@ class Force(Unit):
 
 
 class Pressure(Unit):
-    class_units = _dictionary['Pressure']
+    class_units = _KindUnits('Pressure')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -38,7 +38,7 @@ class Pressure(Unit):
 
 
 class Weight(Unit):
-    class_units = _dictionary['Weight']
+    class_units = _KindUnits('Weight')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -49,7 +49,7 @@ class Weight(Unit):
 
 
 class Compressibility(Unit):
-    class_units = _dictionary['Compressibility']
+    class_units = _KindUnits('Compressibility')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -60,7 +60,7 @@ class Compressibility(Unit):
 
 
 class Viscosity(Unit):
-    class_units = _dictionary['Viscosity']
+    class_units = _KindUnits('Viscosity')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -10,13 +10,13 @@ __version__ = '0.5.31'
 __release__ = 20250320
 __all__ = ['Length', 'Area', 'Volume', 'Permeability']
 
-from ..dictionaries import dictionary as _dictionary
+from ..dictionaries import _KindUnits
 from ..unit_class import Unit
 from ..helpers.common_classes import unit_or_str, numeric
 
 
 class Length(Unit):
-    class_units = _dictionary['Length']
+    class_units = _KindUnits('Length')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -27,7 +27,7 @@ class Length(Unit):
 
 
 class Area(Unit):
-    class_units = _dictionary['Area']
+    class_units = _KindUnits('Area')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -38,7 +38,7 @@ class Area(Unit):
 
 
 class Volume(Unit):
-    class_units = _dictionary['Volume']
+    class_units = _KindUnits('Volume')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -49,7 +49,7 @@ class Volume(Unit):
 
 
 class Permeability(Unit):
-    class_units = _dictionary['Permeability']
+    class_units = _KindUnits('Permeability')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
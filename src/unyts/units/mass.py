@@ -10,13 +10,13 @@ __version__ = '0.5.31'
 __release__ = 20250320
 __all__ = ['Mass']
 
-from ..dictionaries import dictionary as _dictionary
+from ..dictionaries import _KindUnits
 from ..unit_class import Unit
 from ..helpers.common_classes import unit_or_str, numeric
 
 
 class Mass(Unit):
-    class_units = _dictionary['Mass']
+    class_units = _KindUnits('Mass')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -10,13 +10,13 @@ __version__ = '0.5.31'
 __release__ = 20250320
 __all__ = ['Rate', 'Speed', 'Velocity', 'Acceleration']
 
-from ..dictionaries import dictionary as _dictionary
+from ..dictionaries import _KindUnits
 from ..unit_class import Unit
 from ..helpers.common_classes import unit_or_str, numeric
 
 
 class Rate(Unit):
-    class_units = _dictionary['Rate']
+    class_units = _KindUnits('Rate')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -27,7 +27,7 @@ class Rate(Unit):
 
 
 class Velocity(Unit):
-    class_units = _dictionary['Velocity']
+    class_units = _KindUnits('Velocity')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -42,7 +42,7 @@ def Speed(value: numeric, units: unit_or_str, name=None):
 
 
 class Acceleration(Unit):
-    class_units = _dictionary['Acceleration']
+    class_units = _KindUnits('Acceleration')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -10,13 +10,13 @@ __version__ = '0.5.32'
 __release__ = 20250320
 __all__ = ['Density', 'VolumeRatio', 'ProductivityIndex', 'PressureGradient', 'TemperatureGradient']
 
-from ..dictionaries import dictionary as _dictionary
+from ..dictionaries import _KindUnits
 from ..unit_class import Unit
 from ..helpers.common_classes import unit_or_str, numeric
 
 
 class Density(Unit):
-    class_units = _dictionary['Density']
+    class_units = _KindUnits('Density')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -27,7 +27,7 @@ class Density(Unit):
 
 
 class VolumeRatio(Unit):
-    class_units = _dictionary['VolumeRatio']
+    class_units = _KindUnits('VolumeRatio')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -38,7 +38,7 @@ class VolumeRatio(Unit):
 
 
 class ProductivityIndex(Unit):
-    class_units = _dictionary['ProductivityIndex']
+    class_units = _KindUnits('ProductivityIndex')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -49,7 +49,7 @@ class ProductivityIndex(Unit):
 
 
 class PressureGradient(Unit):
-    class_units = _dictionary['PressureGradient']
+    class_units = _KindUnits('PressureGradient')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -59,7 +59,7 @@ class PressureGradient(Unit):
         self.__unit = self.check_unit(units)
 
 class TemperatureGradient(Unit):
-    class_units = _dictionary['TemperatureGradient']
+    class_units = _KindUnits('TemperatureGradient')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -10,13 +10,13 @@ __version__ = '0.5.31'
 __release__ = 20250320
 __all__ = ['Temperature', 'TemperatureGradient']
 
-from ..dictionaries import dictionary as _dictionary
+from ..dictionaries import _KindUnits
 from ..unit_class import Unit
 from ..helpers.common_classes import unit_or_str, numeric
 
 
 class Temperature(Unit):
-    class_units = _dictionary['Temperature']
+    class_units = _KindUnits('Temperature')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str, name=None):
@@ -27,7 +27,7 @@ class Temperature(Unit):
 
 
 class TemperatureGradient(Unit):
-    class_units = _dictionary['TemperatureGradient']
+    class_units = _KindUnits('TemperatureGradient')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: str, units: unit_or_str, name=None):
@@ -10,7 +10,7 @@ __version__ = '0.5.31'
 __release__ = 20250320
 __all__ = ['Dimensionless', 'Percentage', 'unitless_names']
 
-from ..dictionaries import dictionary as _dictionary
+from ..dictionaries import dictionary as _dictionary, _KindUnits
 from ..unit_class import Unit
 from ..errors import WrongUnitsError
 from ..helpers.common_classes import unit_or_str, numeric
@@ -18,7 +18,7 @@ from ..dictionaries import unitless_names
 
 
 class Dimensionless(Unit):
-    class_units = _dictionary['Dimensionless']
+    class_units = _KindUnits('Dimensionless')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str = None, name=None):
@@ -50,7 +50,7 @@ class Dimensionless(Unit):
 
 
 class Percentage(Dimensionless):
-    class_units = _dictionary['Percentage']
+    class_units = _KindUnits('Percentage')
     __slots__ = ('__unit', '__value', 'name', 'kind')
 
     def __init__(self, value: numeric, units: unit_or_str = None, name=None):
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for the units network and converter.
+These scripts are not collected by pytest, run them as modules, i.e.:
+    python -m tests.benchmarks.bench_network
+"""
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the conversion of large arrays through paths folded into a single affine function.
+
+Reports, for several conversion paths, the time to convert a 10M-element array applying every conversion of the path
+one by one, and applying the folded function memorized by `_get_conversion`.
+
+run as:
+    python -m tests.benchmarks.bench_affine
+"""
+
+from timeit import repeat
+
+import numpy as np
+
+from unyts.converter import _get_conversion, _conversion_loop
+from unyts.database import units_network
+
+sample_pairs = (('km', 'mi'), ('ft3', 'bbl'), ('C', 'F'), ('F', 'K'))
+
+
+def folded_vs_stepwise(size: int = 10_000_000) -> dict:
+    array = np.random.rand(size)
+    results = {}
+    for from_unit, to_unit in sample_pairs:
+        folded, conversion_path = _get_conversion(None, from_unit, to_unit)
+        steps = [units_network.conversion(conversion_path[i], conversion_path[i + 1])
+                 for i in range(len(conversion_path) - 1)]
+        stepwise_time = min(repeat(lambda: _conversion_loop(array, steps), number=1, repeat=3))
+        folded_time = min(repeat(lambda: folded(array), number=1, repeat=3))
+        results[(from_unit, to_unit)] = stepwise_time, folded_time
+        print(f"{from_unit} to {to_unit} ({len(steps)} steps): stepwise {stepwise_time * 1E3:,.1f} ms, "
+              f"folded {folded_time * 1E3:,.1f} ms")
+    return results
+
+
+if __name__ == '__main__':
+    folded_vs_stepwise()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the latency of the conversion of a scalar already solved and memorized.
+
+Reports the time of `convert` for memorized conversions, and the time of the checks of the kind of the units done on
+every conversion, checking the membership in the frozensets of the kinds and in the tuples of the dictionary as done
+before.
+
+run as:
+    python -m tests.benchmarks.bench_cache_hit [repetitions]
+"""
+
+import sys
+from timeit import timeit
+
+from unyts import convert, unyts_parameters_
+from unyts.dictionaries import dictionary, _kind_units
+
+sample_pairs = (('ft', 'm'), ('psia', 'bar'), ('m3', 'kg'), ('stb/day', 'm3/day'))
+
+
+def _checks(from_unit: str, to_unit: str, kind_units) -> bool:
+    # the membership checks of `_density_conversion` and of the special cases of `_get_conversion`
+    return (from_unit in kind_units('Volume') and to_unit in kind_units('Weight')) or \
+        (to_unit in kind_units('Volume') and from_unit in kind_units('Weight')) or \
+        (from_unit in kind_units('Date') and to_unit in kind_units('Date')) or \
+        from_unit.lower() in kind_units('Dimensionless') or to_unit.lower() in kind_units('Percentage')
+
+
+def compare(repetitions: int = 100_000) -> dict:
+    print_path, unyts_parameters_.print_path_ = unyts_parameters_.print_path_, False
+    results = {}
+    try:
+        for from_unit, to_unit in sample_pairs:
+            convert(1.0, from_unit, to_unit)  # solved and memorized before measuring
+            conversion = timeit(lambda: convert(1.0, from_unit, to_unit), number=repetitions) / repetitions
+            sets = timeit(lambda: _checks(from_unit, to_unit, _kind_units), number=repetitions) / repetitions
+            tuples = timeit(lambda: _checks(from_unit, to_unit, dictionary.get), number=repetitions) / repetitions
+            results[(from_unit, to_unit)] = conversion, sets, tuples
+            print(f"{from_unit} to {to_unit}: convert {conversion * 1e6:,.2f} us, kind checks in frozensets "
+                  f"{sets * 1e6:,.2f} us, in tuples {tuples * 1e6:,.2f} us")
+    finally:
+        unyts_parameters_.print_path_ = print_path
+    return results
+
+
+if __name__ == '__main__':
+    compare(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
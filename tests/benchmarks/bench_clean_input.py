@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the memory used to convert a large DataFrame, 1 GB of float64 values by default.
+
+Reports the peak of memory allocated, traced by `tracemalloc`, while cleaning the input of `convert` and while
+converting the whole DataFrame, and the peak of the former cleaning that copied every iterable into a new array.
+
+run as:
+    python -m tests.benchmarks.bench_clean_input [size in GB]
+"""
+
+import sys
+import tracemalloc
+import numpy as np
+from pandas import DataFrame
+
+from unyts import convert, unyts_parameters_
+from unyts.converter import _clean_input
+
+columns = 8
+
+
+def _peak(function, *args) -> int:
+    tracemalloc.start()
+    try:
+        result = function(*args)
+        return tracemalloc.get_traced_memory()[1], result
+    finally:
+        tracemalloc.stop()
+
+
+def compare(size: float = 1.0) -> dict:
+    print_path, unyts_parameters_.print_path_ = unyts_parameters_.print_path_, False
+    frame = DataFrame(np.random.default_rng(0).random((int(size * 2 ** 30 / 8 / columns), columns)),
+                      columns=[f"column_{i}" for i in range(columns)])
+    frame_size = frame.memory_usage(index=True).sum()
+    convert(1, 'psia', 'bar')  # solved and memorized before measuring
+    results = {}
+    try:
+        results['former cleaning'], _ = _peak(lambda value: np.array(value).nbytes, frame)
+        results['cleaning'], (cleaned, _, _) = _peak(_clean_input, frame, 'psia', 'bar')
+        assert cleaned is frame
+        results['conversion'], converted = _peak(convert, frame, 'psia', 'bar')
+        assert type(converted) is DataFrame and converted.index.equals(frame.index)
+    finally:
+        unyts_parameters_.print_path_ = print_path
+    print(f"DataFrame of {frame_size / 2 ** 30:,.2f} GB")
+    for step, peak in results.items():
+        print(f"{step}: peak {peak / 2 ** 30:,.3f} GB ({peak / frame_size:,.2f} times the DataFrame)")
+    return results
+
+
+if __name__ == '__main__':
+    compare(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0)
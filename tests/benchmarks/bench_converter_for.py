@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the compiled Converter callables made by `converter_for`, used in hot loops calling the same conversions.
+
+Reports for several pairs of units the time per call of `convert`, which cleans the input and looks up the memory on
+every call, and of the Converter solved once.
+
+run as:
+    python -m tests.benchmarks.bench_converter_for
+"""
+
+from time import perf_counter
+
+from unyts import convert, converter_for, unyts_parameters_
+
+sample_pairs = (('psia', 'bar'), ('degC', 'degF'), ('m3', 'bbl'), ('g/cm3', 'lb/ft3'), ('m/s', 'ft/day'))
+repeat = 10000
+
+
+def compare() -> dict:
+    print_path, unyts_parameters_.print_path_ = unyts_parameters_.print_path_, False
+    results = {}
+    try:
+        for src, dest in sample_pairs:
+            convert(1.5, src, dest)  # solved and memorized before timing
+            start = perf_counter()
+            for _ in range(repeat):
+                convert(1.5, src, dest)
+            convert_time = (perf_counter() - start) / repeat
+            converter = converter_for(src, dest)
+            start = perf_counter()
+            for _ in range(repeat):
+                converter(1.5)
+            converter_time = (perf_counter() - start) / repeat
+            results[(src, dest)] = convert_time, converter_time
+            print(f"{src} -> {dest}: convert {convert_time * 1E6:,.2f} µs, Converter {converter_time * 1E6:,.3f} µs "
+                  f"({convert_time / converter_time:,.0f}x)")
+    finally:
+        unyts_parameters_.print_path_ = print_path
+    return results
+
+
+if __name__ == '__main__':
+    compare()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of `_get_descendants`, used to screen the network by lean_BFS and DFS.
+
+Reports, for several units and their numerator and denominator, the time of the former expansion over the whole
+`get_edges_str()` dict on every generation compared to the frontier expansion of `UDigraph.descendants`, and the time of
+`_get_descendants`, including the combinations of ratios, on a cold memory and memorized.
+
+run as:
+    python -m tests.benchmarks.bench_descendants
+"""
+
+from time import perf_counter
+
+from unyts.converter import _get_descendants
+from unyts.database import units_network
+
+sample_units = ('psi/ft', 'stb/day', 'kg/m3', 'meter', 'Kelvin')
+generations = 6
+
+
+def full_scan(unit: str, generations: int) -> set:
+    # the former expansion, for reference
+    children = {unit}
+    for g in range(generations):
+        children = children.union({each for k, v in units_network.get_edges_str().items() for each in v
+                                   if k in children})
+    return children
+
+
+def compare() -> dict:
+    units_network.get_edges_str()  # build the string edges before timing the full scan
+    results = {}
+    for unit in sample_units:
+        parts = [each for each in unit.split('/') if units_network.has_node(each)]
+        start = perf_counter()
+        for each in parts:
+            full_scan(each, generations)
+        scan_time = perf_counter() - start
+        start = perf_counter()
+        for each in parts:
+            units_network.descendants(each, generations)
+        frontier_time = perf_counter() - start
+        units_network.descendants_memory().clear()
+        start = perf_counter()
+        descendants = _get_descendants(unit, generations)
+        cold_time = perf_counter() - start
+        start = perf_counter()
+        _get_descendants(unit, generations)
+        warm_time = perf_counter() - start
+        results[unit] = scan_time, frontier_time, cold_time, warm_time
+        print(f"{unit}: full scan {scan_time * 1E3:,.2f} ms, frontier {frontier_time * 1E3:,.2f} ms; "
+              f"_get_descendants ({len(descendants):,} in {generations} generations) cold {cold_time * 1E3:,.2f} ms, "
+              f"memorized {warm_time * 1E6:,.1f} µs")
+    return results
+
+
+if __name__ == '__main__':
+    compare()
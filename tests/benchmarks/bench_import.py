@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the time to import unyts, and of the first conversion that loads the units dictionary and network.
+
+Imports unyts in new interpreters with `python -X importtime`, reporting the median of the cumulative import time of
+the package and the modules with the largest self time, and then the time of the first conversion.
+
+run as:
+    python -m tests.benchmarks.bench_import [repetitions]
+"""
+
+import os
+import subprocess
+import sys
+from statistics import median
+
+_first_conversion = """
+from time import perf_counter
+start = perf_counter()
+import unyts
+imported = perf_counter()
+unyts.convert(1, 'ft', 'm')
+print(imported - start, perf_counter() - imported)
+"""
+
+
+def _environment() -> dict:
+    environment = dict(os.environ)
+    source = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'src')
+    environment['PYTHONPATH'] = os.pathsep.join([source] + [environment['PYTHONPATH']]
+                                                if 'PYTHONPATH' in environment else [source])
+    return environment
+
+
+def import_times() -> dict:
+    """
+    Returns the self and cumulative import time, in microseconds, of each module imported by `import unyts`.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import unyts'], env=_environment(),
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(self_time), int(cumulative)
+    return times
+
+
+def compare(repetitions: int = 5, top: int = 10) -> dict:
+    runs = [import_times() for _ in range(repetitions)]
+    total = median(run['unyts'][1] for run in runs)
+    print(f"import unyts: {total / 1e3:,.1f} ms (median of {repetitions} runs)")
+    print(f"{'module':<40} {'self [ms]':>10} {'cumulative [ms]':>16}")
+    for name, (self_time, cumulative) in sorted(runs[-1].items(), key=lambda item: -item[1][0])[:top]:
+        print(f"{name:<40} {self_time / 1e3:>10,.1f} {cumulative / 1e3:>16,.1f}")
+    print(f"pandas imported: {'pandas' in runs[-1]}, tkinter imported: {'tkinter' in runs[-1]}")
+
+    result = subprocess.run([sys.executable, '-c', _first_conversion], env=_environment(),
+                            capture_output=True, text=True, check=True)
+    imported, converted = (float(each) for each in result.stdout.split()[-2:])
+    print(f"import: {imported * 1e3:,.1f} ms, first conversion loading the units: {converted * 1e3:,.1f} ms")
+    return {'import': total, 'first conversion': converted}
+
+
+if __name__ == '__main__':
+    compare(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the units network construction and node lookups.
+
+Reports:
+  - the cold time to build the network from a freshly loaded dictionary (no cache involved).
+  - the time per call of `UDigraph.get_node` and `UDigraph.has_node`, compared to the former linear scan over `edges`.
+
+run as:
+    python -m tests.benchmarks.bench_network
+"""
+
+from time import perf_counter
+from timeit import repeat
+
+import unyts.database as database
+from unyts.dictionaries import _load_dictionary
+from unyts.parameters import unyts_parameters_
+
+sample_names = ('m', 'ft', 'meter', 'psia', 'barsa', 'kPa', 'stb', 'sm3', 'kg', 'lb', 'day', 'Kelvin', 'not_a_unit')
+
+
+def cold_build() -> float:
+    cache_ = unyts_parameters_.cache_
+    unyts_parameters_.cache_ = False  # do not overwrite the cache files while benchmarking
+    loaded_dictionary = database.dictionary
+    try:
+        database.dictionary = _load_dictionary()[0]
+        start = perf_counter()
+        network = database._load_network()
+        database._clean_network(network)
+        elapsed = perf_counter() - start
+    finally:
+        database.dictionary = loaded_dictionary
+        unyts_parameters_.cache_ = cache_
+    print(f"cold network build: {elapsed:.3f} s, {len(network.edges)} nodes, "
+          f"{sum(len(children) for children, _ in network.edges.values())} edges")
+    return elapsed
+
+
+def lookups(number: int = 10000) -> dict:
+    network = database.units_network
+
+    def linear_scan(name):
+        return [n for n in network.edges if n.get_name() == name]
+
+    results = {}
+    for label, function in (('get_node', lambda n: network.has_node(n) and network.get_node(n)),
+                            ('has_node', network.has_node),
+                            ('linear scan (reference)', linear_scan)):
+        calls = number if label != 'linear scan (reference)' else max(1, number // 100)
+        best = min(repeat(lambda: [function(name) for name in sample_names], number=calls, repeat=3))
+        results[label] = best / (calls * len(sample_names))
+        print(f"{label}: {results[label] * 1E9:,.0f} ns per lookup")
+    return results
+
+
+if __name__ == '__main__':
+    cold_build()
+    lookups()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the network made with every prefixed unit, and with prefix parsing making the prefixed units when first
+used.
+
+For each mode, makes the units network from the definitions and then loads it from its cache files, in new
+interpreters, reporting the time, the peak of resident memory, the size of the network and of the dictionary, and the
+size of the cache files. Then converts some prefixed units, to check both modes give the same conversions.
+
+run as:
+    python -m tests.benchmarks.bench_prefix_parsing
+"""
+
+import os
+import subprocess
+import sys
+from json import loads as json_loads
+
+from tests.benchmarks.bench_import import _environment
+
+sample_pairs = (('kPa', 'psi'), ('MW', 'hp'), ('km', 'mi'), ('MMscf', 'm3'), ('GB', 'Mbit'), ('kg/m3', 'lb/ft3'))
+
+_load = """
+import json
+import resource
+import sys
+from time import perf_counter
+from unyts import unyts_parameters_, convert
+from unyts.database import load_units, units_network
+from unyts.dictionaries import dictionary, _units_cache_files
+previous = unyts_parameters_.prefix_parsing_, unyts_parameters_.reload_, unyts_parameters_.show_version_
+unyts_parameters_.prefix_parsing_, unyts_parameters_.reload_ = {prefix_parsing}, {reload}
+unyts_parameters_.show_version_ = False
+try:
+    start = perf_counter()
+    load_units()
+    seconds = perf_counter() - start
+    nodes, edges = len(units_network.edges), sum(len(children) for children, _ in units_network.edges.values())
+    names = sum(len(units) for units in dictionary.values())
+    conversions = [convert(1, from_unit, to_unit) for from_unit, to_unit in {pairs}]
+    files = [os.path.getsize(path) if os.path.exists(path) else 0 for path in _units_cache_files()]
+finally:
+    unyts_parameters_.prefix_parsing_, unyts_parameters_.reload_, unyts_parameters_.show_version_ = previous
+    unyts_parameters_.save_params()
+print('result:', json.dumps({{'seconds': seconds, 'peak': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+                            'nodes': nodes, 'edges': edges, 'names': names, 'conversions': conversions,
+                            'files': sum(files)}}))
+"""
+
+
+def _run(prefix_parsing: bool, reload: bool) -> dict:
+    script = 'import os\n' + _load.format(prefix_parsing=prefix_parsing, reload=reload, pairs=sample_pairs)
+    result = subprocess.run([sys.executable, '-c', script], env=_environment(), capture_output=True, text=True,
+                            check=True)
+    return json_loads([line for line in result.stdout.splitlines() if line.startswith('result: ')][-1][8:])
+
+
+def compare() -> dict:
+    results = {}
+    for prefix_parsing in (False, True):
+        mode = 'prefix parsing' if prefix_parsing else 'every prefixed unit'
+        made, loaded = _run(prefix_parsing, True), _run(prefix_parsing, False)
+        results[mode] = made, loaded
+        print(f"{mode}: {made['nodes']:,} nodes, {made['edges']:,} edges, {made['names']:,} names in the dictionary, "
+              f"cache files {made['files'] / 2 ** 20:,.1f} MB")
+        print(f"    made in {made['seconds']:,.1f} s, peak {made['peak'] / 2 ** 30:,.2f} GB")
+        print(f"    loaded from cache in {loaded['seconds']:,.1f} s, peak {loaded['peak'] / 2 ** 30:,.2f} GB")
+    every, parsing = results['every prefixed unit'][1], results['prefix parsing'][1]
+    for (from_unit, to_unit), first, second in zip(sample_pairs, every['conversions'], parsing['conversions']):
+        print(f"1 {from_unit} = {first} {to_unit} (every prefixed unit), {second} {to_unit} (prefix parsing)")
+    return results
+
+
+if __name__ == '__main__':
+    compare()
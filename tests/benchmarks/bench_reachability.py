@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the reachability index, used to prune DFS, to screen lean_BFS and to answer `convertible`.
+
+Reports the time to build the index of the network, and for several pairs of units the time to know if the destination
+can be reached from the source with the former `_get_descendants` screening and with the bit test of the index.
+
+run as:
+    python -m tests.benchmarks.bench_reachability
+"""
+
+from time import perf_counter
+
+from unyts.database import units_network
+from unyts.reachability import ReachabilityIndex
+
+sample_pairs = (('meter', 'inch'), ('psi', 'bar'), ('day', 'ms'), ('meter', 'second'), ('kg', 'gal'))
+repeat = 1000
+
+
+def compare() -> dict:
+    start = perf_counter()
+    reachability = ReachabilityIndex(units_network)
+    build_time = perf_counter() - start
+    print(f"reachability index of {len(reachability):,} nodes in {len(reachability.masks):,} strongly connected "
+          f"components built in {build_time * 1E3:,.2f} ms")
+    results = {'build': build_time}
+    for src, dest in sample_pairs:
+        units_network.descendants_memory().clear()
+        start = perf_counter()
+        screened = dest in units_network.descendants(src, len(reachability))
+        screening_time = perf_counter() - start
+        start = perf_counter()
+        for _ in range(repeat):
+            reachable = reachability.reachable(src, dest)
+        bit_time = (perf_counter() - start) / repeat
+        assert screened == reachable
+        results[(src, dest)] = screening_time, bit_time
+        print(f"{src} -> {dest} ({'reachable' if reachable else 'not reachable'}): "
+              f"descendants {screening_time * 1E3:,.3f} ms, bit test {bit_time * 1E6:,.2f} µs")
+    return results
+
+
+if __name__ == '__main__':
+    compare()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the search algorithms through the units network.
+
+Reports, for several pairs of units, the time and the number of expanded nodes (or paths, for BFS) of `BFS` and
+`bidirectional_BFS`, on both the UDigraph and the compact representation of the network.
+
+run as:
+    python -m tests.benchmarks.bench_searches
+"""
+
+from time import perf_counter
+
+from unyts.database import units_network
+from unyts.parameters import unyts_parameters_
+from unyts.searches import BFS, bidirectional_BFS
+
+sample_pairs = (('m', 'cm'), ('meter', 'inch'), ('psi', 'bar'), ('km', 'mi'), ('ft3', 'bbl'), ('C', 'K'),
+                ('day', 'ms'), ('kPa', 'psia'))
+
+
+def search(algorithm, graph, from_unit: str, to_unit: str):
+    stats = {}
+    unyts_parameters_.reset_start_time()
+    start = perf_counter()
+    path = algorithm(graph, units_network.get_node(from_unit), units_network.get_node(to_unit), stats=stats)
+    return path, perf_counter() - start, stats.get('expanded')
+
+
+def compare() -> dict:
+    results = {}
+    for label, graph in (('UDigraph', units_network), ('compact', units_network.compact())):
+        for from_unit, to_unit in sample_pairs:
+            bfs_path, bfs_time, bfs_expanded = search(BFS, graph, from_unit, to_unit)
+            bidi_path, bidi_time, bidi_expanded = search(bidirectional_BFS, graph, from_unit, to_unit)
+            results[(label, from_unit, to_unit)] = bfs_time, bfs_expanded, bidi_time, bidi_expanded
+            print(f"{label} {from_unit} to {to_unit} ({len(bidi_path) - 1} steps, same path: {bfs_path == bidi_path}): "
+                  f"BFS {bfs_time * 1E3:,.2f} ms, {bfs_expanded:,} paths expanded; "
+                  f"bidirectional BFS {bidi_time * 1E3:,.2f} ms, {bidi_expanded:,} nodes expanded")
+    return results
+
+
+if __name__ == '__main__':
+    compare()
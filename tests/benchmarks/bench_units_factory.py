@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the construction of instances by the `units` factory, one million by default.
+
+Compares the factory, taking the class of the units from the registry of the kind of each unit, with the former one,
+that searched the tuples of the dictionary for the kind of the units and made the instance by `eval`. The former one
+is timed for a fraction of the constructions and scaled.
+
+run as:
+    python -m tests.benchmarks.bench_units_factory [constructions]
+"""
+
+import sys
+from time import perf_counter
+
+from unyts import units
+from unyts.database import load_units
+from unyts.dictionaries import dictionary
+from unyts.units.define import _classes
+
+_namespace = dict(_classes)  # where the former factory evaluated the classes
+_units = ('ft', 'psia', 'cP', 'stb/day')  # the kinds are found at increasing positions of the dictionary
+
+
+def _former_units(value, unit):
+    for kind in dictionary:
+        if unit in dictionary[kind]:
+            u = eval(kind + """(0, '""" + unit + """')""", _namespace)
+            u.value = value
+            return u
+
+
+def _time(factory, constructions: int) -> float:
+    start = perf_counter()
+    for i in range(constructions):
+        factory(i, _units[i % len(_units)])
+    return perf_counter() - start
+
+
+def compare(constructions: int = 1_000_000, former_fraction: float = 0.001) -> dict:
+    load_units()
+    units(1, 'ft')  # the registry is filled by the first construction
+    assert all(type(units(1, unit)) is type(_former_units(1, unit)) is _classes[type(units(1, unit)).__name__]
+               for unit in _units)
+    results = {'registry': _time(units, constructions)}
+    former = max(int(constructions * former_fraction), len(_units))
+    results['former'] = _time(_former_units, former) * constructions / former
+    for method, seconds in results.items():
+        print(f"{method}: {seconds:,.2f} s for {constructions:,} constructions, "
+              f"{seconds / constructions * 1e6:,.2f} us each")
+    return results
+
+
+if __name__ == '__main__':
+    compare(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
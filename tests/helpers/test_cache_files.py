@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 11:02:40 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+import os
+from multiprocessing import get_context
+from unyts.helpers.cache_files import read_cache, write_cache, update_cache, valid_cache
+
+
+def _append(args):
+    path, n = args
+    update_cache(path, lambda payload: (payload or b'') + str(n).encode() + b',')
+
+
+def test_cache_files(tmp_path):
+    path = str(tmp_path / 'test.cache')
+    assert read_cache(path) is None and not valid_cache(path)
+    write_cache(path, b'payload')
+    assert read_cache(path) == b'payload' and valid_cache(path)
+    assert os.listdir(tmp_path) == ['test.cache']  # without temporary or lock files
+    if os.name == 'posix':
+        umask = os.umask(0o022)
+        os.umask(umask)
+        assert os.stat(path).st_mode & 0o777 == 0o666 & ~umask
+
+    with open(path, 'rb') as f:
+        header, payload = f.read().split(b'\n', 1)
+    with open(path, 'wb') as f:  # written by another version
+        f.write(header.replace(b'"unyts": "', b'"unyts": "0.') + b'\n' + payload)
+    assert not valid_cache(path) and read_cache(path) is None and not os.path.exists(path)
+
+    with open(path, 'wb') as f:  # without header, from a version before the headers
+        f.write(b'{}')
+    assert read_cache(path) is None and not os.path.exists(path)
+
+
+def test_update_cache_from_processes(tmp_path):
+    path = str(tmp_path / 'merged.cache')
+    with get_context('fork' if os.name == 'posix' else 'spawn').Pool(4) as pool:
+        pool.map(_append, [(path, n) for n in range(20)])
+    assert sorted(int(n) for n in read_cache(path).decode().strip(',').split(',')) == list(range(20))
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:02:47 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+from unyts.compact import CompactUDigraph
+from unyts.database import units_network as UnNe
+from unyts.searches import BFS, lean_BFS
+from unyts.converter import _get_descendants
+
+
+def test_compact_structure():
+    compact = UnNe.compact()  # taken in each test, as other tests may have added prefixed units to the network
+    assert isinstance(compact, CompactUDigraph)
+    assert len(compact) == len(UnNe.list_nodes())
+    assert compact is UnNe.compact()  # cached until the network changes
+    for name in ('meter', 'ft', 'psi', 'Kelvin'):
+        assert compact.get_node(name) is UnNe.get_node(name)
+        assert compact.children_of(compact.get_node(name)) == UnNe.children_of(UnNe.get_node(name))
+    assert not compact.has_node('not_a_unit')
+
+
+def test_compact_conversion():
+    compact = UnNe.compact()
+    assert compact.convert(1, 'meter', 'yard') == UnNe.convert(1, UnNe.get_node('meter'), UnNe.get_node('yard'))
+
+
+def test_compact_descendants():
+    compact = UnNe.compact()
+    for name in ('meter', 'psi'):
+        for generations in (1, 3):
+            assert compact.descendants(name, generations) == UnNe.descendants(name, generations)
+    assert _get_descendants('psi/ft', 2, graph=compact) == _get_descendants('psi/ft', 2)
+
+
+def test_compact_searches():
+    for from_unit, to_unit in (('meter', 'inch'), ('psi', 'bar'), ('m', 'cm')):
+        start, end = UnNe.get_node(from_unit), UnNe.get_node(to_unit)
+        compact = UnNe.compact()  # rebuilt if a prefixed unit was made by `get_node`
+        assert BFS(compact, start, end) == BFS(UnNe, start, end)
+        assert lean_BFS(compact, start, end) == lean_BFS(UnNe, start, end)
+
+
+def test_compact_removed_children():
+    from unyts.network import UDigraph, UNode, Conversion
+    from unyts.database import _clean_network
+    from unyts.units.def_conversions import equality
+    network = UDigraph()
+    nodes = {name: UNode(name) for name in ('a', 'b', 'c', 'd')}
+    for node in nodes.values():
+        network.add_node(node)
+    for src, dest in (('a', 'b'), ('a', 'c'), ('b', 'd'), ('d', 'b')):
+        network.add_edge(Conversion(nodes[src], nodes[dest], equality))
+    _clean_network(network)  # 'c' is left only as a child of 'a'
+    compact = CompactUDigraph(network)
+    assert not compact.has_node('c') and compact.children_of(nodes['a']) == [nodes['b']]
+    stats = {}
+    assert BFS(compact, nodes['a'], nodes['d'], stats=stats) == [nodes['a'], nodes['b'], nodes['d']]
+    assert stats['expanded'] == 2 and BFS(compact, nodes['d'], nodes['a']) is None
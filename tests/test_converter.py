@@ -26,10 +26,8 @@ def test__get_conversion():
     assert _get_conversion(0.25, 'percent', 'fraction') == (0.0025, ['/', 100])
     assert _get_conversion(0.25, 'dimensionless', 'fraction') == (0.25, [])
     assert _get_conversion(0.01, 'F/ft', 'C/m') == (0.018226888305628464, ['*', 0.5555555555555556, '/', 1,
-                                                                           UnNe.get_node('ft'),
-                                                                           UnNe.get_node('foot'),
+                                                                           UnNe.get_node('ft'),  # the same node as 'foot'
                                                                            UnNe.get_node('yard'),
-                                                                           UnNe.get_node('meter'),
                                                                            UnNe.get_node('m')])
     assert _get_conversion(0.33, 'fraction', 'ft/ft') == (0.33, [])
     assert _get_conversion(0.33, 'ft3/ft3', 'fraction') == (0.33, [])
@@ -46,10 +44,8 @@ def test__converter():
     assert _converter(0.433, 'psi/ft', 'bar/m') == (0.09794717545606699, [UnNe.get_node('psi'),
                                                                           UnNe.get_node('bar'),
                                                                           '/', 1,
-                                                                          UnNe.get_node('ft'),
-                                                                          UnNe.get_node('foot'),
+                                                                          UnNe.get_node('ft'),  # the same node as 'foot'
                                                                           UnNe.get_node('yard'),
-                                                                          UnNe.get_node('meter'),
                                                                           UnNe.get_node('m')])
 
 
@@ -108,3 +104,113 @@ def test_convert_for_SimPandas():
     array = np.random.rand(10)
     assert (convert_for_SimPandas(array, 'meter', 'litre') == array).all()
     assert (convert_for_SimPandas(array, 'm', 'yd') == convert(array, 'm', 'yd')).all()
+
+
+def test_impossible_conversion():
+    from unyts.converter import _impossible_conversion
+    assert _impossible_conversion('meter', 'kilogram') and not convertible('meter', 'kilogram')
+    assert _impossible_conversion('m/s', 'kg/K') and not convertible('m/s', 'kg/K')
+    assert not _impossible_conversion('meter', 'inch') and convertible('meter', 'inch')
+    assert not _impossible_conversion('m/s', 'km/h') and convertible('m/s', 'km/h')
+    assert not _impossible_conversion('psi', 'N/m2')
+    assert not _impossible_conversion('lbf/in2', 'psi')
+    assert not _impossible_conversion('fraction', 'meter')  # Dimensionless is converted to any unit
+    assert not _impossible_conversion('not a unit', 'meter')
+
+
+def test_converter_for():
+    import pickle
+    from unyts import converter_for
+    for value, from_unit, to_unit in ((14.7, 'psia', 'bar'), (100, 'degC', 'degF'), (3, 'm3', 'bbl'),
+                                      (np.array([1., 2.5]), 'km', 'mi'), ('16/06/1969', 'date', 'DATE')):
+        converter = converter_for(from_unit, to_unit)
+        expected = convert(value, from_unit, to_unit)
+        result = converter(value)
+        if type(value) is str:
+            assert result == expected
+        else:
+            assert np.allclose(result, expected, rtol=1E-12)
+            assert np.allclose(pickle.loads(pickle.dumps(converter))(value), expected, rtol=1E-12)
+    assert converter_for('psia', 'bar').factor == (convert(1, 'psia', 'bar'), 0)
+    assert converter_for('degC', 'degF').factor[1] == 32
+
+
+def test_convert_many():
+    from unyts import convert_many
+    from unyts.errors import NoConversionFoundError
+    values = np.array([1., 2., 3., 4., 5.])
+    from_units, to_units = ['m', 'ft', 'm', 'psi', 'kg'], ['ft', 'm', 'cm', 'bar', 'm']
+    converted, status = convert_many(values, from_units, to_units, return_status=True)
+    assert status.tolist() == [True, True, True, True, False]
+    assert np.allclose(converted[:4], [convert(*row) for row in zip(values[:4], from_units, to_units)], rtol=1E-12)
+    assert isnan(converted[4])
+    assert np.allclose(convert_many([1, 2], np.array(['m', 'km']), 'm'), [1, 2000])
+    assert np.allclose(convert_many(2, 'km', 'm'), [2000])
+    rows, status = convert_many([[1, 2], [3, 4], [5, 6]], ['km', 'm', 'kg'], 'm', return_status=True)
+    assert rows.shape == (3, 2) and status.tolist() == [True, True, False]
+    assert np.allclose(rows[:2], [[1000, 2000], [3, 4]]) and np.isnan(rows[2]).all()
+    try:
+        convert_many(values, from_units, to_units)
+        assert False
+    except NoConversionFoundError:
+        pass
+
+
+def test_clean_input_keeps_containers():
+    from pandas import Series, DataFrame
+    from unyts.converter import _clean_input
+    array = np.ones(3)
+    assert _clean_input(array, 'm', 'ft')[0] is array
+    series = Series([1., 2.], index=['a', 'b'], dtype='float32')
+    assert _clean_input(series, 'm', 'ft')[0] is series
+    converted = convert(series, 'degC', 'degF')
+    assert type(converted) is Series and list(converted.index) == ['a', 'b'] and converted.dtype == 'float32'
+    frame = DataFrame({'x': [1., 2.], 'y': [3., 4.]}, index=[5, 6])
+    converted = convert(frame, 'm', 'ft')
+    assert type(converted) is DataFrame and list(converted.index) == [5, 6]
+    assert type(convert([1, 2], 'km', 'm')) is np.ndarray
+
+
+def test_convert_out_and_inplace():
+    from pandas import Series
+    values = np.array([14.7, 100.])
+    expected = convert(values, 'degC', 'degF')
+    out = np.empty_like(values)
+    assert convert(values, 'degC', 'degF', out=out) is out and np.allclose(out, expected)
+    assert convert(values, 'degC', 'degF', inplace=True) is values and np.allclose(values, expected)
+    values = np.array([1., 2.])
+    convert(values, 'm/s', 's/m', inplace=True)  # not affine
+    assert np.allclose(values, [1., 0.5])
+    series = Series([1., 2.], index=['a', 'b'])
+    assert convert(series, 'km', 'm', inplace=True) is series
+    assert series.tolist() == [1000., 2000.] and list(series.index) == ['a', 'b']
+    try:
+        convert(3., 'm', 'ft', inplace=True)
+        assert False
+    except TypeError:
+        pass
+
+
+def test_dtype_policy():
+    from unyts import set_dtype_policy, get_dtype_policy, converter_for
+    from unyts.converter import _keep_dtype
+    previous = get_dtype_policy()
+    values = np.array([1., 2.], dtype='float32')
+    for from_unit, to_unit in (('m', 'ft'), ('degC', 'degF'), ('m/s', 's/m'), ('m3/day', 'bbl/month')):
+        assert convert(values, from_unit, to_unit).dtype == np.float32
+        assert converter_for(from_unit, to_unit)(values).dtype == np.float32
+    assert _keep_dtype(values * np.float64(2), values, 'preserve').dtype == np.float32
+    assert _keep_dtype(values * np.float64(2), values, 'numpy').dtype == np.float64
+    try:
+        set_dtype_policy('preserve', 'float32')
+        assert convert(np.array([1, 2]), 'm', 'ft').dtype == np.float32
+        assert converter_for('km', 'm')(np.array([1, 2])).dtype == np.float32
+    finally:
+        set_dtype_policy(*previous)
+
+
+def test_kind_units():
+    from unyts.dictionaries import dictionary, _kind_units
+    assert type(_kind_units('Volume')) is frozenset and _kind_units('Volume') == set(dictionary['Volume'])
+    assert _kind_units('Volume') is _kind_units('Volume')
+    assert convert(50, '%', 'fraction') == 0.5 and convert(0.5, 'fraction', '%') == 50
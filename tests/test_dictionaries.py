@@ -5,8 +5,10 @@ Created on Sat Jan 21 22:34:17 2023
 @author: Martín Carlos Araya <martinaraya@gmail.com>
 """
 import logging
+import subprocess
+import sys
 
-from unyts.dictionaries import dictionary, uncertain_names
+from unyts.dictionaries import dictionary, uncertain_names, _enumerate_kind
 from unyts import units
 from string import ascii_uppercase
 
@@ -24,11 +26,12 @@ for key in dictionary:
     if key in ['Impedance', 'Date', 'otherUnits']:
         continue
     # print(key)
-    if len(dictionary[key]) > max_check:
-        to_check = [u for u in dictionary[key] if
+    kind_units = _enumerate_kind(key, 1000)  # the units listed and some of the combinations of the composite kinds
+    if len(kind_units) > max_check:
+        to_check = [u for u in kind_units if
                     (u.count('*') <= 1 and u.count('/') == 0) or (u.count('/') <= 1 and u.count('*') == 0)]
     else:
-        to_check = dictionary[key]
+        to_check = kind_units
     for unit in to_check[:max_check]:
         print(key, unit)
         if key in ['Length', 'Rate'] and (len(unit) <= 2 and unit.endswith('l')) or (
@@ -50,3 +53,29 @@ for key in dictionary:
             assert units(1, unit).name.lower() == 'unit'
         else:
             assert units(1, unit).name.lower() == key2name(key)
+
+
+def test_kinds_classes():
+    from unyts.dictionaries import _composite_kinds
+    from unyts.units.define import _classes
+    from unyts.units.custom import UserUnits
+    assert set(dictionary).union(_composite_kinds).issubset(_classes)  # every kind is made by its class
+    assert type(units(1, 's2')) is UserUnits  # a unit of 'otherUnits'
+
+
+_prefixed_kinds = """
+from unyts import units
+from unyts.parameters import unyts_parameters_
+from unyts.unit_class import valid_unit
+unyts_parameters_.prefix_parsing_ = True  # not saved, for this process only
+print('kinds:', type(units(1, 'MPa/m')).__name__, valid_unit('kbar/km'), type(units(1, 'kbar/km')).__name__)
+"""
+
+
+def test_prefixed_composite_kinds():
+    from tests.benchmarks.bench_import import _environment
+    # in a new process, where no prefixed unit was made before
+    result = subprocess.run([sys.executable, '-c', _prefixed_kinds], env=_environment(), capture_output=True,
+                            text=True, check=True)
+    kinds = [line[len('kinds: '):] for line in result.stdout.splitlines() if line.startswith('kinds: ')]
+    assert kinds == ['PressureGradient True PressureGradient']
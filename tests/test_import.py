@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 10:12:37 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+import subprocess
+import sys
+from tests.benchmarks.bench_import import _environment
+from unyts.network import UDigraph
+
+_check = """
+import os
+import sys
+from importlib.util import find_spec
+folder = find_spec('unyts').submodule_search_locations[0]
+files = [os.path.join(folder, name) for name in os.listdir(folder)]
+modified = {path: os.stat(path).st_mtime_ns for path in files}
+import unyts
+from unyts import database, dictionaries
+print('check:', database._loaded, dict.__len__(dictionaries.dictionary), type(database.units_network).__name__,
+      'pandas' in sys.modules, 'tkinter' in sys.modules, 'unyts.unitary' in sys.modules,
+      sorted(os.listdir(folder)) == sorted(os.path.basename(path) for path in files) and
+      all(os.stat(path).st_mtime_ns == mtime for path, mtime in modified.items()))
+"""
+
+
+def test_lazy_import():
+    result = subprocess.run([sys.executable, '-c', _check], env=_environment(), capture_output=True, text=True,
+                            check=True)
+    # the log messages are printed too
+    imported = [line[len('check: '):] for line in result.stdout.splitlines() if line.startswith('check: ')]
+    # nothing is loaded, imported or written to disk while importing
+    assert imported == ['False 0 _UnloadedUDigraph False False False True']
+
+    # the units are loaded by the first conversion, and the constants of `unitary` made when first used
+    import unyts
+    from unyts import database
+    assert unyts.convert(1, 'ft', 'm') == 0.3048 and database._loaded and type(database.units_network) is UDigraph
+    assert unyts.meter.unit == 'm' and unyts.foot.unit == 'ft'
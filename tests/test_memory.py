@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 10:02:18 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+import pickle
+from unyts.memory import ConversionMemory
+
+
+def equality(x):
+    return x
+
+
+def test_lru_memory():
+    memory = ConversionMemory(limit=2, negative_limit=1, policy='LRU')
+    memory[('m', 'cm')] = equality, ['m', 'cm']
+    memory[('m', 'ft')] = equality, ['m', 'ft']
+    memory[('m', 'kg')] = None, None
+    assert memory.get(('m', 'cm')) == (equality, ['m', 'cm'])  # 'm' to 'ft' is now the least recently used
+    memory[('m', 'in')] = equality, ['m', 'in']
+    memory[('m', 's')] = None, None
+    assert ('m', 'ft') not in memory and ('m', 'kg') not in memory
+    assert ('m', 'cm') in memory and ('m', 'in') in memory and ('m', 's') in memory
+    assert memory.get(('m', 'ft')) is None
+    stats = memory.get_stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 1, 2)
+    assert (stats['positive'], stats['negative']) == (2, 1)
+
+
+def test_lfu_memory():
+    memory = ConversionMemory(limit=2, negative_limit=None, policy='LFU')
+    memory[('m', 'cm')] = equality, ['m', 'cm']
+    memory[('m', 'ft')] = equality, ['m', 'ft']
+    for _ in range(3):
+        memory.get(('m', 'ft'))
+    memory.get(('m', 'cm'))
+    memory[('m', 'in')] = equality, ['m', 'in']  # evicts 'm' to 'cm', used less than 'm' to 'ft'
+    assert ('m', 'cm') not in memory and ('m', 'ft') in memory
+    for i in range(100):
+        memory[('m', str(i))] = None, None  # unlimited negative results
+    assert len(memory) == 102
+    memory.resize(1, 10, 'LRU')
+    assert len(memory) == 11 and memory.policy == 'LRU'
+
+
+def test_memory_pickle():
+    memory = ConversionMemory(limit=5, negative_limit=5)
+    memory[('m', 'cm')] = equality, ['m', 'cm']
+    memory[('m', 'kg')] = None, None
+    memory.get(('m', 'cm'))
+    loaded = pickle.loads(pickle.dumps(memory))
+    assert loaded.copy() == memory.copy()
+    assert loaded.stats == memory.stats and loaded.limit == 5
+
+
+def test_memory_merge_stats():
+    memory = ConversionMemory()
+    memory.get(('m', 'cm'))
+    assert memory.merge_stats({'misses': 10})['misses'] == 11  # saved
+    assert memory.merge_stats({'misses': 11})['misses'] == 11  # loaded again, nothing counted twice
+    memory.get(('m', 'cm'))
+    assert memory.merge_stats({'misses': 20})['misses'] == 21  # saved after another process saved 9 more
+
+
+def test_memory_parameters():
+    import pytest
+    from unyts import set_memory_limits, get_memory_stats, convert
+    from unyts.database import units_network as UnNe
+    from unyts.parameters import unyts_parameters_
+    limits = unyts_parameters_.memory_limit_, unyts_parameters_.memory_negative_limit_, \
+        unyts_parameters_.memory_policy_
+    memory = UnNe.memory.copy()
+    set_memory_limits(3, 1, 'LFU')
+    for from_unit, to_unit in (('m', 'cm'), ('m', 'ft'), ('m', 'in'), ('m', 'yd'), ('m', 'mm')):
+        convert(1, from_unit, to_unit)
+    stats = get_memory_stats()
+    assert stats['positive'] <= 3 and stats['negative'] <= 1 and stats['policy'] == 'LFU'
+    set_memory_limits(3, 0)  # the conversions not found are not memorized
+    UnNe.memory[('m', 'not_a_unit')] = None, None
+    assert get_memory_stats()['negative'] == 0 and ('m', 'not_a_unit') not in UnNe.memory
+    with pytest.raises(ValueError):
+        set_memory_limits(-1)
+    set_memory_limits(*limits)
+    UnNe.memory.clear()
+    UnNe.memory.update(memory)
+
+
+def test_threaded_memory():
+    from threading import Thread
+    memory = ConversionMemory(limit=50, negative_limit=10, policy='LFU')
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(2000):
+                key = ('u' + str((n * i) % 80), 'v')
+                if memory.get(key) is None:
+                    memory[key] = (equality, [key[0], 'v']) if i % 3 else (None, None)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [Thread(target=worker, args=(n,)) for n in range(1, 9)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    stats = memory.get_stats()
+    assert stats['hits'] + stats['misses'] == 8 * 2000
+    assert stats['positive'] <= 50 and stats['negative'] <= 10
+    assert len(memory.items()) == len(memory)
+
+
+def test_conversion_plans():
+    from math import isclose
+    from unyts.memory import ConversionPlan
+    from unyts.units.def_conversions import equality as module_equality
+
+    def scale(x):
+        return x * 0.3048
+
+    memory = ConversionMemory(limit=10, negative_limit=10)
+    memory[('ft', 'm')] = scale, ['ft', 'm']
+    memory[('x', 'x')] = module_equality, ['x']
+    memory[('m', 's')] = None, None
+    memory[('a', 'b')] = (lambda x: x ** 2), ['a', 'b']  # not affine, not saved
+    records = memory.to_records()
+    assert [record[2][0] if record[2] else None for record in records] == [None, 'factor', 'function']
+    loaded = ConversionMemory(limit=10, negative_limit=10)
+    loaded.update_records(pickle.loads(pickle.dumps(records)))
+    plan, path = loaded[('ft', 'm')]
+    assert type(plan) is ConversionPlan and plan._function is None and path == ['ft', 'm']
+    assert isclose(plan(10), 3.048) and plan._function is not None
+    assert loaded[('x', 'x')][0](7) == 7 and loaded[('m', 's')] == (None, None) and ('a', 'b') not in loaded
+
+
+def test_conversion_plans_of_stateful_conversions():
+    from unyts.memory import ConversionPlan
+    from unyts.network import UDigraph, UNode, Conversion
+    calls = []
+
+    def reservoir_to_standard(x):  # depends on the FVF
+        calls.append(x)
+        return x / 1.1
+
+    network = UDigraph()
+    reservoir, standard = UNode('rm3'), UNode('sm3')
+    network.add_node(reservoir)
+    network.add_node(standard)
+    network.add_edge(Conversion(reservoir, standard, reservoir_to_standard))
+    assert ConversionPlan.from_conversion(reservoir_to_standard, [reservoir, standard], network).kind == 'nodes'
+    assert ConversionPlan.from_conversion(reservoir_to_standard, [reservoir, standard]) is None
+    assert ConversionPlan.from_conversion(lambda x: x * 0.85, ['*', 0.85]) is None  # through the density
+    assert calls == []  # never evaluated
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:40:12 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+from unyts.network import affine_factor
+from unyts.converter import _get_conversion, _fold_conversions, _apply_conversion
+from unyts.database import units_network as UnNe
+from unyts.units.def_conversions import equality, Celsius__to__Fahrenheit, year__to__day, inverse
+import numpy as np
+
+
+def test_affine_factor():
+    assert affine_factor(equality) == (1, 0)
+    assert affine_factor(year__to__day) == (365.25, 0)
+    assert affine_factor(Celsius__to__Fahrenheit) == (1.8, 32)
+    assert affine_factor(inverse) is None
+    assert affine_factor(lambda x: x ** 2) is None
+    assert affine_factor(lambda x: np.log(x)) is None  # not evaluated, it is not a plain arithmetic expression
+    assert UnNe.factor('yard', 'foot') == (3, 0)
+
+
+def test_folded_conversion():
+    for from_unit, to_unit in (('meter', 'inch'), ('C', 'F'), ('km', 'mi'), ('ft3', 'bbl')):
+        conversion, conversion_path = _get_conversion(None, from_unit, to_unit)
+        assert len(_fold_conversions(conversion_path)) == 1
+        assert conversion(1) == _apply_conversion(1, conversion_path)
+        array = np.linspace(-40, 100, 15)
+        assert np.allclose(conversion(array), _apply_conversion(array, conversion_path), rtol=1E-12)
+
+
+def test_parents_of():
+    from cloudpickle import dumps, loads
+    for node, (children, conversions) in UnNe.edges.items():
+        for child in children:
+            assert node in UnNe.parents_of(child)
+    assert sum(len(parents) for parents in UnNe._parents.values()) == \
+           sum(len(children) for children, conversions in UnNe.edges.values())
+    network = loads(dumps(UnNe))  # the index is persisted with the network
+    assert [n.get_name() for n in network.parents_of(network.get_node('inch'))] == \
+           [n.get_name() for n in UnNe.parents_of(UnNe.get_node('inch'))]
+
+
+def test_resolve_prefix():
+    from unyts.network import UDigraph, UNode
+    from unyts.database import resolve_prefix, _prefixes
+    from unyts.parameters import unyts_parameters_
+    network = UDigraph()
+    network.add_node(UNode('Pa'))
+    prefix_parsing, unyts_parameters_.prefix_parsing_ = unyts_parameters_.prefix_parsing_, True
+    try:
+        assert _prefixes(network, 'Pa', 'SI', 0) == {} and network.prefixes == {'Pa': [('SI', 0, None)]}
+    finally:
+        unyts_parameters_.prefix_parsing_ = prefix_parsing
+    assert not network.has_node('kPa') and resolve_prefix('kPa', network) and network.has_node('kPa')
+    assert network.conversion('kPa', 'Pa')(1) == 1000 and network.conversion('Pa', 'kPa')(1000) == 1
+    assert network.conversion('MPa', 'Pa')(1) == 1E6  # made when first required
+    assert not resolve_prefix('xPa', network) and not network.has_node('xPa') and not resolve_prefix('k', network)
+    assert not UnNe.prefixes or unyts_parameters_.prefix_parsing_  # made with every prefixed unit
+
+
+def test_collapse_synonyms():
+    from unyts.network import UDigraph, UNode, Conversion
+    network = UDigraph()
+    nodes = {name: UNode(name) for name in ('meter', 'meters', 'm', 'foot', 'feet')}
+    for node in nodes.values():
+        network.add_node(node)
+    for alias in ('meters', 'm'):
+        network.add_edge(Conversion(nodes['meter'], nodes[alias], equality))
+        network.add_edge(Conversion(nodes[alias], nodes['meter'], equality))
+    network.add_edge(Conversion(nodes['foot'], nodes['feet'], equality))
+    network.add_edge(Conversion(nodes['feet'], nodes['foot'], lambda x: x * 2))  # not a synonym
+    network.add_edge(Conversion(nodes['foot'], nodes['meter'], lambda x: x * 0.3048))
+    assert network.collapse_synonyms() == 2
+    assert network.aliases() == {'meters': 'meter', 'm': 'meter'} and network.canonical('m') == 'meter'
+    assert network.get_node('m') is nodes['meter'] and network.has_node('meters')
+    assert network.list_nodes() == ['meter', 'foot', 'feet']
+    assert network.children_of(nodes['foot']) == [nodes['feet'], nodes['meter']]
+    assert network.children_of(nodes['meter']) == []
+    assert network.descendants('m', 0) == network.descendants('meter', 0) == {'meter', 'meters', 'm'}
+    assert UnNe.get_node('feet') is UnNe.get_node('ft') and UnNe.canonical('feet') == UnNe.canonical('ft')
+
+
+def test_update():
+    from unyts.network import UDigraph, UNode, _slots
+    import pytest
+    network, other = UDigraph(), UDigraph()
+    other.add_node(UNode('Pa'))
+    memory = network.memory
+    network.update(other)
+    assert network.has_node('Pa') and network.memory is memory and network.version > other.version
+    assert all(hasattr(network, attribute) for attribute in _slots(UDigraph))
+    del other.prefixes
+    with pytest.raises(AttributeError):
+        network.update(other)
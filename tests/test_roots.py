@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:05:44 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+from unyts.database import units_network as UnNe
+from unyts.converter import _get_conversion
+from unyts.parameters import unyts_parameters_
+
+
+def test_roots():
+    UnNe.get_node('cm')  # made on demand
+    roots = UnNe.roots()  # other tests may have added prefixed units to the network
+    assert roots is UnNe.roots()  # computed once until the network changes
+    assert roots.get_root('ft') == roots.get_root('meter') == roots.get_root('m') is not None
+    assert roots.get_root('not_a_unit') is None
+    assert roots.connected('day', 'minute')
+    assert not roots.connected('meter', 'second')
+    assert roots.factor('m', 'cm') == (100, 0)
+    path = roots.path('ft', 'inch')
+    assert path[0] is UnNe.get_node('ft') and path[-1] is UnNe.get_node('inch')
+    assert len(path) == len(set(path))
+    assert roots.get_root('kPa') == roots.get_root('psia') == roots.get_root('psi') is not None  # Pressure
+    assert roots.factor('Pa', 'kPa') == (0.001, 0) and roots.get_root('psig') not in (None, roots.get_root('psia'))
+    assert 'psi gauge' in roots.inconsistent  # equal to 'psi', that is also equal to the absolute pressure
+    assert roots.get_root('m3') == roots.get_root('cm3') == roots.get_root('liter') is not None  # Volume
+
+
+def test_roots_conversion():
+    canonical_roots_, memory = unyts_parameters_.canonical_roots_, UnNe.memory.copy()
+    for from_unit, to_unit in (('meter', 'inch'), ('C', 'F'), ('day', 'second'), ('acre', 'ft2'), ('kPa', 'Pa'),
+                               ('ft3', 'cm3')):
+        unyts_parameters_.canonical_roots_ = False
+        searched, _ = _get_conversion(7.3, from_unit, to_unit, use_cache=False)
+        unyts_parameters_.canonical_roots_ = True
+        converted, path = _get_conversion(7.3, from_unit, to_unit, use_cache=False)
+        assert abs(converted - searched) <= 1E-12 * abs(searched)
+        assert path[0] is UnNe.get_node(from_unit) and path[-1] is UnNe.get_node(to_unit)
+    unyts_parameters_.canonical_roots_ = canonical_roots_
+    UnNe.memory.clear()  # forget the paths through the roots
+    UnNe.memory.update(memory)
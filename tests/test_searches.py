@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:31:09 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+from unyts.database import units_network as UnNe
+from unyts.searches import BFS, bidirectional_BFS
+
+
+def test_parents_of():
+    for name in ('meter', 'psi', 'day'):
+        node = UnNe.get_node(name)
+        for child in UnNe.children_of(node):
+            assert node in UnNe.parents_of(child)
+        assert sorted(n.get_name() for n in UnNe.compact().parents_of(node)) == \
+               sorted(n.get_name() for n in UnNe.parents_of(node))
+
+
+def test_bidirectional_BFS():
+    meter = UnNe.get_node('meter')
+    assert bidirectional_BFS(UnNe, meter, meter) == [meter]
+    assert bidirectional_BFS(UnNe, meter, UnNe.get_node('second')) is None
+    for from_unit, to_unit in (('meter', 'inch'), ('m', 'cm'), ('psi', 'bar'), ('km', 'mi'), ('C', 'K'), ('day', 'ms')):
+        start, end = UnNe.get_node(from_unit), UnNe.get_node(to_unit)
+        stats = {}
+        assert bidirectional_BFS(UnNe, start, end, stats=stats) == BFS(UnNe, start, end)
+        assert bidirectional_BFS(UnNe.compact(), start, end) == BFS(UnNe, start, end)
+        assert stats['expanded'] > 0
+
+
+def test_get_descendants():
+    from unyts.converter import _get_descendants
+    from unyts.network import UDigraph, UNode, Conversion
+    from unyts.units.def_conversions import equality
+    descendants = _get_descendants('meter', 2)
+    assert 'meter' in descendants and 'yard' in descendants
+    assert _get_descendants('meter', 2) is descendants  # memorized
+    assert _get_descendants('meter', 0) == {'meter'}
+    assert {'psi/ft', 'bar/ft'}.issubset(_get_descendants('psi/ft', 1))
+    assert 'psi/foot' in _get_descendants('psi/ft', 1)  # 'foot' and 'ft' are the same node, with its synonyms
+    network = UDigraph()  # a private network, the units network is not changed
+    nodes = {name: UNode(name) for name in ('m', 'ft', 'test_meter')}
+    for node in nodes.values():
+        network.add_node(node)
+    network.add_edge(Conversion(nodes['m'], nodes['ft'], equality))
+    assert _get_descendants('m', 2, graph=network) == {'m', 'ft'}
+    memory = network.descendants_memory()
+    assert ('m', 2, True) in memory and _get_descendants('m', 2, graph=network) is memory[('m', 2, True)]
+    network.add_edge(Conversion(nodes['ft'], nodes['test_meter'], equality))
+    assert network.descendants_memory() is not memory and len(network.descendants_memory()) == 0
+    assert 'test_meter' in _get_descendants('m', 2, graph=network)  # the network changed, the memory is not used
+
+
+def test_reachability():
+    from unyts.searches import DFS
+    reachability = UnNe.reachability()
+    assert UnNe.reachability() is reachability  # built once per network version
+    assert reachability.reachable('meter', 'inch') and reachability.reachable('meter', 'meter')
+    assert not reachability.reachable('meter', 'second')
+    assert not reachability.reachable('meter', 'not a unit')
+    for name in ('meter', 'psi', 'day'):
+        assert reachability.reachable_names(name) == UnNe.descendants(name, len(reachability))
+    assert UnNe.compact().reachability().reachable_names('psi') == reachability.reachable_names('psi')
+    meter, second = UnNe.get_node('meter'), UnNe.get_node('second')
+    assert DFS(UnNe, meter, second) is None
+    assert DFS(UnNe, meter, UnNe.get_node('inch'))[-1] is UnNe.get_node('inch')
+    assert DFS(UnNe, meter, UnNe.get_node('inch'), branch_depht=1) is None  # inch is reachable, but deeper
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 13:05:44 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+from threading import Thread
+from unyts import convert
+from unyts.session import in_session, current_session, conversion_session
+
+
+def test_nested_sessions():
+    assert not in_session()
+    assert current_session() is not current_session()  # detached sessions out of a conversion
+    with conversion_session(timeout=5, max_recursion=3) as outer:
+        assert in_session() and current_session() is outer
+        outer.visit('m', 'ft')
+        with conversion_session() as inner:
+            assert current_session() is inner
+            assert not inner.is_visited('m', 'ft')
+        assert current_session() is outer and outer.is_visited('m', 'ft')
+        assert outer.max_recursion == 3 and outer.deadline is None
+        assert outer.is_intime() and outer.deadline == outer.start_time + 5
+    assert not in_session()
+
+
+def test_threaded_convert():
+    pairs = [(1, 'm', 'ft'), (1, 'km', 'mi'), (1, 'bar', 'psi'), (1, 'day', 'hr'), (1, 'kg', 'lb'),
+             (100, 'degC', 'degF'), (1, 'm3', 'bbl'), (1, 'g/cm3', 'kg/m3')]
+    expected = [convert(*pair) for pair in pairs]
+    results, errors = {}, []
+
+    def worker(n):
+        try:
+            for i, pair in enumerate(pairs[n:] + pairs[:n]):
+                results[(n, (i + n) % len(pairs))] = convert(*pair)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [Thread(target=worker, args=(n,)) for n in range(len(pairs))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert all(results[(n, i)] == expected[i] for n in range(len(pairs)) for i in range(len(pairs)))
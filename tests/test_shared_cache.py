@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 11:40:52 2026
+
+@author: Martín Carlos Araya <martinaraya@gmail.com>
+"""
+
+import os
+from math import isclose
+from multiprocessing import get_context
+from unyts.memory import ConversionMemory, ConversionPlan
+from unyts.shared_cache import SharedConversionCache
+
+
+def _solve(path, from_unit, to_unit):
+    # solves the conversion in another process, with an empty memory sharing its conversions
+    from unyts import convert
+    from unyts.database import units_network
+    units_network.memory.clear()
+    units_network.memory.attach(SharedConversionCache(path, units_network))
+    return convert(1, from_unit, to_unit)
+
+
+def test_shared_cache(tmp_path):
+    path = str(tmp_path / 'shared.sqlite')
+    first, second = ConversionMemory(limit=10), ConversionMemory(limit=10)
+    first.attach(SharedConversionCache(path))
+    second.attach(SharedConversionCache(path))
+    first[('ft', 'm')] = (lambda x: x * 0.3048), ['ft', 'm']
+    first[('m', 's')] = None, None
+    first[('a', 'b')] = (lambda x: x ** 2), ['a', 'b']  # not affine, not shared
+    plan, conversion_path = second.get(('ft', 'm'))
+    assert type(plan) is ConversionPlan and isclose(plan(10), 3.048) and conversion_path == ['ft', 'm']
+    assert second.get(('m', 's')) == (None, None) and second.get(('a', 'b')) is None
+    stats = second.get_stats()
+    assert (stats['shared_hits'], stats['misses'], stats['positive'], stats['negative']) == (2, 1, 1, 1)
+    assert second.get(('ft', 'm'))[0] is plan  # now in the memory of the process
+    assert len(first.shared) == 3 - 1
+
+
+def test_shared_cache_from_processes(tmp_path):
+    from unyts.database import units_network, load_units
+    load_units()  # before forking, so the processes share the loaded units
+    path = str(tmp_path / 'shared.sqlite')
+    with get_context('fork' if os.name == 'posix' else 'spawn').Pool(2) as pool:
+        assert isclose(pool.apply(_solve, (path, 'ft/s', 'km/h')), 1.09728)
+    memory = ConversionMemory(limit=10)
+    memory.attach(SharedConversionCache(path, units_network))
+    conversion, conversion_path = memory.get(('ft/s', 'km/h'))
+    assert isclose(conversion(1), 1.09728) and memory.get_stats()['shared_hits'] == 1
+
+
+def test_shared_cache_version(tmp_path):
+    from unyts.network import UDigraph
+    path = str(tmp_path / 'shared.sqlite')
+    first, second, third = UDigraph(), UDigraph(), UDigraph()
+    first.add_custom('a', 'b', lambda x: x * 2)
+    first.add_custom('b', 'c', lambda x: x * 3)
+    second.add_custom('b', 'c', lambda x: x * 3)
+    second.add_custom('a', 'b', lambda x: x * 2)
+    third.add_custom('a', 'b', lambda x: x * 2.5)
+    third.add_custom('b', 'c', lambda x: x * 3)
+    versions = [SharedConversionCache(path, graph).network_version for graph in (first, second, third, UDigraph())]
+    assert versions[0] == versions[1] and len(set(versions)) == 3
+    second.reachability()  # the changes of the version of the network don't change the version of the cache
+    second.rebuild_index()
+    assert SharedConversionCache(path, second).network_version == versions[0]
@@ -128,3 +128,21 @@ assert units(1.0172, 'm').round(-1).value == 1
 assert units(1.0172, 'm').round(-3).value == 1.02
 
 assert units(1.01, 'm').equals(units(1.02, 'm'), 1) is True
+
+# the units factory makes the class of the kind of the units, without searching the dictionary
+from unyts.units.geometry import Length
+from unyts.units.custom import UserUnits
+assert type(units(3, 'ft')) is Length and units(3, 'ft').name == 'length'
+assert units(3, 'ft', 'depth').name == 'depth'
+assert type(units(50, '%')) is Percentage and units(50, '%').value == 0.5
+assert type(units(3, 'not_an_unyts_unit')) is UserUnits
+
+# the kinds of the ratios and products are parsed with the rules of the composite kinds, they are not listed
+from unyts.dictionaries import _load_units_kinds, _enumerate_kind
+from unyts.units.ratios import ProductivityIndex
+assert 'bbl/week/atm' not in dict.keys(_load_units_kinds()) and type(units(1, 'bbl/week/atm')) is ProductivityIndex
+assert _load_units_kinds().get('m/s/min') == _load_units_kinds().get('ft/s2') == 'Acceleration'
+assert _load_units_kinds().get('V*A') == _load_units_kinds().get('A*V') == 'Power'
+assert 'ft/not_an_unyts_unit' not in _load_units_kinds()
+assert len(_enumerate_kind('ProductivityIndex', 10)) == 10
+assert all(_load_units_kinds().get(u) == 'Acceleration' for u in _enumerate_kind('Acceleration', 50))